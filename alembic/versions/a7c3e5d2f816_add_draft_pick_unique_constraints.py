@@ -0,0 +1,31 @@
+"""Add unique constraints on draft_picks
+
+Revision ID: a7c3e5d2f816
+Revises: f2b9d6e1a475
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c3e5d2f816'
+down_revision: Union[str, None] = 'f2b9d6e1a475'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_unique_constraint(
+        'uq_draft_pick_player', 'draft_picks', ['league_id', 'player_id']
+    )
+    op.create_unique_constraint(
+        'uq_draft_pick_number', 'draft_picks', ['league_id', 'pick_number']
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_draft_pick_number', 'draft_picks', type_='unique')
+    op.drop_constraint('uq_draft_pick_player', 'draft_picks', type_='unique')
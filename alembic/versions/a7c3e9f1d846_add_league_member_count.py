@@ -0,0 +1,33 @@
+"""Add member_count to leagues
+
+Revision ID: a7c3e9f1d846
+Revises: f6b2d8e4a357
+Create Date: 2026-10-18 22:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c3e9f1d846'
+down_revision: Union[str, None] = 'f6b2d8e4a357'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'leagues',
+        sa.Column('member_count', sa.Integer(), server_default='0', nullable=False),
+    )
+    op.execute(
+        "UPDATE leagues SET member_count = ("
+        "SELECT COUNT(*) FROM league_memberships WHERE league_memberships.league_id = leagues.id)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('leagues', 'member_count')
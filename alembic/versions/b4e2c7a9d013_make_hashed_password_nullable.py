@@ -0,0 +1,32 @@
+"""Make users.hashed_password nullable for shadow users
+
+Revision ID: b4e2c7a9d013
+Revises: a3f1d2e4b567
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4e2c7a9d013'
+down_revision: Union[str, None] = 'a3f1d2e4b567'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column('users', 'hashed_password',
+               existing_type=sa.String(length=255),
+               nullable=True)
+
+
+def downgrade() -> None:
+    # Shadow users get an unusable placeholder so the column can be NOT NULL again
+    op.execute("UPDATE users SET hashed_password = '!' WHERE hashed_password IS NULL")
+    op.alter_column('users', 'hashed_password',
+               existing_type=sa.String(length=255),
+               nullable=False)
@@ -0,0 +1,68 @@
+"""Store only the first-round draft order, add draft_states.draft_type
+
+Revision ID: b8d4f2a6c913
+Revises: a7c3e5d2f816
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8d4f2a6c913'
+down_revision: Union[str, None] = 'a7c3e5d2f816'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'draft_states',
+        sa.Column('draft_type', sa.String(30), server_default='snake', nullable=False),
+    )
+
+    # Full snake lists -> round one (each agent's first appearance)
+    conn = op.get_bind()
+    rows = conn.execute(sa.text('SELECT id, draft_order FROM draft_states')).all()
+    for row_id, draft_order in rows:
+        first_round = list(dict.fromkeys(json.loads(draft_order)))
+        conn.execute(
+            sa.text('UPDATE draft_states SET draft_order = :order WHERE id = :id'),
+            {'order': json.dumps(first_round), 'id': row_id},
+        )
+
+
+def _is_reversed(round_num: int, draft_type: str) -> bool:
+    if draft_type == 'linear':
+        return False
+    if draft_type == 'third_round_reversal':
+        return round_num == 2 or (round_num >= 3 and round_num % 2 == 1)
+    return round_num % 2 == 0
+
+
+def downgrade() -> None:
+    # The full pick list is rebuilt for each row's draft type, so the order
+    # itself survives; the draft_type column (and its values) is dropped.
+    conn = op.get_bind()
+    rows = conn.execute(
+        sa.text('SELECT id, draft_order, total_picks, draft_type FROM draft_states')
+    ).all()
+    for row_id, draft_order, total_picks, draft_type in rows:
+        first_round = json.loads(draft_order)
+        full = []
+        round_num = 1
+        while len(full) < total_picks:
+            full.extend(
+                reversed(first_round) if _is_reversed(round_num, draft_type) else first_round
+            )
+            round_num += 1
+        conn.execute(
+            sa.text('UPDATE draft_states SET draft_order = :order WHERE id = :id'),
+            {'order': json.dumps(full[:total_picks]), 'id': row_id},
+        )
+
+    op.drop_column('draft_states', 'draft_type')
@@ -0,0 +1,44 @@
+"""Denormalize league_id onto team_players
+
+Revision ID: c3e7a9b5d248
+Revises: b8d4f2a6c913
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3e7a9b5d248'
+down_revision: Union[str, None] = 'b8d4f2a6c913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('team_players', sa.Column('league_id', sa.Uuid(), nullable=True))
+    op.execute(
+        """
+        UPDATE team_players SET league_id = (
+            SELECT league_memberships.league_id
+            FROM teams JOIN league_memberships ON league_memberships.id = teams.membership_id
+            WHERE teams.id = team_players.team_id
+        )
+        """
+    )
+    op.alter_column('team_players', 'league_id', nullable=False)
+    op.create_foreign_key(
+        'fk_team_players_league_id', 'team_players', 'leagues', ['league_id'], ['id']
+    )
+    op.create_unique_constraint(
+        'uq_league_player', 'team_players', ['league_id', 'player_id']
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_league_player', 'team_players', type_='unique')
+    op.drop_constraint('fk_team_players_league_id', 'team_players', type_='foreignkey')
+    op.drop_column('team_players', 'league_id')
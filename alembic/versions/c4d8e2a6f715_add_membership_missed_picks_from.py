@@ -0,0 +1,29 @@
+"""Add league_memberships.missed_picks_from
+
+Revision ID: c4d8e2a6f715
+Revises: e2c6a8f4b517
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4d8e2a6f715'
+down_revision: Union[str, None] = 'e2c6a8f4b517'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'league_memberships',
+        sa.Column('missed_picks_from', sa.Integer(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('league_memberships', 'missed_picks_from')
@@ -0,0 +1,29 @@
+"""Add leagues.pick_timeout_seconds
+
+Revision ID: d5f3a8b1c224
+Revises: b4e2c7a9d013
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5f3a8b1c224'
+down_revision: Union[str, None] = 'b4e2c7a9d013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'leagues',
+        sa.Column('pick_timeout_seconds', sa.Integer(), server_default='60', nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('leagues', 'pick_timeout_seconds')
@@ -0,0 +1,43 @@
+"""Add FAAB waiver columns
+
+Revision ID: d9f1b3c7e524
+Revises: c3e7a9b5d248
+Create Date: 2026-10-18 19:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9f1b3c7e524'
+down_revision: Union[str, None] = 'c3e7a9b5d248'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'leagues',
+        sa.Column('waiver_type', sa.String(10), server_default='rolling', nullable=False),
+    )
+    op.add_column(
+        'leagues',
+        sa.Column('faab_budget', sa.Integer(), server_default='100', nullable=False),
+    )
+    op.add_column(
+        'league_memberships',
+        sa.Column('faab_spent', sa.Integer(), server_default='0', nullable=False),
+    )
+    op.add_column('waiver_claims', sa.Column('bid_amount', sa.Integer(), nullable=True))
+    op.add_column('waiver_claims', sa.Column('claim_group', sa.String(40), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('waiver_claims', 'claim_group')
+    op.drop_column('waiver_claims', 'bid_amount')
+    op.drop_column('league_memberships', 'faab_spent')
+    op.drop_column('leagues', 'faab_budget')
+    op.drop_column('leagues', 'waiver_type')
@@ -0,0 +1,29 @@
+"""Add scores_version to scoring periods
+
+Revision ID: e2c6a8f4b517
+Revises: a7c3e9f1d846
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2c6a8f4b517'
+down_revision: Union[str, None] = 'a7c3e9f1d846'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'scoring_periods',
+        sa.Column('scores_version', sa.Integer(), server_default='0', nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('scoring_periods', 'scores_version')
@@ -0,0 +1,38 @@
+"""Add waiver_orders table
+
+Revision ID: e4a8c2d6f139
+Revises: d9f1b3c7e524
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4a8c2d6f139'
+down_revision: Union[str, None] = 'd9f1b3c7e524'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'waiver_orders',
+        sa.Column('id', sa.Uuid(), primary_key=True),
+        sa.Column('league_id', sa.Uuid(), sa.ForeignKey('leagues.id'), nullable=False, index=True),
+        sa.Column('agent_id', sa.Uuid(), sa.ForeignKey('agents.id'), nullable=False),
+        sa.Column('position', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.UniqueConstraint('league_id', 'agent_id', name='uq_waiver_order_agent'),
+    )
+    op.alter_column('waiver_claims', 'priority', existing_type=sa.Integer(), nullable=True)
+
+
+def downgrade() -> None:
+    op.execute('UPDATE waiver_claims SET priority = 0 WHERE priority IS NULL')
+    op.alter_column('waiver_claims', 'priority', existing_type=sa.Integer(), nullable=False)
+    op.drop_table('waiver_orders')
@@ -0,0 +1,35 @@
+"""Add draft_queues table
+
+Revision ID: e8a1c4f7b392
+Revises: d5f3a8b1c224
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8a1c4f7b392'
+down_revision: Union[str, None] = 'd5f3a8b1c224'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'draft_queues',
+        sa.Column('id', sa.Uuid(), primary_key=True),
+        sa.Column('league_id', sa.Uuid(), sa.ForeignKey('leagues.id'), nullable=False, index=True),
+        sa.Column('agent_id', sa.Uuid(), sa.ForeignKey('agents.id'), nullable=False),
+        sa.Column('player_ids', sa.JSON(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.UniqueConstraint('league_id', 'agent_id'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('draft_queues')
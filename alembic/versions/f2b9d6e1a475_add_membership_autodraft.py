@@ -0,0 +1,29 @@
+"""Add league_memberships.autodraft
+
+Revision ID: f2b9d6e1a475
+Revises: e8a1c4f7b392
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2b9d6e1a475'
+down_revision: Union[str, None] = 'e8a1c4f7b392'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'league_memberships',
+        sa.Column('autodraft', sa.Boolean(), server_default=sa.false(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('league_memberships', 'autodraft')
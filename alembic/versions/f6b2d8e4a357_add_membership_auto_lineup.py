@@ -0,0 +1,29 @@
+"""Add auto_lineup to league memberships
+
+Revision ID: f6b2d8e4a357
+Revises: e4a8c2d6f139
+Create Date: 2026-10-18 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6b2d8e4a357'
+down_revision: Union[str, None] = 'e4a8c2d6f139'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'league_memberships',
+        sa.Column('auto_lineup', sa.Boolean(), server_default=sa.false(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('league_memberships', 'auto_lineup')
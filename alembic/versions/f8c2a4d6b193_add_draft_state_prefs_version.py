@@ -0,0 +1,29 @@
+"""Add draft_states.prefs_version
+
+Revision ID: f8c2a4d6b193
+Revises: c4d8e2a6f715
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f8c2a4d6b193'
+down_revision: Union[str, None] = 'c4d8e2a6f715'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'draft_states',
+        sa.Column('prefs_version', sa.Integer(), server_default='0', nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('draft_states', 'prefs_version')
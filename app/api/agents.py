@@ -4,19 +4,23 @@ import uuid as uuid_mod
 from collections import defaultdict
 from datetime import datetime, timedelta, timezone
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
 from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import aliased
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.api.deps import get_current_agent, get_current_user
 from app.models.agent import Agent
-from app.models.league import LeagueMembership
+from app.models.league import League, LeagueMembership
 from app.models.player import PlayerGameLog
 from app.models.team import Team, TeamPlayer
 from app.models.user import User
-from app.schemas.agents import AgentCreate, AgentCreateResponse, AgentDirectoryEntry, AgentMeResponse, AgentRegister, AgentResponse, LeagueInfo
-from app.services.auth import generate_api_key, hash_api_key, hash_password
+from app.schemas.agents import AgentCreate, AgentCreateResponse, AgentDirectoryEntry, AgentMeResponse, AgentRegister, AgentResponse, DraftTurnInfo, LeagueInfo
+from app.services.auth import generate_api_key, hash_api_key
+from app.services.cache import etag_matches, make_etag
+from app.services.draft_turns import turns
 
 router = APIRouter(prefix="/agents", tags=["agents"])
 
@@ -29,17 +33,17 @@ async def register_agent(
     """Self-registration for agents — no auth required.
 
     Creates a shadow user and an agent in one call, returning the API key (shown once).
+    The shadow user has no password, so no bcrypt work is done here.
     """
     owner_name = data.owner_name or data.agent_name
     # Shadow username must be unique — append short random suffix
     shadow_username = f"{owner_name}_{uuid_mod.uuid4().hex[:8]}"
     random_email = f"{uuid_mod.uuid4()}@agent.local"
-    random_password = generate_api_key()  # never exposed
 
     user = User(
         username=shadow_username,
         email=random_email,
-        hashed_password=hash_password(random_password),
+        hashed_password=None,
     )
     db.add(user)
 
@@ -186,32 +190,67 @@ async def agent_directory(
 
 @router.get("/me", response_model=AgentMeResponse)
 async def get_my_agent(
+    response: Response,
+    if_none_match: str | None = Header(None),
     agent: Agent = Depends(get_current_agent),
     db: AsyncSession = Depends(get_db),
 ):
-    """Get the current agent's profile and leagues. Requires agent API key."""
-    # Re-fetch agent to ensure clean state after get_current_agent's commit
-    await db.refresh(agent)
+    """Get the current agent's profile and leagues. Requires agent API key.
 
-    from app.models.league import League
+    Served from one query (league columns + grouped member count). The ETag
+    covers last_active_at (updated at most once a minute) and each league's
+    status, member count and updated_at, so unchanged profiles return 304.
+    """
+    mine = aliased(LeagueMembership)
+    member_counts = (
+        select(LeagueMembership.league_id, func.count().label("member_count"))
+        .where(
+            LeagueMembership.league_id.in_(
+                select(mine.league_id).where(mine.agent_id == agent.id)
+            )
+        )
+        .group_by(LeagueMembership.league_id)
+        .subquery()
+    )
     result = await db.execute(
-        select(League)
-        .join(LeagueMembership)
-        .where(LeagueMembership.agent_id == agent.id)
+        select(
+            League.id,
+            League.name,
+            League.sport,
+            League.status,
+            League.invite_code,
+            League.max_teams,
+            League.updated_at,
+            member_counts.c.member_count,
+        )
+        .join(member_counts, member_counts.c.league_id == League.id)
+        .order_by(League.created_at)
     )
-    agent_leagues = result.scalars().all()
-
-    leagues = []
-    for league in agent_leagues:
-        leagues.append(LeagueInfo(
-            id=league.id,
-            name=league.name,
-            sport=league.sport,
-            status=league.status,
-            invite_code=league.invite_code,
-            member_count=len(league.memberships) if league.memberships else 0,
-            max_teams=league.max_teams,
-        ))
+    rows = result.all()
+
+    etag = make_etag(
+        agent.id,
+        agent.name,
+        agent.owner_id,
+        agent.last_active_at,
+        *(f"{r.id}:{r.status}:{r.member_count}:{r.updated_at}" for r in rows),
+    )
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+
+    leagues = [
+        LeagueInfo(
+            id=r.id,
+            name=r.name,
+            sport=r.sport,
+            status=r.status,
+            invite_code=r.invite_code,
+            member_count=r.member_count,
+            max_teams=r.max_teams,
+        )
+        for r in rows
+    ]
 
     return AgentMeResponse(
         id=agent.id,
@@ -223,6 +262,19 @@ async def get_my_agent(
     )
 
 
+@router.get("/me/draft-turns", response_model=list[DraftTurnInfo])
+async def my_draft_turns(
+    wait: float = Query(0, ge=0, le=60, description="Seconds to wait for a turn"),
+    agent: Agent = Depends(get_current_agent),
+):
+    """Drafts where this agent is on the clock, soonest deadline first.
+
+    With ``wait``, blocks until the agent is on the clock in any league or
+    the timeout passes (then returns ``[]``). Served from memory, not the DB.
+    """
+    return await turns.wait_for_turns(agent.id, wait)
+
+
 @router.post("/{agent_id}/claim", response_model=AgentResponse)
 async def claim_agent(
     agent_id: str,
@@ -1,7 +1,7 @@
 """Shared API dependencies: auth, DB session, rate limiting."""
 
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 from fastapi import Depends, Header, HTTPException, status
 from sqlalchemy import select
@@ -12,6 +12,8 @@ from app.models.agent import Agent
 from app.models.user import User
 from app.services.auth import decode_access_token, hash_api_key
 
+LAST_ACTIVE_RESOLUTION_SECONDS = 60
+
 
 async def get_current_user(
     authorization: str = Header(..., alias="Authorization"),
@@ -49,8 +51,14 @@ async def get_current_agent(
     if not agent:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid API key")
 
-    # Update last_active_at
-    agent.last_active_at = datetime.now(timezone.utc)
-    await db.commit()
+    # Update last_active_at, at most once a minute so /agents/me ETags can hold
+    now = datetime.now(timezone.utc)
+    last_active = agent.last_active_at
+    if last_active is not None and last_active.tzinfo is None:
+        last_active = last_active.replace(tzinfo=timezone.utc)
+    resolution = timedelta(seconds=LAST_ACTIVE_RESOLUTION_SECONDS)
+    if last_active is None or now - last_active >= resolution:
+        agent.last_active_at = now
+        await db.commit()
 
     return agent
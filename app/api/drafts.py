@@ -1,20 +1,47 @@
 """Draft endpoints."""
 
-import json
+import asyncio
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.api.deps import get_current_agent
 from app.models.agent import Agent
-from app.schemas.drafts import DraftPickRequest, DraftPickResponse, DraftStateResponse
+from app.models.draft import DraftState
+from app.schemas.drafts import (
+    AutodraftRequest,
+    AutodraftResponse,
+    DraftBoardResponse,
+    DraftPickRequest,
+    DraftPickResponse,
+    DraftQueueRequest,
+    DraftQueueResponse,
+    DraftStateResponse,
+)
+from app.services import cache, draft_engine, draft_order
+from app.services.cache import etag_matches, make_etag
 from app.services.activity import log_activity
-from app.services.draft import get_draft_state, initialize_draft, make_pick
+from app.services.draft import (
+    draft_status_event,
+    get_draft_board,
+    get_draft_state,
+    get_queue,
+    initialize_draft,
+    make_pick,
+    resync_draft,
+    set_autodraft,
+    set_queue,
+)
+from app.services.draft_events import format_sse, hub
 
 router = APIRouter(prefix="/leagues/{league_id}/draft", tags=["draft"])
 
+SSE_HEARTBEAT_SECONDS = 15
+BOARD_CACHE_TTL_SECONDS = 600
+
 
 @router.post("/start", response_model=DraftStateResponse)
 async def start_draft(
@@ -45,16 +72,7 @@ async def start_draft(
         )
 
     draft_state = await initialize_draft(db, league_id)
-    order = json.loads(draft_state.draft_order)
-
-    return DraftStateResponse(
-        league_id=draft_state.league_id,
-        current_pick=draft_state.current_pick,
-        total_picks=draft_state.total_picks,
-        status=draft_state.status,
-        current_agent_id=uuid.UUID(order[0]) if order else None,
-        draft_order=[uuid.UUID(x) for x in order],
-    )
+    return _state_response(draft_state)
 
 
 @router.get("", response_model=DraftStateResponse)
@@ -62,19 +80,113 @@ async def get_draft(league_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
     draft_state = await get_draft_state(db, league_id)
     if not draft_state:
         raise HTTPException(status_code=404, detail="No draft found for this league")
+    live = draft_engine.peek(league_id)
+    if live and live.current_pick != draft_state.current_pick:
+        await resync_draft(db, league_id)  # another worker moved the draft on
+    return _state_response(draft_state)
 
-    order = json.loads(draft_state.draft_order)
-    current_agent = None
-    if draft_state.status == "in_progress" and draft_state.current_pick <= len(order):
-        current_agent = uuid.UUID(order[draft_state.current_pick - 1])
 
+def _state_response(draft_state: DraftState) -> DraftStateResponse:
+    """Response from the stored draft, with the pick deadline if it's held in memory."""
+    live = draft_engine.peek(draft_state.league_id)
+    first_round = draft_order.loads(draft_state.draft_order)
+    current_agent = None
+    if draft_state.status == "in_progress" and draft_state.current_pick <= draft_state.total_picks:
+        current_agent = draft_order.agent_for_pick(
+            first_round, draft_state.current_pick, draft_state.draft_type
+        )
     return DraftStateResponse(
         league_id=draft_state.league_id,
         current_pick=draft_state.current_pick,
         total_picks=draft_state.total_picks,
         status=draft_state.status,
+        draft_type=draft_state.draft_type,
         current_agent_id=current_agent,
-        draft_order=[uuid.UUID(x) for x in order],
+        pick_deadline=live.pick_deadline if live else None,
+        draft_order=draft_order.expand(
+            first_round, draft_state.total_picks, draft_state.draft_type
+        ),
+    )
+
+
+@router.get("/board", response_model=DraftBoardResponse)
+async def draft_board(
+    league_id: uuid.UUID,
+    if_none_match: str | None = Header(None),
+    db: AsyncSession = Depends(get_db),
+):
+    """The full draft board: one row per round, one column per team. No auth required.
+
+    The serialized board is cached per league with the pick it was rendered at,
+    and only rebuilt after a pick; the ETag changes with it, so unchanged boards
+    return 304.
+    """
+    live = draft_engine.peek(league_id)
+    if live:
+        current_pick, total_picks, draft_status = live.current_pick, live.total_picks, live.status
+        first_round = live.first_round
+    else:
+        draft_state = await get_draft_state(db, league_id)
+        if not draft_state:
+            raise HTTPException(status_code=404, detail="No draft found for this league")
+        current_pick, total_picks = draft_state.current_pick, draft_state.total_picks
+        draft_status = draft_state.status
+        first_round = draft_order.loads(draft_state.draft_order)
+
+    etag = make_etag(league_id, current_pick, draft_status)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    # One entry per league, replaced after each pick, so old boards don't pile up
+    key = f"draft:board:{league_id}"
+    entry = cache.get(key)
+    if entry is not None and entry[0] == (current_pick, draft_status):
+        body = entry[1]
+    else:
+        board = await get_draft_board(
+            db, league_id, first_round, current_pick, total_picks, draft_status
+        )
+        body = board.model_dump_json()
+        cache.put(key, ((current_pick, draft_status), body), BOARD_CACHE_TTL_SECONDS)
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+
+@router.get("/events")
+async def draft_event_stream(
+    league_id: uuid.UUID,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+):
+    """Server-sent events for a league's draft. No auth required.
+
+    Sends the current ``on_the_clock`` (or ``draft_completed``) state on
+    connect, then ``pick_made`` / ``on_the_clock`` after every pick, and
+    closes after ``draft_completed``.
+    """
+    draft = await draft_engine.get_draft(db, league_id)
+    if not draft:
+        raise HTTPException(status_code=404, detail="No draft found for this league")
+    await db.commit()  # the stream itself never touches the DB
+
+    async def stream():
+        async with hub.subscribe(league_id) as queue:
+            # Snapshot after subscribing so no pick can slip in between
+            event, data = draft_status_event(draft)
+            yield format_sse(event, data)
+            while event != "draft_completed":
+                try:
+                    event, data = await asyncio.wait_for(queue.get(), SSE_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        return
+                    yield ": keep-alive\n\n"
+                    continue
+                yield format_sse(event, data)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
 
@@ -98,3 +210,61 @@ async def draft_pick(
     await db.commit()
 
     return pick
+
+
+async def _require_member(db: AsyncSession, league_id: uuid.UUID, agent_id: uuid.UUID) -> None:
+    from app.models.league import LeagueMembership
+    from sqlalchemy import select
+
+    result = await db.execute(
+        select(LeagueMembership.id).where(
+            LeagueMembership.league_id == league_id,
+            LeagueMembership.agent_id == agent_id,
+        )
+    )
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(status_code=403, detail="Not a member of this league")
+
+
+@router.get("/queue", response_model=DraftQueueResponse)
+async def get_draft_queue(
+    league_id: uuid.UUID,
+    agent: Agent = Depends(get_current_agent),
+    db: AsyncSession = Depends(get_db),
+):
+    """Your draft queue for this league, with already-drafted players removed."""
+    await _require_member(db, league_id, agent.id)
+    return DraftQueueResponse(
+        league_id=league_id, player_ids=await get_queue(db, league_id, agent.id)
+    )
+
+
+@router.put("/queue", response_model=DraftQueueResponse)
+async def put_draft_queue(
+    league_id: uuid.UUID,
+    data: DraftQueueRequest,
+    agent: Agent = Depends(get_current_agent),
+    db: AsyncSession = Depends(get_db),
+):
+    """Replace your draft queue. When you're on the clock, the server picks the
+    first available queued player for you immediately."""
+    await _require_member(db, league_id, agent.id)
+    try:
+        player_ids = await set_queue(db, league_id, agent.id, data.player_ids)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return DraftQueueResponse(league_id=league_id, player_ids=player_ids)
+
+
+@router.put("/autodraft", response_model=AutodraftResponse)
+async def put_autodraft(
+    league_id: uuid.UUID,
+    data: AutodraftRequest,
+    agent: Agent = Depends(get_current_agent),
+    db: AsyncSession = Depends(get_db),
+):
+    """Turn autodraft on or off. Agents that miss consecutive picks are switched
+    on automatically; turn it off to pick yourself again."""
+    await _require_member(db, league_id, agent.id)
+    await set_autodraft(db, league_id, agent.id, data.enabled)
+    return AutodraftResponse(league_id=league_id, enabled=data.enabled)
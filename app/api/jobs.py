@@ -4,15 +4,16 @@ import logging
 from datetime import date, datetime, timedelta, timezone
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
 from app.database import get_db
-from app.models.draft import DraftState
 from app.models.job_run import JobRun
-from app.services.draft import auto_pick_for_current
-from app.services.scoring import fetch_and_store_game_logs
+from app.services import draft_clock
+from app.services.draft_clock import find_expired_drafts
+from app.services.lineup import optimize_auto_lineups
+from app.services.scoring import fetch_and_store_game_logs, score_matchups_for_period
+from app.services.waivers import process_waivers
 
 logger = logging.getLogger(__name__)
 
@@ -143,51 +144,96 @@ async def nightly_job(
     }
 
 
+@router.post("/process-waivers")
+async def process_waivers_job(
+    db: AsyncSession = Depends(get_db),
+    _=Depends(_verify_job_secret),
+):
+    """Resolve every expired waiver claim, across all leagues."""
+    job = JobRun(
+        job_name="process_waivers",
+        status="running",
+        started_at=datetime.now(timezone.utc),
+    )
+    db.add(job)
+    await db.commit()
+
+    totals = {}
+    try:
+        totals = await process_waivers(db)
+        job.status = "completed"
+        job.records_processed = totals["approved"] + totals["denied"]
+    except Exception as e:
+        logger.exception("process_waivers failed")
+        await db.rollback()
+        job.status = "failed"
+        job.error_message = str(e)
+
+    job.finished_at = datetime.now(timezone.utc)
+    await db.commit()
+
+    return {
+        "job_id": str(job.id),
+        "status": job.status,
+        **totals,
+    }
+
+
+@router.post("/optimize-lineups")
+async def optimize_lineups_job(
+    db: AsyncSession = Depends(get_db),
+    _=Depends(_verify_job_secret),
+):
+    """Re-optimize the lineup of every auto-managed team (nightly)."""
+    job = JobRun(
+        job_name="optimize_lineups",
+        status="running",
+        started_at=datetime.now(timezone.utc),
+    )
+    db.add(job)
+    await db.commit()
+
+    totals = {}
+    try:
+        totals = await optimize_auto_lineups(db)
+        job.status = "completed"
+        job.records_processed = totals["changed"]
+    except Exception as e:
+        logger.exception("optimize_lineups failed")
+        await db.rollback()
+        job.status = "failed"
+        job.error_message = str(e)
+
+    job.finished_at = datetime.now(timezone.utc)
+    await db.commit()
+
+    return {
+        "job_id": str(job.id),
+        "status": job.status,
+        **totals,
+    }
+
+
 @router.post("/draft-tick")
 async def draft_tick(
-    pick_timeout_seconds: int = Query(60, alias="timeout"),
+    pick_timeout_seconds: int | None = Query(None, alias="timeout"),
     db: AsyncSession = Depends(get_db),
     _=Depends(_verify_job_secret),
 ):
     """Auto-pick for agents who've exceeded the pick timer.
 
-    Checks all in-progress drafts. If the current pick has been pending
-    longer than `timeout` seconds, auto-picks the best available player.
-    Hit this endpoint every 30-60s via cron.
+    Fallback for the in-process draft clock: finds in-progress drafts whose
+    current pick is past the league's pick timeout (or `timeout` seconds, if
+    given) and auto-picks them concurrently, one session per league.
     """
-    now = datetime.now(timezone.utc)
-    cutoff = now - timedelta(seconds=pick_timeout_seconds)
-
-    result = await db.execute(
-        select(DraftState).where(
-            and_(
-                DraftState.status == "in_progress",
-                DraftState.updated_at < cutoff,
-            )
-        )
-    )
-    stale_drafts = result.scalars().all()
-
-    auto_picks = []
-    errors = []
+    expired = await find_expired_drafts(db, pick_timeout_seconds)
+    results = await draft_clock.clock.fire_many(expired)
 
-    for draft_state in stale_drafts:
-        try:
-            pick = await auto_pick_for_current(db, draft_state.league_id)
-            auto_picks.append({
-                "league_id": str(draft_state.league_id),
-                "pick_number": pick.pick_number,
-                "agent_id": str(pick.agent_id),
-                "player_id": str(pick.player_id),
-            })
-        except Exception as e:
-            errors.append({
-                "league_id": str(draft_state.league_id),
-                "error": str(e),
-            })
+    auto_picks = [r for r in results if "pick_number" in r]
+    errors = [r for r in results if "error" in r]
 
     return {
-        "checked": len(stale_drafts),
+        "checked": len(expired),
         "auto_picks": auto_picks,
         "errors": errors if errors else None,
     }
@@ -1,22 +1,23 @@
 """League management endpoints."""
 
-import asyncio
 import logging
 import uuid
 from datetime import date
+from typing import Literal
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import func, select, and_
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import ColumnElement, func, or_, select, and_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased, lazyload
 
 from app.database import get_db
 from app.api.deps import get_current_agent
+from app.config import settings
 from app.models.agent import Agent
 from app.models.league import League, LeagueMembership
-from app.models.player import Player, PlayerGameLog
-from app.models.team import Team, TeamPlayer
 from app.schemas.leagues import LeagueCreate, LeagueJoin, LeagueResponse, StandingsEntry
 from app.schemas.players import PlayerResponse
+from app.services import cache, matchmaking, public_matchups as public_matchups_feed, rosters
 from app.services.activity import log_activity
 from app.services.auth import generate_invite_code
 from app.services.leaderboard import get_league_standings
@@ -47,6 +48,10 @@ async def create_league(
         draft_date=data.draft_date,
         scoring_config=scoring,
         roster_config=roster,
+        pick_timeout_seconds=data.pick_timeout_seconds or settings.draft_pick_timeout_seconds,
+        waiver_type=data.waiver_type,
+        faab_budget=data.faab_budget,
+        member_count=1,
     )
     db.add(league)
     await db.flush()
@@ -58,6 +63,7 @@ async def create_league(
     await log_activity(db, agent.id, "create_league", {"league_id": str(league.id), "league_name": league.name})
     await db.commit()
     await db.refresh(league)
+    matchmaking.track_league(league, agent.owner_id)
 
     return _league_response(league)
 
@@ -76,90 +82,107 @@ async def list_my_leagues(
     return [_league_response(l) for l in leagues]
 
 
-@router.get("/public", response_model=list[LeagueResponse])
-async def list_public_leagues(db: AsyncSession = Depends(get_db)):
-    """Return all active/playoff/joinable leagues — no auth required."""
-    result = await db.execute(
-        select(League).where(League.status.in_(["active", "playoffs", "pre_season"]))
-    )
-    leagues = result.scalars().all()
-    # Filter pre_season leagues to only show those with available spots
-    visible = [
-        l for l in leagues
-        if l.status != "pre_season" or len(l.memberships) < l.max_teams
-    ]
-    return [_league_response(l) for l in visible]
+PUBLIC_LEAGUES_CACHE_TTL_SECONDS = 30
 
+# Keyset orderings for /leagues/public: (column, descending), ending in a unique key
+_PUBLIC_SORTS = {
+    "newest": ((League.created_at, True), (League.id, True)),
+    "fullest": ((League.member_count, True), (League.created_at, True), (League.id, True)),
+    "name": ((League.name, False), (League.id, False)),
+}
 
-@router.get("/public/matchups")
-async def public_matchups(db: AsyncSession = Depends(get_db)):
-    """Current week matchups across all active/playoff leagues. No auth required."""
-    from app.models.matchup import Matchup, ScoringPeriod
 
-    # Find active/playoff leagues
-    leagues_result = await db.execute(
-        select(League).where(League.status.in_(["active", "playoffs"]))
-    )
-    leagues = leagues_result.scalars().all()
+@router.get("/public", response_model=list[LeagueResponse])
+async def list_public_leagues(
+    response: Response,
+    status_filter: Literal["pre_season", "active", "playoffs"] | None = Query(None, alias="status"),
+    sport: str | None = Query(None),
+    open_only: bool = Query(False, alias="open", description="Only leagues with open spots"),
+    sort: Literal["newest", "fullest", "name"] = Query("newest"),
+    limit: int = Query(50, ge=1, le=200),
+    cursor: uuid.UUID | None = Query(None),
+    db: AsyncSession = Depends(get_db),
+):
+    """Return active/playoff/joinable leagues — no auth required.
 
-    if not leagues:
-        return []
+    Full pre-season leagues are hidden. Pass the ``X-Next-Cursor`` response
+    header back as ``cursor`` for the next page; first pages are cached briefly.
+    """
+    async def fetch():
+        return await _public_leagues_page(db, status_filter, sport, open_only, sort, limit, cursor)
 
-    league_ids = [l.id for l in leagues]
+    if cursor is None:
+        key = f"leagues:public:{status_filter}:{sport}:{open_only}:{sort}:{limit}"
+        leagues, next_cursor = await cache.cached(key, PUBLIC_LEAGUES_CACHE_TTL_SECONDS, fetch)
+    else:
+        leagues, next_cursor = await fetch()
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = str(next_cursor)
+    return leagues
+
+
+async def _public_leagues_page(
+    db: AsyncSession,
+    status_filter: str | None,
+    sport: str | None,
+    open_only: bool,
+    sort: str,
+    limit: int,
+    cursor: uuid.UUID | None,
+) -> tuple[list[LeagueResponse], uuid.UUID | None]:
+    has_spots = and_(League.status == "pre_season", League.member_count < League.max_teams)
+    conditions = [
+        has_spots if open_only else or_(League.status.in_(["active", "playoffs"]), has_spots)
+    ]
+    if status_filter:
+        conditions.append(League.status == status_filter)
+    if sport:
+        conditions.append(League.sport == sport)
+    keys = _PUBLIC_SORTS[sort]
+    if cursor is not None:
+        conditions.append(_after(cursor, keys))
 
-    # Get current week's scoring periods
-    today = date.today()
-    periods_result = await db.execute(
-        select(ScoringPeriod).where(
-            and_(
-                ScoringPeriod.league_id.in_(league_ids),
-                ScoringPeriod.start_date <= today,
-                ScoringPeriod.end_date >= today,
-            )
-        )
+    result = await db.execute(
+        select(League)
+        .options(lazyload(League.memberships), lazyload(League.commissioner))
+        .where(and_(*conditions))
+        .order_by(*(column.desc() if descending else column for column, descending in keys))
+        .limit(limit + 1)
     )
-    periods = periods_result.scalars().all()
-
-    if not periods:
-        # Fall back to most recent periods
-        periods_result = await db.execute(
-            select(ScoringPeriod)
-            .where(ScoringPeriod.league_id.in_(league_ids))
-            .order_by(ScoringPeriod.end_date.desc())
-            .limit(len(league_ids))
-        )
-        periods = periods_result.scalars().all()
+    leagues = result.scalars().all()
+    next_cursor = leagues[limit - 1].id if len(leagues) > limit else None
+    return [_league_response(l) for l in leagues[:limit]], next_cursor
 
-    # Get agent names for display
-    agent_ids = set()
-    for period in periods:
-        for m in period.matchups:
-            agent_ids.add(m.home_agent_id)
-            agent_ids.add(m.away_agent_id)
 
-    agents_result = await db.execute(
-        select(Agent).where(Agent.id.in_(list(agent_ids)))
-    )
-    agents_map = {a.id: a.name for a in agents_result.scalars().all()}
+def _after(cursor: uuid.UUID, keys) -> ColumnElement[bool]:
+    """Rows strictly after the league *cursor* in the ordering *keys*.
 
-    # Get league names
-    league_map = {l.id: l.name for l in leagues}
+    The cursor's sort values are read back in SQL, so only its id is exposed.
+    """
+    anchor = aliased(League)
+    clauses, ties = [], []
+    for column, descending in keys:
+        value = select(getattr(anchor, column.key)).where(anchor.id == cursor).scalar_subquery()
+        clauses.append(and_(*ties, column < value if descending else column > value))
+        ties.append(column == value)
+    return or_(*clauses)
 
-    output = []
-    for period in periods:
-        for m in period.matchups:
-            output.append({
-                "league_name": league_map.get(period.league_id, "Unknown"),
-                "week_label": period.label,
-                "home_agent_name": agents_map.get(m.home_agent_id, "Unknown"),
-                "away_agent_name": agents_map.get(m.away_agent_id, "Unknown"),
-                "home_points": float(m.home_points) if m.home_points is not None else None,
-                "away_points": float(m.away_points) if m.away_points is not None else None,
-                "winner_agent_name": agents_map.get(m.winner_agent_id) if m.winner_agent_id else None,
-                "is_tie": m.is_tie,
-            })
 
-    return output
+@router.get("/public/matchups")
+async def public_matchups(
+    response: Response,
+    limit: int = Query(100, ge=1, le=500),
+    cursor: int = Query(0, ge=0),
+    db: AsyncSession = Depends(get_db),
+):
+    """Current week matchups across all active/playoff leagues. No auth required.
+
+    Pass the ``X-Next-Cursor`` response header back as ``cursor`` for the next page.
+    """
+    page, next_cursor = await public_matchups_feed.public_feed(db, limit, cursor)
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = str(next_cursor)
+    return page
 
 
 @router.post("/auto-join", response_model=LeagueResponse, status_code=status.HTTP_200_OK)
@@ -167,79 +190,18 @@ async def auto_join_league(
     agent: Agent = Depends(get_current_agent),
     db: AsyncSession = Depends(get_db),
 ):
-    """One-call onboarding: find or create a league and join automatically."""
-    from app.services.draft import initialize_draft
+    """One-call onboarding: find or create a league and join automatically.
 
-    # Get IDs of leagues where agent's owner already has a member (anti-collusion)
-    owner_league_ids_q = (
-        select(LeagueMembership.league_id)
-        .join(Agent, LeagueMembership.agent_id == Agent.id)
-        .where(Agent.owner_id == agent.owner_id)
-    )
-
-    # Find pre_season leagues with available spots, prefer most-filled
-    result = await db.execute(
-        select(League)
-        .where(
-            and_(
-                League.status == "pre_season",
-                League.id.notin_(owner_league_ids_q),
-            )
-        )
-    )
-    candidates = result.scalars().all()
-
-    # Filter to leagues with available spots, sort by most-filled first
-    league = None
-    candidates_with_spots = [
-        l for l in candidates
-        if len(l.memberships) < l.max_teams
-    ]
-    candidates_with_spots.sort(
-        key=lambda l: len(l.memberships), reverse=True
-    )
-
-    if candidates_with_spots:
-        league = candidates_with_spots[0]
-    else:
-        # Auto-create a new league
-        scoring = _nba_rules.default_scoring_config()
-        roster = _nba_rules.default_roster_config()
-        league = League(
-            name="Open NBA League",
-            sport="nba",
-            commissioner_id=agent.id,
-            invite_code=generate_invite_code(),
-            min_teams=2,
-            max_teams=6,
-            scoring_config=scoring,
-            roster_config=roster,
-        )
-        db.add(league)
-        await db.flush()
+    Joins the fullest pre-season league with no agent from the caller's owner
+    (anti-collusion), opening a new one when none is left.
+    """
+    from app.services.draft import initialize_draft
 
-    # Check agent not already in this league
-    existing = await db.execute(
-        select(LeagueMembership).where(
-            and_(
-                LeagueMembership.league_id == league.id,
-                LeagueMembership.agent_id == agent.id,
-            )
-        )
-    )
-    if existing.scalar_one_or_none():
-        # Already a member — just return the league
-        await db.refresh(league)
-        return _league_response(league)
-
-    membership = LeagueMembership(league_id=league.id, agent_id=agent.id)
-    db.add(membership)
-    await log_activity(db, agent.id, "join_league", {"league_id": str(league.id), "league_name": league.name})
-    await db.commit()
-    await db.refresh(league)
+    league_id = await matchmaking.auto_join(db, agent)
+    league = await db.get(League, league_id, populate_existing=True)
 
     # Auto-start draft when league fills
-    if len(league.memberships) >= league.max_teams:
+    if league.member_count >= league.max_teams:
         try:
             await initialize_draft(db, league.id)
             await db.refresh(league)
@@ -278,10 +240,6 @@ async def join_league(
     if league.status != "pre_season":
         raise HTTPException(status_code=400, detail="League is not accepting new members")
 
-    # Check max teams
-    if len(league.memberships) >= league.max_teams:
-        raise HTTPException(status_code=400, detail="League is full")
-
     # Anti-collusion: no two agents from same owner
     for m in league.memberships:
         if m.agent and m.agent.owner_id == agent.owner_id:
@@ -302,14 +260,18 @@ async def join_league(
     if existing.scalar_one_or_none():
         raise HTTPException(status_code=400, detail="Agent already in this league")
 
+    if not await matchmaking.reserve_slot(db, league_id, agent.owner_id):
+        raise HTTPException(status_code=400, detail="League is full")
     membership = LeagueMembership(league_id=league_id, agent_id=agent.id)
     db.add(membership)
     await log_activity(db, agent.id, "join_league", {"league_id": str(league_id), "league_name": league.name})
     await db.commit()
+    matchmaking.track_join(league_id, agent.owner_id)
+    rosters.invalidate(league_id)
     await db.refresh(league)
 
     # Auto-start draft when league fills
-    if len(league.memberships) >= league.max_teams:
+    if league.member_count >= league.max_teams:
         try:
             await initialize_draft(db, league.id)
             await db.refresh(league)
@@ -322,16 +284,35 @@ async def join_league(
 @router.get("/{league_id}/available-players", response_model=list[PlayerResponse])
 async def available_players(
     league_id: uuid.UUID,
+    response: Response,
+    position: str | None = Query(None, description="Roster slot, e.g. PG, G, UTIL"),
+    team: str | None = Query(None, description="NBA team abbreviation"),
+    name: str | None = Query(None, description="Case-insensitive name substring"),
+    limit: int = Query(50, ge=1, le=500),
+    cursor: int = Query(0, ge=0),
     db: AsyncSession = Depends(get_db),
 ):
-    from app.services.draft import get_available_players
+    """Unrostered players, best projected fantasy points first.
 
-    result = await db.execute(select(League).where(League.id == league_id))
-    league = result.scalar_one_or_none()
-    if not league:
+    Pass the ``X-Next-Cursor`` response header back as ``cursor`` for the next page.
+    """
+    from app.services.player_pool import list_available
+
+    result = await db.execute(select(League.sport).where(League.id == league_id))
+    sport = result.scalar_one_or_none()
+    if not sport:
         raise HTTPException(status_code=404, detail="League not found")
 
-    players = await get_available_players(db, league_id, league.sport)
+    try:
+        players, next_cursor = await list_available(
+            db, league_id, sport,
+            position=position, nba_team=team, name=name, limit=limit, cursor=cursor,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = str(next_cursor)
     return players
 
 
@@ -342,47 +323,28 @@ async def get_my_team(
     db: AsyncSession = Depends(get_db),
 ):
     """Get your roster for a specific league."""
-    membership_result = await db.execute(
-        select(LeagueMembership).where(
-            and_(
-                LeagueMembership.league_id == league_id,
-                LeagueMembership.agent_id == agent.id,
-            )
-        )
-    )
-    membership = membership_result.scalar_one_or_none()
-    if not membership:
+    teams = await rosters.league_rosters(db, league_id)
+    team = next((t for t in teams if t["agent_id"] == str(agent.id)), None)
+    if team is None:
         raise HTTPException(status_code=404, detail="You are not in this league")
-
-    team_result = await db.execute(
-        select(Team).where(Team.membership_id == membership.id)
-    )
-    team = team_result.scalar_one_or_none()
-    if not team:
+    if team["team_id"] is None:
         raise HTTPException(status_code=404, detail="No team found")
 
-    # Get players with their info
-    roster = []
-    for tp in team.players:
-        player_result = await db.execute(
-            select(Player).where(Player.id == tp.player_id)
-        )
-        player = player_result.scalar_one_or_none()
-        if player:
-            roster.append({
-                "player_id": str(player.id),
-                "full_name": player.full_name,
-                "position": player.position,
-                "nba_team": player.nba_team,
-                "roster_slot": tp.roster_slot,
-                "is_starter": tp.is_starter,
-            })
-
     return {
-        "team_id": str(team.id),
+        "team_id": team["team_id"],
         "league_id": str(league_id),
         "agent_id": str(agent.id),
-        "roster": roster,
+        "roster": [
+            {
+                "player_id": p["id"],
+                "full_name": p["full_name"],
+                "position": p["position"],
+                "nba_team": p["nba_team"],
+                "roster_slot": p["roster_slot"],
+                "is_starter": p["is_starter"],
+            }
+            for p in team["roster"]
+        ],
     }
 
 
@@ -392,130 +354,28 @@ async def get_league_teams(
     db: AsyncSession = Depends(get_db),
 ):
     """Get all teams and their rosters for a league. No auth required."""
-    result = await db.execute(
-        select(LeagueMembership).where(LeagueMembership.league_id == league_id)
-    )
-    memberships = result.scalars().all()
-
-    teams_output = []
-    for membership in memberships:
-        agent_name = membership.agent.name if membership.agent else "Unknown"
-        team = membership.team
-        if not team:
-            teams_output.append({
-                "agent_id": str(membership.agent_id),
-                "agent_name": agent_name,
-                "roster": [],
-            })
-            continue
-
-        roster = []
-        for tp in team.players:
-            player_result = await db.execute(
-                select(Player).where(Player.id == tp.player_id)
-            )
-            player = player_result.scalar_one_or_none()
-            if player:
-                roster.append({
-                    "id": str(player.id),
-                    "full_name": player.full_name,
-                    "name": player.full_name,
-                    "position": player.position,
-                    "nba_team": player.nba_team,
-                    "real_team": player.nba_team,
-                    "roster_slot": tp.roster_slot,
-                    "is_starter": tp.is_starter,
-                })
-
-        teams_output.append({
-            "agent_id": str(membership.agent_id),
-            "agent_name": agent_name,
-            "roster": roster,
-        })
-
-    return teams_output
+    return await rosters.league_rosters(db, league_id)
 
 
 @router.get("/{league_id}/game-log")
 async def get_game_log(
     league_id: uuid.UUID,
+    from_date: date | None = Query(None, alias="from", description="First game date (inclusive)"),
+    to_date: date | None = Query(None, alias="to", description="Last game date (inclusive)"),
+    limit_days: int | None = Query(
+        None, ge=1, le=200, description="Most recent game days to return (default: all)"
+    ),
     db: AsyncSession = Depends(get_db),
 ):
-    """Per-team, per-date scoring breakdown from PlayerGameLog."""
-    result = await db.execute(select(League).where(League.id == league_id))
-    league = result.scalar_one_or_none()
-    if not league:
-        raise HTTPException(status_code=404, detail="League not found")
-
-    members_result = await db.execute(
-        select(LeagueMembership).where(LeagueMembership.league_id == league_id)
-    )
-    members = members_result.scalars().all()
-
-    output = []
-    for member in members:
-        agent_name = member.agent.name if member.agent else "Unknown"
-        team = member.team
-        if not team or not team.players:
-            output.append({
-                "agent_name": agent_name,
-                "agent_id": str(member.agent_id),
-                "daily_scores": [],
-            })
-            continue
-
-        starter_player_ids = [tp.player_id for tp in team.players if tp.is_starter]
-        if not starter_player_ids:
-            output.append({
-                "agent_name": agent_name,
-                "agent_id": str(member.agent_id),
-                "daily_scores": [],
-            })
-            continue
-
-        # Get player names
-        players_result = await db.execute(
-            select(Player).where(Player.id.in_(starter_player_ids))
-        )
-        player_map = {p.id: p.full_name for p in players_result.scalars().all()}
-
-        # Get game logs grouped by date
-        logs_result = await db.execute(
-            select(PlayerGameLog).where(
-                PlayerGameLog.player_id.in_(starter_player_ids),
-                PlayerGameLog.season == league.season,
-            ).order_by(PlayerGameLog.game_date.desc())
-        )
-        logs = logs_result.scalars().all()
-
-        # Group by date
-        date_groups: dict[str, list] = {}
-        for log in logs:
-            d = log.game_date.isoformat()
-            if d not in date_groups:
-                date_groups[d] = []
-            date_groups[d].append({
-                "name": player_map.get(log.player_id, "Unknown"),
-                "points": float(log.fantasy_points) if log.fantasy_points else 0,
-            })
-
-        daily_scores = []
-        for d in sorted(date_groups.keys(), reverse=True):
-            players_list = date_groups[d]
-            day_total = sum(p["points"] for p in players_list)
-            daily_scores.append({
-                "date": d,
-                "points": round(day_total, 2),
-                "players": players_list,
-            })
+    """Per-team, per-date scoring breakdown from PlayerGameLog, newest day first."""
+    from app.services.game_log import league_game_log
 
-        output.append({
-            "agent_name": agent_name,
-            "agent_id": str(member.agent_id),
-            "daily_scores": daily_scores,
-        })
+    result = await db.execute(select(League.season).where(League.id == league_id))
+    season = result.scalar_one_or_none()
+    if season is None:
+        raise HTTPException(status_code=404, detail="League not found")
 
-    return output
+    return await league_game_log(db, league_id, season, from_date, to_date, limit_days)
 
 
 @router.get("/{league_id}/upcoming-games")
@@ -523,50 +383,39 @@ async def get_upcoming_games(
     league_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
 ):
-    """Upcoming NBA games, with annotations for rostered players' teams."""
-    from app.api.nba import fetch_upcoming
+    """Upcoming NBA games, with annotations for rostered players' teams.
 
-    result = await db.execute(select(League).where(League.id == league_id))
-    league = result.scalar_one_or_none()
-    if not league:
-        raise HTTPException(status_code=404, detail="League not found")
+    Served from the shared schedule cache; never waits on NBA.com.
+    """
+    from app.api.nba import upcoming_nowait
 
-    # Get all rostered NBA teams in the league
-    members_result = await db.execute(
-        select(LeagueMembership).where(LeagueMembership.league_id == league_id)
-    )
-    members = members_result.scalars().all()
-
-    rostered_nba_teams = set()
-    for member in members:
-        team = member.team
-        if not team or not team.players:
-            continue
-        for tp in team.players:
-            player_result = await db.execute(
-                select(Player).where(Player.id == tp.player_id)
-            )
-            player = player_result.scalar_one_or_none()
-            if player and player.nba_team:
-                rostered_nba_teams.add(player.nba_team)
+    result = await db.execute(select(League.id).where(League.id == league_id))
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(status_code=404, detail="League not found")
 
-    # Fetch upcoming games
-    try:
-        upcoming = await asyncio.to_thread(fetch_upcoming)
-    except Exception:
-        logger.exception("Failed to fetch upcoming games")
-        return {"games": [], "game_date": "", "label": "Error fetching schedule"}
-
-    games = upcoming.get("games", [])
-
-    # Annotate games with whether they involve rostered teams
-    for game in games:
-        game["has_rostered_players"] = (
-            game.get("home_team", "") in rostered_nba_teams
-            or game.get("away_team", "") in rostered_nba_teams
-        )
+    rostered_nba_teams = {
+        p["nba_team"]
+        for team in await rosters.league_rosters(db, league_id)
+        for p in team["roster"]
+        if p["nba_team"]
+    }
 
-    return upcoming
+    upcoming = upcoming_nowait()
+    if upcoming is None:
+        return {"games": [], "game_date": "", "label": "Loading schedule"}
+
+    # Annotate copies: the schedule itself is shared across leagues
+    games = [
+        {
+            **game,
+            "has_rostered_players": (
+                game.get("home_team", "") in rostered_nba_teams
+                or game.get("away_team", "") in rostered_nba_teams
+            ),
+        }
+        for game in upcoming.get("games", [])
+    ]
+    return {**upcoming, "games": games}
 
 
 @router.post("/{league_id}/generate-season")
@@ -657,7 +506,7 @@ async def standings(league_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
 
 
 def _league_response(league: League) -> LeagueResponse:
-    count = len(league.memberships) if league.memberships else 0
+    count = league.member_count
     return LeagueResponse(
         id=league.id,
         name=league.name,
@@ -669,6 +518,9 @@ def _league_response(league: League) -> LeagueResponse:
         max_teams=league.max_teams,
         draft_date=league.draft_date,
         season=league.season,
+        pick_timeout_seconds=league.pick_timeout_seconds,
+        waiver_type=league.waiver_type,
+        faab_budget=league.faab_budget,
         member_count=count,
         current_members=count,
         created_at=league.created_at,
@@ -7,10 +7,18 @@ from datetime import date, timedelta
 from fastapi import APIRouter
 from pydantic import BaseModel
 
+from app.services import cache
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/nba", tags=["nba"])
 
+UPCOMING_CACHE_KEY = "nba:upcoming"
+UPCOMING_TTL_SECONDS = 600
+
+_last_upcoming: dict | None = None  # served while a refresh is in flight
+_upcoming_refresh: asyncio.Task | None = None
+
 
 class NBAGameResponse(BaseModel):
     home_team: str
@@ -40,18 +48,46 @@ async def today_schedule():
 @router.get("/schedule/upcoming", response_model=UpcomingGamesResponse)
 async def upcoming_schedule():
     """Return the next day with NBA games (today or up to 5 days ahead)."""
-    from app.services.cache import cached
-
     try:
-        result = await cached(
-            "nba:upcoming", 600, lambda: asyncio.to_thread(fetch_upcoming)
-        )
+        result = await cache.cached(UPCOMING_CACHE_KEY, UPCOMING_TTL_SECONDS, _fetch_upcoming)
         return result
     except Exception:
         logger.exception("Failed to fetch upcoming NBA schedule")
         return UpcomingGamesResponse(games=[], game_date="", label="No games found")
 
 
+def upcoming_nowait() -> dict | None:
+    """The shared upcoming schedule without waiting on NBA.com.
+
+    On a cache miss a single background refresh is started, and the last
+    known schedule (or None, before the first fetch) is returned meanwhile.
+    """
+    global _upcoming_refresh
+    value = cache.get(UPCOMING_CACHE_KEY)
+    if value is not None:
+        return value
+    if _upcoming_refresh is None or _upcoming_refresh.done():
+        _upcoming_refresh = asyncio.create_task(_refresh_upcoming())
+    return _last_upcoming
+
+
+async def _refresh_upcoming() -> None:
+    try:
+        value = await _fetch_upcoming()
+    except Exception:
+        logger.exception("Failed to refresh upcoming NBA schedule")
+        return
+    cache.put(UPCOMING_CACHE_KEY, value, UPCOMING_TTL_SECONDS)
+
+
+async def _fetch_upcoming() -> dict:
+    """Fetch the upcoming schedule, keeping it as the fallback for cache misses."""
+    global _last_upcoming
+    value = await asyncio.to_thread(fetch_upcoming)
+    _last_upcoming = value
+    return value
+
+
 def fetch_upcoming() -> dict:
     today = date.today()
     day_names = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
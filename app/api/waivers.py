@@ -1,15 +1,29 @@
-"""Waiver and free agent pickup endpoints."""
+"""Waiver, free agent pickup, roster transaction and lineup endpoints."""
 
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import and_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.api.deps import get_current_agent
 from app.models.agent import Agent
-from app.schemas.waivers import FreeAgentPickupRequest, WaiverClaimRequest, WaiverClaimResponse
+from app.models.league import LeagueMembership
+from app.schemas.waivers import (
+    AutoLineupRequest,
+    AutoLineupResponse,
+    FreeAgentPickupRequest,
+    LineupResponse,
+    LineupSpot,
+    RosterTransactionRequest,
+    RosterTransactionResponse,
+    WaiverClaimRequest,
+    WaiverClaimResponse,
+)
 from app.services.activity import log_activity
+from app.services.lineup import optimize_lineup
+from app.services.transactions import apply_transactions
 from app.services.waivers import create_waiver_claim, pickup_free_agent
 
 router = APIRouter(prefix="/leagues/{league_id}", tags=["waivers"])
@@ -22,9 +36,13 @@ async def claim_waiver(
     agent: Agent = Depends(get_current_agent),
     db: AsyncSession = Depends(get_db),
 ):
-    claim = await create_waiver_claim(
-        db, league_id, agent.id, data.player_id, data.drop_player_id
-    )
+    try:
+        claim = await create_waiver_claim(
+            db, league_id, agent.id, data.player_id, data.drop_player_id,
+            bid_amount=data.bid_amount, claim_group=data.claim_group,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     await log_activity(db, agent.id, "waiver_claim", {
         "league_id": str(league_id),
         "player_id": str(data.player_id),
@@ -57,3 +75,65 @@ async def pickup(
     await db.commit()
 
     return {"status": "ok", "message": "Player added to roster"}
+
+
+@router.post("/transactions", response_model=RosterTransactionResponse)
+async def roster_transactions(
+    league_id: uuid.UUID,
+    data: RosterTransactionRequest,
+    agent: Agent = Depends(get_current_agent),
+    db: AsyncSession = Depends(get_db),
+):
+    """Apply an ordered batch of add/drop/lineup moves atomically: all or nothing."""
+    try:
+        roster = await apply_transactions(db, league_id, agent.id, data.moves)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return RosterTransactionResponse(applied=len(data.moves), roster=roster)
+
+
+@router.post("/lineup/optimize", response_model=LineupResponse)
+async def optimize_team_lineup(
+    league_id: uuid.UUID,
+    dry_run: bool = Query(False, description="Return the best lineup without saving it"),
+    agent: Agent = Depends(get_current_agent),
+    db: AsyncSession = Depends(get_db),
+):
+    """Seat your roster in the lineup that maximizes projected points."""
+    try:
+        result = await optimize_lineup(db, league_id, agent.id, apply=not dry_run)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    return LineupResponse(
+        league_id=league_id,
+        projected_points=result.projected_points,
+        changed=result.changed,
+        lineup=[
+            LineupSpot(
+                player_id=p.player_id,
+                position=p.position,
+                roster_slot=p.roster_slot,
+                projected_points=round(p.projected, 2),
+            )
+            for p in result.players
+        ],
+    )
+
+
+@router.put("/lineup/auto", response_model=AutoLineupResponse)
+async def put_auto_lineup(
+    league_id: uuid.UUID,
+    data: AutoLineupRequest,
+    agent: Agent = Depends(get_current_agent),
+    db: AsyncSession = Depends(get_db),
+):
+    """Have your lineup re-optimized every night."""
+    result = await db.execute(
+        update(LeagueMembership)
+        .where(and_(LeagueMembership.league_id == league_id, LeagueMembership.agent_id == agent.id))
+        .values(auto_lineup=data.enabled)
+    )
+    if not result.rowcount:
+        raise HTTPException(status_code=403, detail="Not a member of this league")
+    await db.commit()
+    return AutoLineupResponse(league_id=league_id, enabled=data.enabled)
@@ -1,3 +1,5 @@
+from datetime import time
+
 from pydantic_settings import BaseSettings
 
 
@@ -8,6 +10,12 @@ class Settings(BaseSettings):
     api_rate_limit_per_minute: int = 60
     nba_api_delay_seconds: float = 2.0
     job_secret: str = ""  # Optional secret to protect job endpoints
+    password_hash_workers: int = 4  # Threads reserved for bcrypt work
+    draft_pick_timeout_seconds: int = 60  # Default per-league pick clock
+    draft_clock_concurrency: int = 8  # Leagues auto-picked in parallel
+    draft_autodraft_after_missed_picks: int = 2  # Timed-out picks before autodraft kicks in
+    waiver_process_interval_seconds: int = 900  # In-process waiver runs (0 disables)
+    lineup_optimize_at: time | None = time(4, 0)  # Nightly auto-managed lineups, local time (None disables)
 
     model_config = {"env_file": ".env", "extra": "ignore"}
 
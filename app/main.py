@@ -3,11 +3,10 @@
 import asyncio
 import logging
 from contextlib import asynccontextmanager
-from datetime import datetime, timedelta, timezone
+from datetime import time
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy import select, and_
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from app.api import agents, drafts, jobs, leaderboard, leagues, nba, users, waivers, activity
@@ -15,54 +14,42 @@ from app.database import async_session
 from app.middleware.error_handler import http_exception_handler, unhandled_exception_handler
 from app.middleware.rate_limit import RateLimitMiddleware
 from app.middleware.request_id import RequestIDMiddleware
-from app.models.draft import DraftState
-from app.services.draft import auto_pick_for_current
+from app.config import settings
+from app.services import draft_clock, draft_engine
+from app.services.draft import announce_status
+from app.services.lineup import run_scheduled_lineups
+from app.services.public_matchups import run_scheduled_refresh
+from app.services.scheduler import scheduler
+from app.services.waivers import run_scheduled_waivers
 
 logger = logging.getLogger(__name__)
 
-DRAFT_TICK_INTERVAL = 30  # seconds
-DRAFT_PICK_TIMEOUT = 60   # seconds
-
-
-async def _draft_tick_loop():
-    """Background loop: auto-pick for agents who exceed the pick timer."""
-    while True:
-        await asyncio.sleep(DRAFT_TICK_INTERVAL)
-        try:
-            cutoff = datetime.now(timezone.utc) - timedelta(seconds=DRAFT_PICK_TIMEOUT)
-            async with async_session() as db:
-                result = await db.execute(
-                    select(DraftState).where(
-                        and_(
-                            DraftState.status == "in_progress",
-                            DraftState.updated_at < cutoff,
-                        )
-                    )
-                )
-                stale_drafts = result.scalars().all()
-
-                for draft_state in stale_drafts:
-                    try:
-                        pick = await auto_pick_for_current(db, draft_state.league_id)
-                        logger.info(
-                            "Auto-picked for league %s, pick #%d, agent %s",
-                            draft_state.league_id, pick.pick_number, pick.agent_id,
-                        )
-                    except Exception:
-                        logger.exception("Auto-pick failed for league %s", draft_state.league_id)
-        except Exception:
-            logger.exception("Draft tick loop error")
+scheduler.every(settings.waiver_process_interval_seconds, "process_waivers", run_scheduled_waivers)
+scheduler.daily(settings.lineup_optimize_at, "optimize_lineups", run_scheduled_lineups)
+# Just after midnight, so date.today() has rolled over
+scheduler.daily(time(0, 0, 30), "index_scoring_periods", run_scheduled_refresh)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    task = asyncio.create_task(_draft_tick_loop())
+    try:
+        async with async_session() as db:
+            await draft_engine.rebuild_all(db)
+        for draft in draft_engine.active_drafts():
+            announce_status(draft)
+    except Exception:
+        logger.exception("Draft engine rebuild failed")
+
+    task = asyncio.create_task(draft_clock.clock.run())
+    scheduler.start()
     yield
+    await scheduler.shutdown()
     task.cancel()
     try:
         await task
     except asyncio.CancelledError:
         pass
+    await draft_clock.clock.shutdown()
 
 
 app = FastAPI(
@@ -88,6 +75,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],  # pagination cursor for cross-origin clients
 )
 app.add_middleware(RateLimitMiddleware)
 app.add_middleware(RequestIDMiddleware)
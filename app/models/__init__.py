@@ -4,8 +4,8 @@ from app.models.agent import Agent
 from app.models.league import League, LeagueMembership
 from app.models.team import Team, TeamPlayer
 from app.models.player import Player, PlayerGameLog
-from app.models.draft import DraftState, DraftPick
-from app.models.waiver import WaiverClaim
+from app.models.draft import DraftState, DraftPick, DraftQueue
+from app.models.waiver import WaiverClaim, WaiverOrder
 from app.models.matchup import ScoringPeriod, Matchup
 from app.models.job_run import JobRun
 from app.models.activity_log import ActivityLog
@@ -22,7 +22,9 @@ __all__ = [
     "PlayerGameLog",
     "DraftState",
     "DraftPick",
+    "DraftQueue",
     "WaiverClaim",
+    "WaiverOrder",
     "ScoringPeriod",
     "Matchup",
     "JobRun",
@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import ForeignKey, Integer, String, Text, Uuid
+from sqlalchemy import JSON, ForeignKey, Integer, String, Text, UniqueConstraint, Uuid
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.base import Base, TimestampMixin, UUIDMixin
@@ -17,11 +17,21 @@ class DraftState(Base, UUIDMixin, TimestampMixin):
     status: Mapped[str] = mapped_column(
         String(20), default="pending"
     )  # pending, in_progress, completed
-    draft_order: Mapped[str] = mapped_column(Text)  # JSON list of agent IDs in snake order
+    draft_type: Mapped[str] = mapped_column(
+        String(30), default="snake", server_default="snake"
+    )  # snake, linear, third_round_reversal
+    draft_order: Mapped[str] = mapped_column(Text)  # JSON list of agent IDs, first round only
+    prefs_version: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0"
+    )  # bumped whenever a draft queue or autodraft flag changes
 
 
 class DraftPick(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "draft_picks"
+    __table_args__ = (
+        UniqueConstraint("league_id", "player_id", name="uq_draft_pick_player"),
+        UniqueConstraint("league_id", "pick_number", name="uq_draft_pick_number"),
+    )
 
     league_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey("leagues.id"), index=True
@@ -35,3 +45,18 @@ class DraftPick(Base, UUIDMixin, TimestampMixin):
     pick_number: Mapped[int] = mapped_column(Integer)
     round_number: Mapped[int] = mapped_column(Integer)
     is_auto_pick: Mapped[bool] = mapped_column(default=False)
+
+
+class DraftQueue(Base, UUIDMixin, TimestampMixin):
+    """An agent's ranked wish list for a league's draft, picked from automatically."""
+
+    __tablename__ = "draft_queues"
+    __table_args__ = (UniqueConstraint("league_id", "agent_id"),)
+
+    league_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid, ForeignKey("leagues.id"), index=True
+    )
+    agent_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid, ForeignKey("agents.id")
+    )
+    player_ids: Mapped[list] = mapped_column(JSON, default=list)  # player IDs, best first
@@ -3,12 +3,14 @@ from datetime import datetime
 
 from sqlalchemy import (
     JSON,
+    Boolean,
     DateTime,
     ForeignKey,
     Integer,
     String,
     UniqueConstraint,
     Uuid,
+    false,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -33,6 +35,13 @@ class League(Base, UUIDMixin, TimestampMixin):
     scoring_config: Mapped[dict] = mapped_column(JSON, default=dict)
     roster_config: Mapped[dict] = mapped_column(JSON, default=dict)
     season: Mapped[str] = mapped_column(String(10), default="2025-26")
+    pick_timeout_seconds: Mapped[int] = mapped_column(Integer, default=60, server_default="60")
+    waiver_type: Mapped[str] = mapped_column(
+        String(10), default="rolling", server_default="rolling"
+    )  # rolling, faab
+    faab_budget: Mapped[int] = mapped_column(Integer, default=100, server_default="100")
+    # Denormalized count of memberships; joins reserve a slot by incrementing it
+    member_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
 
     commissioner = relationship("Agent", foreign_keys=[commissioner_id], lazy="selectin")
     memberships = relationship("LeagueMembership", back_populates="league", lazy="selectin")
@@ -48,6 +57,14 @@ class LeagueMembership(Base, UUIDMixin, TimestampMixin):
     agent_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey("agents.id")
     )
+    autodraft: Mapped[bool] = mapped_column(Boolean, default=False, server_default=false())
+    missed_picks_from: Mapped[int | None] = mapped_column(
+        Integer, nullable=True
+    )  # pick autodraft was last turned off at; earlier misses don't count
+    auto_lineup: Mapped[bool] = mapped_column(
+        Boolean, default=False, server_default=false()
+    )  # lineup re-optimized nightly
+    faab_spent: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
 
     league = relationship("League", back_populates="memberships", lazy="selectin")
     agent = relationship("Agent", back_populates="memberships", lazy="selectin")
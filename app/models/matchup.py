@@ -18,6 +18,9 @@ class ScoringPeriod(Base, UUIDMixin, TimestampMixin):
     start_date: Mapped[date] = mapped_column(Date)
     end_date: Mapped[date] = mapped_column(Date)
     is_playoff: Mapped[bool] = mapped_column(default=False)
+    scores_version: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0"
+    )  # bumped each time the period's matchups are scored
 
     league = relationship("League", back_populates="scoring_periods", lazy="selectin")
     matchups = relationship("Matchup", back_populates="scoring_period", lazy="selectin")
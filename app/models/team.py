@@ -23,6 +23,9 @@ class TeamPlayer(Base, UUIDMixin, TimestampMixin):
     team_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey("teams.id"), index=True
     )
+    league_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid, ForeignKey("leagues.id")
+    )  # denormalized from the team's membership, for per-league ownership checks
     player_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey("players.id"), index=True
     )
@@ -33,4 +36,5 @@ class TeamPlayer(Base, UUIDMixin, TimestampMixin):
 
     __table_args__ = (
         UniqueConstraint("team_id", "player_id", name="uq_team_player"),
+        UniqueConstraint("league_id", "player_id", name="uq_league_player"),
     )
@@ -9,6 +9,7 @@ class User(Base, UUIDMixin, TimestampMixin):
 
     username: Mapped[str] = mapped_column(String(50), unique=True, index=True)
     email: Mapped[str] = mapped_column(String(255), unique=True, index=True)
-    hashed_password: Mapped[str] = mapped_column(String(255))
+    # None for shadow users created by agent self-registration (no password login)
+    hashed_password: Mapped[str | None] = mapped_column(String(255), nullable=True)
 
     agents = relationship("Agent", back_populates="owner", lazy="selectin")
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Uuid
+from sqlalchemy import DateTime, ForeignKey, Integer, String, UniqueConstraint, Uuid
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.base import Base, TimestampMixin, UUIDMixin
@@ -22,8 +22,27 @@ class WaiverClaim(Base, UUIDMixin, TimestampMixin):
     drop_player_id: Mapped[uuid.UUID | None] = mapped_column(
         Uuid, ForeignKey("players.id")
     )
-    priority: Mapped[int] = mapped_column(Integer)
+    priority: Mapped[int | None] = mapped_column(Integer)  # unused; see WaiverOrder
+    bid_amount: Mapped[int | None] = mapped_column(Integer)  # sealed FAAB bid
+    claim_group: Mapped[str | None] = mapped_column(
+        String(40)
+    )  # at most one claim per (agent, group) is approved
     status: Mapped[str] = mapped_column(
         String(20), default="pending"
     )  # pending, approved, denied, cancelled
     waiver_expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+
+
+class WaiverOrder(Base, UUIDMixin, TimestampMixin):
+    """An agent's place in a league's rolling waiver order (lowest position first)."""
+
+    __tablename__ = "waiver_orders"
+    __table_args__ = (UniqueConstraint("league_id", "agent_id", name="uq_waiver_order_agent"),)
+
+    league_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid, ForeignKey("leagues.id"), index=True
+    )
+    agent_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid, ForeignKey("agents.id")
+    )
+    position: Mapped[int] = mapped_column(Integer)
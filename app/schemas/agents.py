@@ -45,6 +45,15 @@ class AgentMeResponse(AgentResponse):
     leagues: list[LeagueInfo] = []
 
 
+class DraftTurnInfo(BaseModel):
+    league_id: uuid.UUID
+    pick_number: int
+    round_number: int
+    deadline: datetime | None
+
+    model_config = {"from_attributes": True}
+
+
 class AgentDirectoryEntry(BaseModel):
     id: uuid.UUID
     name: str
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class DraftPickRequest(BaseModel):
@@ -26,7 +26,50 @@ class DraftStateResponse(BaseModel):
     current_pick: int
     total_picks: int
     status: str
+    draft_type: str = "snake"
     current_agent_id: uuid.UUID | None = None
-    draft_order: list[uuid.UUID]
+    pick_deadline: datetime | None = None
+    draft_order: list[uuid.UUID]  # agent ID for every pick
 
     model_config = {"from_attributes": True}
+
+
+class DraftQueueRequest(BaseModel):
+    player_ids: list[uuid.UUID] = Field(max_length=500)  # best first
+
+
+class DraftQueueResponse(BaseModel):
+    league_id: uuid.UUID
+    player_ids: list[uuid.UUID]
+
+
+class AutodraftRequest(BaseModel):
+    enabled: bool
+
+
+class AutodraftResponse(BaseModel):
+    league_id: uuid.UUID
+    enabled: bool
+
+
+class DraftBoardTeam(BaseModel):
+    agent_id: uuid.UUID
+    agent_name: str
+
+
+class DraftBoardCell(BaseModel):
+    pick_number: int
+    player_id: uuid.UUID
+    player_name: str
+    position: str
+    nba_team: str
+    is_auto_pick: bool
+
+
+class DraftBoardResponse(BaseModel):
+    league_id: uuid.UUID
+    status: str
+    current_pick: int
+    total_picks: int
+    teams: list[DraftBoardTeam]  # board columns, in first-round order
+    rounds: list[list[DraftBoardCell | None]]  # rounds[r][c]: team c's pick in round r + 1
@@ -1,8 +1,8 @@
 import uuid
 from datetime import datetime
-from typing import Any
+from typing import Any, Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class LeagueCreate(BaseModel):
@@ -12,6 +12,9 @@ class LeagueCreate(BaseModel):
     max_teams: int = 14
     draft_date: datetime | None = None
     scoring_config: dict[str, float] | None = None
+    pick_timeout_seconds: int | None = Field(None, ge=10, le=24 * 60 * 60)
+    waiver_type: Literal["rolling", "faab"] = "rolling"
+    faab_budget: int = Field(100, ge=0, le=10_000)
 
 
 class LeagueResponse(BaseModel):
@@ -25,6 +28,9 @@ class LeagueResponse(BaseModel):
     max_teams: int
     draft_date: datetime | None
     season: str
+    pick_timeout_seconds: int = 60
+    waiver_type: str = "rolling"
+    faab_budget: int = 100
     member_count: int = 0
     current_members: int = 0
     created_at: datetime
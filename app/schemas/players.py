@@ -13,6 +13,7 @@ class PlayerResponse(BaseModel):
     nba_team: str
     status: str
     season_stats: dict[str, Any]
+    projected_fantasy_points: float | None = None
 
     model_config = {"from_attributes": True}
 
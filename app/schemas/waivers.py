@@ -1,12 +1,15 @@
 import uuid
 from datetime import datetime
+from typing import Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class WaiverClaimRequest(BaseModel):
     player_id: uuid.UUID
     drop_player_id: uuid.UUID | None = None
+    bid_amount: int | None = Field(None, ge=0)  # FAAB leagues only
+    claim_group: str | None = Field(None, max_length=40)
 
 
 class WaiverClaimResponse(BaseModel):
@@ -15,7 +18,9 @@ class WaiverClaimResponse(BaseModel):
     agent_id: uuid.UUID
     player_id: uuid.UUID
     drop_player_id: uuid.UUID | None
-    priority: int
+    priority: int | None = None
+    bid_amount: int | None = None
+    claim_group: str | None = None
     status: str
     waiver_expires_at: datetime
     created_at: datetime
@@ -26,3 +31,50 @@ class WaiverClaimResponse(BaseModel):
 class FreeAgentPickupRequest(BaseModel):
     player_id: uuid.UUID
     drop_player_id: uuid.UUID | None = None
+
+
+class RosterMove(BaseModel):
+    type: Literal["add", "drop", "lineup"]
+    player_id: uuid.UUID
+    roster_slot: str | None = None  # lineup moves: target slot, e.g. "PG", "UTIL" or "BN"
+
+
+class RosterTransactionRequest(BaseModel):
+    moves: list[RosterMove] = Field(min_length=1, max_length=50)
+
+
+class RosterSpot(BaseModel):
+    player_id: uuid.UUID
+    position: str
+    roster_slot: str
+    is_starter: bool
+
+    model_config = {"from_attributes": True}
+
+
+class RosterTransactionResponse(BaseModel):
+    applied: int
+    roster: list[RosterSpot]
+
+
+class LineupSpot(BaseModel):
+    player_id: uuid.UUID
+    position: str
+    roster_slot: str
+    projected_points: float
+
+
+class LineupResponse(BaseModel):
+    league_id: uuid.UUID
+    projected_points: float  # starters' projected points per game
+    changed: int
+    lineup: list[LineupSpot]
+
+
+class AutoLineupRequest(BaseModel):
+    enabled: bool
+
+
+class AutoLineupResponse(BaseModel):
+    league_id: uuid.UUID
+    enabled: bool
@@ -1,7 +1,9 @@
 """Authentication helpers: password hashing, JWT tokens, API key hashing."""
 
+import asyncio
 import hashlib
 import secrets
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 
 import bcrypt
@@ -11,15 +13,38 @@ from app.config import settings
 
 _ALGORITHM = "HS256"
 
+# bcrypt releases the GIL, so a small thread pool keeps hashing off the event
+# loop without letting a registration burst queue unbounded CPU work.
+_bcrypt_pool = ThreadPoolExecutor(
+    max_workers=settings.password_hash_workers, thread_name_prefix="bcrypt"
+)
+
 
 def hash_password(password: str) -> str:
     return bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
 
 
-def verify_password(plain: str, hashed: str) -> bool:
+def verify_password(plain: str, hashed: str | None) -> bool:
+    if not hashed:
+        # Password-less (shadow) users can never log in with a password
+        return False
     return bcrypt.checkpw(plain.encode(), hashed.encode())
 
 
+async def hash_password_async(password: str) -> str:
+    """Hash a password on the bcrypt worker pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_bcrypt_pool, hash_password, password)
+
+
+async def verify_password_async(plain: str, hashed: str | None) -> bool:
+    """Verify a password on the bcrypt worker pool."""
+    if not hashed:
+        return False
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_bcrypt_pool, verify_password, plain, hashed)
+
+
 def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
     to_encode = data.copy()
     expire = datetime.now(timezone.utc) + (
@@ -5,6 +5,7 @@ with expiry timestamps. Stale entries are lazily evicted on read.
 """
 
 import asyncio
+import hashlib
 import time
 
 _cache: dict[str, tuple[object, float]] = {}
@@ -37,6 +38,37 @@ async def cached(key: str, ttl_seconds: int, fetch_fn):
         return value
 
 
+def get(key: str):
+    """The cached value for *key*, or None if missing or expired."""
+    entry = _cache.get(key)
+    if entry is None or time.monotonic() >= entry[1]:
+        return None
+    return entry[0]
+
+
+def put(key: str, value: object, ttl_seconds: int) -> None:
+    _cache[key] = (value, time.monotonic() + ttl_seconds)
+
+
 def invalidate(key: str) -> None:
     """Remove a specific cache entry."""
     _cache.pop(key, None)
+
+
+def clear() -> None:
+    """Remove every cache entry."""
+    _cache.clear()
+
+
+def make_etag(*parts: object) -> str:
+    """Build a weak ETag from the version parts that describe a response."""
+    digest = hashlib.sha1("|".join(str(p) for p in parts).encode()).hexdigest()[:20]
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """True if an If-None-Match header value matches *etag*."""
+    if not if_none_match:
+        return False
+    candidates = {c.strip() for c in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates or etag.removeprefix("W/") in candidates
@@ -1,49 +1,67 @@
 """Draft service: snake draft logic with auto-pick fallback."""
 
-import json
 import random
 import uuid
+from collections.abc import Callable
+from datetime import datetime, timezone
 
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.draft import DraftPick, DraftState
+from app.config import settings
+from app.models.agent import Agent
+from app.models.draft import DraftPick, DraftQueue, DraftState
 from app.models.league import League, LeagueMembership
 from app.models.player import Player
 from app.models.team import Team, TeamPlayer
+from app.schemas.drafts import DraftBoardCell, DraftBoardResponse, DraftBoardTeam
+from app.services import (
+    draft_clock,
+    draft_engine,
+    draft_events,
+    draft_order,
+    draft_turns,
+    player_pool,
+    rosters,
+)
+from app.services.draft_ranking import DraftRanking, build_heap, get_season_ranking, pop_best_fit
 from app.sports.nba import NBARules
 
 _nba_rules = NBARules()
 
+PICK_ATTEMPTS = 3  # resync-and-retry rounds when another worker advances the draft
+
+
+class StaleDraftError(Exception):
+    """The draft moved on in the DB since this worker's engine last saw it."""
+
+
+async def initialize_draft(
+    db: AsyncSession, league_id: uuid.UUID, draft_type: str = "snake"
+) -> DraftState:
+    """Create a draft state with a randomized first-round order."""
+    if draft_type not in draft_order.DRAFT_TYPES:
+        raise ValueError(f"Unsupported draft type: {draft_type}")
 
-async def initialize_draft(db: AsyncSession, league_id: uuid.UUID) -> DraftState:
-    """Create a draft state with randomized snake order."""
     # Get league members
     result = await db.execute(
         select(LeagueMembership).where(LeagueMembership.league_id == league_id)
     )
     members = result.scalars().all()
-    agent_ids = [str(m.agent_id) for m in members]
+    agent_ids = [m.agent_id for m in members]
     random.shuffle(agent_ids)
 
     roster_size = _nba_rules.default_roster_config()["total_roster_size"]
-    num_teams = len(agent_ids)
-    total_picks = num_teams * roster_size
-
-    # Generate snake draft order
-    snake_order = []
-    for round_num in range(roster_size):
-        if round_num % 2 == 0:
-            snake_order.extend(agent_ids)
-        else:
-            snake_order.extend(reversed(agent_ids))
+    total_picks = len(agent_ids) * roster_size
 
     draft_state = DraftState(
         league_id=league_id,
         current_pick=1,
         total_picks=total_picks,
         status="in_progress",
-        draft_order=json.dumps(snake_order),
+        draft_type=draft_type,
+        draft_order=draft_order.dumps(agent_ids),
     )
     db.add(draft_state)
 
@@ -61,7 +79,14 @@ async def initialize_draft(db: AsyncSession, league_id: uuid.UUID) -> DraftState
             db.add(Team(membership_id=member.id))
 
     await db.commit()
+    rosters.invalidate(league_id)
     await db.refresh(draft_state)
+    draft = await draft_engine.load_draft(db, league_id)
+    if draft:
+        draft.start_clock()
+        announce_status(draft)
+        if await pick_if_ready(db, league_id):
+            await db.refresh(draft_state)
     return draft_state
 
 
@@ -71,120 +96,499 @@ async def make_pick(
     agent_id: uuid.UUID,
     player_id: uuid.UUID,
     is_auto: bool = False,
-) -> DraftPick:
-    """Make a draft pick. Validates it's the agent's turn and player is available."""
-    # Get draft state
+    expected_pick: int | None = None,
+) -> DraftPick | None:
+    """Make a draft pick. Validates it's the agent's turn and player is available.
+
+    Validation runs against the in-memory draft engine. Agents up next who
+    have a queued player still available, or who are on autodraft, are picked
+    for in the same transaction, so a run of them drafts without waiting on the
+    clock. An auto-pick (*is_auto*) that makes the agent's
+    ``draft_autodraft_after_missed_picks``-th straight miss switches them to
+    autodraft. Returns the pick made for *agent_id*.
+
+    Safe across workers: if another process advanced the draft first, this
+    worker's engine is resynced from the DB and the pick re-validated; a pick
+    the engine would reject is checked against the stored current pick first. With
+    *expected_pick*, nothing is picked (returns None) once the draft is past
+    that pick, so a retried auto-pick can't take the agent's next pick too.
+    """
+    for _ in range(PICK_ATTEMPTS):
+        draft = await draft_engine.get_draft(db, league_id)
+        if not draft or not draft.is_active:
+            raise ValueError("Draft is not in progress")
+
+        async with draft.lock:
+            if not draft.is_active:
+                raise ValueError("Draft is not in progress")
+            if expected_pick is not None and draft.current_pick != expected_pick:
+                return None
+            error = None
+            if draft.current_agent() != agent_id:
+                error = "It's not your turn to pick"
+            elif player_id in draft.drafted:
+                error = "Player already drafted"
+            if error is not None:
+                # Only trust the rejection if no other worker has moved the draft on
+                if await _stored_pick(db, league_id) == draft.current_pick:
+                    raise ValueError(error)
+            else:
+                absent = set()
+                if (
+                    is_auto
+                    and agent_id not in draft.autodraft
+                    and draft.missed_picks.get(agent_id, 0) + 1
+                    >= settings.draft_autodraft_after_missed_picks
+                ):
+                    absent.add(agent_id)
+
+                planned = [(agent_id, player_id, is_auto)]
+                planned += await _chained_picks(db, draft, planned, draft.autodraft | absent)
+                try:
+                    picks = await _commit_picks(db, draft, planned, absent)
+                except StaleDraftError:
+                    pass
+                else:
+                    return picks[0]
+
+        await resync_draft(db, league_id)
+
+    raise ValueError("Draft state changed, please retry")
+
+
+async def _stored_pick(db: AsyncSession, league_id: uuid.UUID) -> int | None:
+    """The draft's current pick as stored, which other workers may have advanced."""
     result = await db.execute(
-        select(DraftState).where(DraftState.league_id == league_id)
+        select(DraftState.current_pick).where(DraftState.league_id == league_id)
     )
-    draft_state = result.scalar_one_or_none()
-    if not draft_state or draft_state.status != "in_progress":
-        raise ValueError("Draft is not in progress")
+    return result.scalar_one_or_none()
+
 
-    order = json.loads(draft_state.draft_order)
-    current_agent = order[draft_state.current_pick - 1]
+async def resync_draft(
+    db: AsyncSession, league_id: uuid.UUID
+) -> draft_engine.LeagueDraft | None:
+    """Reload a league's draft after another worker moved it on."""
+    player_pool.invalidate_league(league_id)
+    draft = await draft_engine.load_draft(db, league_id)
+    if draft:
+        announce_status(draft)
+    return draft
 
-    if str(agent_id) != current_agent:
-        raise ValueError("It's not your turn to pick")
 
-    # Check player not already drafted
-    existing = await db.execute(
-        select(DraftPick).where(
-            and_(DraftPick.league_id == league_id, DraftPick.player_id == player_id)
+async def _chained_picks(
+    db: AsyncSession,
+    draft: draft_engine.LeagueDraft,
+    planned: list[tuple[uuid.UUID, uuid.UUID, bool]],
+    autodraft: set[uuid.UUID],
+) -> list[tuple[uuid.UUID, uuid.UUID, bool]]:
+    """Picks that follow *planned* straight away: the next agents' queued players,
+    or the best-fitting ranked player for agents on *autodraft*."""
+    taken = {player_id for _, player_id, _ in planned}
+    pending: dict[uuid.UUID, list[uuid.UUID]] = {}
+    for agent_id, player_id, _ in planned:
+        pending.setdefault(agent_id, []).append(player_id)
+
+    chained = []
+    ranking = None
+    for pick_number in range(draft.current_pick + len(planned), draft.total_picks + 1):
+        agent_id = draft.agent_for(pick_number)
+        player_id = draft.next_queued(agent_id, taken)
+        is_auto = False
+        if player_id is None and agent_id in autodraft:
+            if ranking is None:
+                ranking = await _draft_ranking(db, draft)
+            roster = draft.rosters.get(agent_id, []) + pending.get(agent_id, [])
+            player_id = pop_best_fit(draft.ranking_heap, ranking, draft.drafted | taken, roster)
+            is_auto = True
+        if player_id is None:
+            break
+        taken.add(player_id)
+        pending.setdefault(agent_id, []).append(player_id)
+        chained.append((agent_id, player_id, is_auto))
+    return chained
+
+
+async def _commit_picks(
+    db: AsyncSession,
+    draft: draft_engine.LeagueDraft,
+    planned: list[tuple[uuid.UUID, uuid.UUID, bool]],
+    absent: set[uuid.UUID] = frozenset(),
+) -> list[DraftPick]:
+    """Persist consecutive picks starting at the current pick in one transaction.
+
+    *planned* is (agent_id, player_id, is_auto) per pick; agents in *absent*
+    are switched to autodraft alongside. The picks are planned from the
+    engine's queues and autodraft flags, so a change to those made through
+    another worker (a newer ``prefs_version``) makes the draft stale too. Must be called with ``draft.lock``
+    held; the engine is only updated once the commit succeeds.
+
+    The draft row is locked (``FOR UPDATE``) before anything is written, and
+    the ``current_pick`` guard plus the unique constraints on ``draft_picks``
+    back that up. Raises :class:`StaleDraftError` (after rolling back and
+    evicting the engine) when another worker got there first.
+    """
+    league_id = draft.league_id
+    first_pick = draft.current_pick
+    try:
+        locked = await db.execute(
+            select(DraftState.current_pick, DraftState.prefs_version)
+            .where(DraftState.league_id == league_id)
+            .with_for_update()
+        )
+        if tuple(locked.one()) != (first_pick, draft.prefs_version):
+            raise StaleDraftError(league_id)  # picked, or queues changed, elsewhere
+        picks = _add_picks(db, draft, planned)
+
+        # Advance draft
+        next_pick = first_pick + len(planned)
+        completed = next_pick > draft.total_picks
+        advanced = await db.execute(
+            update(DraftState)
+            .where(
+                and_(
+                    DraftState.league_id == league_id,
+                    DraftState.current_pick == first_pick,
+                    DraftState.prefs_version == draft.prefs_version,
+                )
+            )
+            .values(
+                current_pick=next_pick,
+                status="completed" if completed else "in_progress",
+                prefs_version=draft.prefs_version + (1 if absent else 0),
+            )
         )
+        if advanced.rowcount != 1:
+            raise StaleDraftError(league_id)
+        if absent:
+            await db.execute(
+                update(LeagueMembership)
+                .where(
+                    and_(
+                        LeagueMembership.league_id == league_id,
+                        LeagueMembership.agent_id.in_(absent),
+                    )
+                )
+                .values(autodraft=True)
+            )
+        if completed:
+            await db.execute(
+                update(League).where(League.id == league_id).values(status="active")
+            )
+        await db.commit()
+    except Exception as e:
+        await db.rollback()
+        draft_engine.evict(league_id)
+        if isinstance(e, IntegrityError):
+            raise StaleDraftError(league_id) from e  # pick or player taken meanwhile
+        raise
+
+    if absent:
+        draft.autodraft |= absent
+        draft.prefs_version += 1
+    for pick in picks:
+        draft.record_pick(pick.agent_id, pick.player_id, pick.is_auto_pick)
+        player_pool.mark_owned(league_id, pick.player_id)
+        draft_events.hub.publish(league_id, "pick_made", {
+            "league_id": league_id,
+            "pick_number": pick.pick_number,
+            "round_number": pick.round_number,
+            "agent_id": pick.agent_id,
+            "player_id": pick.player_id,
+            "is_auto_pick": pick.is_auto_pick,
+        })
+    rosters.invalidate(league_id)
+    announce_status(draft)
+    if not draft.is_active:
+        draft_engine.evict(league_id)
+    return picks
+
+
+def _add_picks(
+    db: AsyncSession,
+    draft: draft_engine.LeagueDraft,
+    planned: list[tuple[uuid.UUID, uuid.UUID, bool]],
+) -> list[DraftPick]:
+    """Add the pick and roster rows for *planned*, numbered from the current pick."""
+    starter_slots = _nba_rules.default_roster_config()["starter_slots"]
+    now = datetime.now(timezone.utc)
+    counts: dict[uuid.UUID, int] = {}
+    picks = []
+    for offset, (agent_id, player_id, is_auto) in enumerate(planned):
+        pick_number = draft.current_pick + offset
+        pick = DraftPick(
+            league_id=draft.league_id,
+            agent_id=agent_id,
+            player_id=player_id,
+            pick_number=pick_number,
+            round_number=draft.round_for(pick_number),
+            is_auto_pick=is_auto,
+            created_at=now,
+        )
+        db.add(pick)
+        picks.append(pick)
+
+        # Assign roster slot
+        current_count = counts.setdefault(agent_id, draft.roster_count(agent_id))
+        counts[agent_id] += 1
+        if current_count < len(starter_slots):
+            slot = starter_slots[current_count]
+            is_starter = True
+        else:
+            slot = "BN"
+            is_starter = False
+
+        db.add(TeamPlayer(
+            team_id=draft.team_ids[agent_id],
+            league_id=draft.league_id,
+            player_id=player_id,
+            roster_slot=slot,
+            is_starter=is_starter,
+        ))
+    return picks
+
+
+async def pick_if_ready(db: AsyncSession, league_id: uuid.UUID) -> DraftPick | None:
+    """Pick at once for the agent on the clock if they have an available queued
+    player or are on autodraft. Returns None if they have to pick themselves."""
+    draft = await draft_engine.get_draft(db, league_id)
+    if not draft or not draft.is_active:
+        return None
+    agent_id = draft.current_agent()
+    player_id = draft.next_queued(agent_id)
+    expected = draft.current_pick
+    try:
+        if player_id is not None:
+            return await make_pick(db, league_id, agent_id, player_id, expected_pick=expected)
+        if agent_id in draft.autodraft:
+            return await auto_pick_for_current(db, league_id, expected)
+    except ValueError:
+        pass  # someone else picked first; their pick already chained ours
+    return None
+
+
+async def set_autodraft(
+    db: AsyncSession, league_id: uuid.UUID, agent_id: uuid.UUID, enabled: bool
+) -> None:
+    """Turn autodraft on or off for an agent; picks at once if they're on the clock.
+
+    Turning it off restarts the agent's run of missed picks from the current pick.
+    """
+    values = {"autodraft": enabled}
+    if not enabled:
+        values["missed_picks_from"] = (
+            select(DraftState.current_pick)
+            .where(DraftState.league_id == league_id)
+            .scalar_subquery()
+        )
+    await db.execute(
+        update(LeagueMembership)
+        .where(
+            and_(LeagueMembership.league_id == league_id, LeagueMembership.agent_id == agent_id)
+        )
+        .values(**values)
     )
-    if existing.scalar_one_or_none():
-        raise ValueError("Player already drafted")
+    version = await _bump_prefs_version(db, league_id)
+    await db.commit()
 
-    # Determine round number
-    num_teams = len(set(order))
-    round_number = ((draft_state.current_pick - 1) // num_teams) + 1
+    def apply(draft: draft_engine.LeagueDraft) -> None:
+        if enabled:
+            draft.autodraft.add(agent_id)
+        else:
+            draft.autodraft.discard(agent_id)
+            draft.missed_picks[agent_id] = 0
 
-    # Create pick
-    pick = DraftPick(
-        league_id=league_id,
-        agent_id=agent_id,
-        player_id=player_id,
-        pick_number=draft_state.current_pick,
-        round_number=round_number,
-        is_auto_pick=is_auto,
-    )
-    db.add(pick)
+    await _prefs_changed(db, league_id, version, apply)
 
-    # Add player to team
-    membership_result = await db.execute(
-        select(LeagueMembership).where(
-            and_(
-                LeagueMembership.league_id == league_id,
-                LeagueMembership.agent_id == agent_id,
-            )
+
+async def get_queue(
+    db: AsyncSession, league_id: uuid.UUID, agent_id: uuid.UUID
+) -> list[uuid.UUID]:
+    """An agent's draft queue for a league, minus players already rostered."""
+    result = await db.execute(
+        select(DraftQueue.player_ids).where(
+            and_(DraftQueue.league_id == league_id, DraftQueue.agent_id == agent_id)
         )
     )
-    membership = membership_result.scalar_one()
-    team_result = await db.execute(
-        select(Team).where(Team.membership_id == membership.id)
-    )
-    team = team_result.scalar_one()
+    player_ids = [uuid.UUID(p) for p in result.scalar_one_or_none() or []]
+    catalog = await player_pool.get_catalog(db)
+    owned = await player_pool.owned_mask(db, league_id)
+    return [
+        p for p in player_ids
+        if p not in catalog.index or not owned >> catalog.index[p] & 1
+    ]
 
-    # Assign roster slot
-    roster_config = _nba_rules.default_roster_config()
-    starter_slots = roster_config["starter_slots"]
-    current_players = await db.execute(
-        select(TeamPlayer).where(TeamPlayer.team_id == team.id)
-    )
-    current_count = len(current_players.scalars().all())
 
-    if current_count < len(starter_slots):
-        slot = starter_slots[current_count]
-        is_starter = True
-    else:
-        slot = "BN"
-        is_starter = False
-
-    db.add(TeamPlayer(
-        team_id=team.id,
-        player_id=player_id,
-        roster_slot=slot,
-        is_starter=is_starter,
-    ))
-
-    # Advance draft
-    draft_state.current_pick += 1
-    if draft_state.current_pick > draft_state.total_picks:
-        draft_state.status = "completed"
-        # Update league status
-        league_result = await db.execute(select(League).where(League.id == league_id))
-        league = league_result.scalar_one()
-        league.status = "active"
+async def set_queue(
+    db: AsyncSession,
+    league_id: uuid.UUID,
+    agent_id: uuid.UUID,
+    player_ids: list[uuid.UUID],
+) -> list[uuid.UUID]:
+    """Replace an agent's draft queue. Picks from it at once if they're on the clock."""
+    player_ids = list(dict.fromkeys(player_ids))
+    catalog = await player_pool.get_catalog(db)
+    unknown = [p for p in player_ids if p not in catalog.index]
+    if unknown:
+        raise ValueError(f"Unknown player: {unknown[0]}")
 
+    result = await db.execute(
+        select(DraftQueue).where(
+            and_(DraftQueue.league_id == league_id, DraftQueue.agent_id == agent_id)
+        )
+    )
+    queue = result.scalar_one_or_none()
+    stored = [str(p) for p in player_ids]
+    if queue is None:
+        db.add(DraftQueue(league_id=league_id, agent_id=agent_id, player_ids=stored))
+    else:
+        queue.player_ids = stored
+    version = await _bump_prefs_version(db, league_id)
     await db.commit()
-    await db.refresh(pick)
-    return pick
 
+    def apply(draft: draft_engine.LeagueDraft) -> None:
+        draft.queues[agent_id] = player_ids
+
+    await _prefs_changed(db, league_id, version, apply)
+    return await get_queue(db, league_id, agent_id)
+
+
+async def _bump_prefs_version(db: AsyncSession, league_id: uuid.UUID) -> int | None:
+    """Flag a queue or autodraft change to every worker's engine.
 
-async def auto_pick_for_current(db: AsyncSession, league_id: uuid.UUID) -> DraftPick:
-    """Auto-pick the best available player for whoever's turn it is."""
+    Returns the new ``prefs_version``, or None if the draft hasn't started.
+    """
     result = await db.execute(
-        select(DraftState).where(DraftState.league_id == league_id)
+        update(DraftState)
+        .where(DraftState.league_id == league_id)
+        # updated_at is when the current pick's clock started: leave it be
+        .values(prefs_version=DraftState.prefs_version + 1, updated_at=DraftState.updated_at)
+        .returning(DraftState.prefs_version)
     )
-    draft_state = result.scalar_one_or_none()
-    if not draft_state or draft_state.status != "in_progress":
-        raise ValueError("Draft is not in progress")
+    return result.scalar_one_or_none()
 
-    order = json.loads(draft_state.draft_order)
-    current_agent_id = uuid.UUID(order[draft_state.current_pick - 1])
 
-    # Get league sport
-    league_result = await db.execute(select(League).where(League.id == league_id))
-    league = league_result.scalar_one()
+async def _prefs_changed(
+    db: AsyncSession,
+    league_id: uuid.UUID,
+    version: int | None,
+    apply: Callable[[draft_engine.LeagueDraft], None],
+) -> None:
+    """Bring this worker's engine up to *version* and pick if that puts a pick in.
+
+    *apply* makes the change in place when the engine was current; otherwise
+    preferences also changed elsewhere and the draft is reloaded. Other
+    workers' engines resync when their next pick finds the newer version.
+    """
+    if version is None:
+        return  # engines load queues and autodraft flags when the draft starts
+    draft = draft_engine.peek(league_id)
+    if draft is not None:
+        async with draft.lock:
+            current = draft.prefs_version == version - 1
+            if current:
+                apply(draft)
+                draft.prefs_version = version
+        if not current:
+            await resync_draft(db, league_id)
+    await pick_if_ready(db, league_id)
+
+
+def announce_status(draft: draft_engine.LeagueDraft) -> None:
+    """Re-arm the pick clock, update the turn index and publish the draft's status."""
+    draft_clock.arm(draft.league_id, draft.pick_deadline)
+    if draft.is_active:
+        draft_turns.turns.set_turn(draft_turns.DraftTurn(
+            league_id=draft.league_id,
+            agent_id=draft.current_agent(),
+            pick_number=draft.current_pick,
+            round_number=draft.round_for(draft.current_pick),
+            deadline=draft.pick_deadline,
+        ))
+    else:
+        draft_turns.turns.clear_league(draft.league_id)
+    draft_events.hub.publish(draft.league_id, *draft_status_event(draft))
+
+
+def draft_status_event(draft: draft_engine.LeagueDraft) -> tuple[str, dict]:
+    """The ``on_the_clock`` event for the current pick, or ``draft_completed``."""
+    if not draft.is_active:
+        return "draft_completed", {
+            "league_id": draft.league_id,
+            "total_picks": draft.total_picks,
+        }
+    return "on_the_clock", {
+        "league_id": draft.league_id,
+        "agent_id": draft.current_agent(),
+        "pick_number": draft.current_pick,
+        "round_number": draft.round_for(draft.current_pick),
+        "deadline": draft.pick_deadline,
+    }
+
+
+async def auto_pick_for_current(
+    db: AsyncSession, league_id: uuid.UUID, expected_pick: int | None = None
+) -> DraftPick | None:
+    """Auto-pick the best-value available player for whoever's turn it is.
+
+    Pops the league's draft-ranking heap (value over positional replacement),
+    skipping players who don't fit the team's remaining starter slots. With
+    *expected_pick*, returns None if the draft turns out to be past that pick.
+    """
+    draft = await draft_engine.get_draft(db, league_id)
+    if not draft or not draft.is_active:
+        raise ValueError("Draft is not in progress")
 
-    available = await get_available_players(db, league_id, league.sport)
-    if not available:
+    current_agent_id = draft.current_agent()
+    ranking = await _draft_ranking(db, draft)
+    player_id = pop_best_fit(
+        draft.ranking_heap, ranking, draft.drafted, draft.rosters.get(current_agent_id, [])
+    )
+    if player_id is None:
         raise ValueError("No available players")
 
-    # Pick first available (they come back in DB order — good enough for auto-pick)
-    player = available[0]
-    return await make_pick(db, league_id, current_agent_id, player.id, is_auto=True)
+    return await make_pick(
+        db, league_id, current_agent_id, player_id, is_auto=True, expected_pick=expected_pick
+    )
+
+
+async def _draft_ranking(db: AsyncSession, draft: draft_engine.LeagueDraft) -> DraftRanking:
+    """The league's season ranking, building the draft's heap on first use."""
+    ranking = await get_season_ranking(
+        db, draft.sport, draft.season, draft.num_teams, draft.scoring_config
+    )
+    if draft.ranking_heap is None:
+        draft.ranking_heap = build_heap(ranking, draft.drafted)
+    return ranking
+
+
+async def auto_pick_if_expired(
+    db: AsyncSession, league_id: uuid.UUID, pick_number: int | None = None
+) -> DraftPick | None:
+    """Auto-pick if the current pick's timer has run out. Returns None otherwise.
+
+    With *pick_number*, the caller has already established (from the DB) that
+    this pick expired: the in-memory deadline is not re-checked, but nothing
+    happens if the draft has moved past that pick.
+    """
+    draft = await draft_engine.get_draft(db, league_id)
+    if not draft or not draft.is_active:
+        return None
+    if pick_number is None:
+        if draft.pick_deadline and draft.pick_deadline > datetime.now(timezone.utc):
+            # Someone picked since this deadline was armed
+            draft_clock.arm(league_id, draft.pick_deadline)
+            return None
+    elif draft.current_pick != pick_number:
+        return None
+
+    expected = draft.current_pick
+    try:
+        return await auto_pick_for_current(db, league_id, expected)
+    except ValueError:
+        live = draft_engine.peek(league_id)
+        if live is None or live.current_pick != expected:
+            return None  # another worker made this pick first
+        raise
 
 
 async def get_draft_state(db: AsyncSession, league_id: uuid.UUID) -> DraftState | None:
@@ -194,14 +598,67 @@ async def get_draft_state(db: AsyncSession, league_id: uuid.UUID) -> DraftState
     return result.scalar_one_or_none()
 
 
-async def get_available_players(
-    db: AsyncSession, league_id: uuid.UUID, sport: str = "nba"
-) -> list[Player]:
-    """Get players not yet drafted in this league."""
-    drafted = select(DraftPick.player_id).where(DraftPick.league_id == league_id)
+async def get_draft_board(
+    db: AsyncSession,
+    league_id: uuid.UUID,
+    first_round: list[uuid.UUID],
+    current_pick: int,
+    total_picks: int,
+    status: str,
+) -> DraftBoardResponse:
+    """The draft as a round x team grid, from one query over members, picks and players."""
     result = await db.execute(
-        select(Player).where(
-            and_(Player.sport == sport, Player.id.notin_(drafted))
+        select(
+            Agent.id.label("agent_id"),
+            Agent.name.label("agent_name"),
+            DraftPick.pick_number,
+            DraftPick.round_number,
+            DraftPick.is_auto_pick,
+            Player.id.label("player_id"),
+            Player.full_name,
+            Player.position,
+            Player.nba_team,
         )
+        .select_from(LeagueMembership)
+        .join(Agent, Agent.id == LeagueMembership.agent_id)
+        .outerjoin(
+            DraftPick,
+            and_(
+                DraftPick.league_id == LeagueMembership.league_id,
+                DraftPick.agent_id == LeagueMembership.agent_id,
+            ),
+        )
+        .outerjoin(Player, Player.id == DraftPick.player_id)
+        .where(LeagueMembership.league_id == league_id)
+    )
+
+    column = {agent_id: i for i, agent_id in enumerate(first_round)}
+    num_rounds = -(-total_picks // len(first_round)) if first_round else 0
+    rounds: list[list[DraftBoardCell | None]] = [
+        [None] * len(first_round) for _ in range(num_rounds)
+    ]
+    names: dict[uuid.UUID, str] = {}
+    for row in result.all():
+        names[row.agent_id] = row.agent_name
+        if row.pick_number is None or row.agent_id not in column:
+            continue
+        rounds[row.round_number - 1][column[row.agent_id]] = DraftBoardCell(
+            pick_number=row.pick_number,
+            player_id=row.player_id,
+            player_name=row.full_name,
+            position=row.position,
+            nba_team=row.nba_team,
+            is_auto_pick=row.is_auto_pick,
+        )
+
+    return DraftBoardResponse(
+        league_id=league_id,
+        status=status,
+        current_pick=current_pick,
+        total_picks=total_picks,
+        teams=[
+            DraftBoardTeam(agent_id=agent_id, agent_name=names.get(agent_id, ""))
+            for agent_id in first_round
+        ],
+        rounds=rounds,
     )
-    return result.scalars().all()
@@ -0,0 +1,171 @@
+"""Draft clock: auto-picks exactly when each league's pick timer runs out.
+
+Keeps a min-heap of per-league pick deadlines and sleeps until the earliest
+one, instead of polling every draft on a fixed interval. Re-arming a league
+(on every pick) pushes a fresh deadline; superseded heap entries are skipped
+lazily. Expired leagues are auto-picked concurrently, each in its own DB
+session, bounded by a semaphore so one slow league never delays the rest.
+"""
+
+import asyncio
+import heapq
+import logging
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import async_session
+from app.models.draft import DraftState
+from app.models.league import League
+
+logger = logging.getLogger(__name__)
+
+RETRY_DELAY_SECONDS = 30  # re-arm delay after a failed auto-pick
+
+
+class DraftClock:
+    def __init__(self, session_factory=async_session, concurrency: int | None = None):
+        self._session_factory = session_factory
+        self._concurrency = concurrency or settings.draft_clock_concurrency
+        self._heap: list[tuple[float, uuid.UUID]] = []
+        self._deadlines: dict[uuid.UUID, float] = {}
+        self._wakeup = asyncio.Event()
+        self._semaphore: asyncio.Semaphore | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    def arm(self, league_id: uuid.UUID, deadline: datetime) -> None:
+        """Schedule (or reschedule) a league's next auto-pick."""
+        ts = deadline.timestamp()
+        self._deadlines[league_id] = ts
+        heapq.heappush(self._heap, (ts, league_id))
+        self._wakeup.set()
+
+    def disarm(self, league_id: uuid.UUID) -> None:
+        self._deadlines.pop(league_id, None)
+
+    def deadline_for(self, league_id: uuid.UUID) -> float | None:
+        return self._deadlines.get(league_id)
+
+    def next_deadline(self) -> float | None:
+        """Earliest live deadline, discarding superseded heap entries."""
+        while self._heap:
+            ts, league_id = self._heap[0]
+            if self._deadlines.get(league_id) == ts:
+                return ts
+            heapq.heappop(self._heap)
+        return None
+
+    def pop_expired(self, now: float) -> list[uuid.UUID]:
+        expired = []
+        while (ts := self.next_deadline()) is not None and ts <= now:
+            _, league_id = heapq.heappop(self._heap)
+            del self._deadlines[league_id]
+            expired.append(league_id)
+        return expired
+
+    async def run(self) -> None:
+        """Sleep until the next deadline (or a re-arm), then fire expired leagues."""
+        while True:
+            self._wakeup.clear()
+            expired = self.pop_expired(time.time())
+            for league_id in expired:
+                task = asyncio.create_task(self.fire(league_id))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+
+            next_ts = self.next_deadline()
+            timeout = None if next_ts is None else max(next_ts - time.time(), 0)
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def fire(self, league_id: uuid.UUID, pick_number: int | None = None) -> dict:
+        """Auto-pick for a league whose timer ran out, in its own session.
+
+        With *pick_number*, the caller has already established (from the DB)
+        that this pick expired; see :func:`auto_pick_if_expired`.
+        """
+        from app.services.draft import auto_pick_if_expired
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._concurrency)
+        async with self._semaphore:
+            try:
+                async with self._session_factory() as db:
+                    pick = await auto_pick_if_expired(db, league_id, pick_number)
+            except Exception as e:
+                logger.exception("Auto-pick failed for league %s", league_id)
+                self.arm(
+                    league_id,
+                    datetime.now(timezone.utc) + timedelta(seconds=RETRY_DELAY_SECONDS),
+                )
+                return {"league_id": str(league_id), "error": str(e)}
+
+        if pick is None:
+            return {"league_id": str(league_id), "skipped": True}
+        logger.info(
+            "Auto-picked for league %s, pick #%d, agent %s",
+            league_id, pick.pick_number, pick.agent_id,
+        )
+        return {
+            "league_id": str(league_id),
+            "pick_number": pick.pick_number,
+            "agent_id": str(pick.agent_id),
+            "player_id": str(pick.player_id),
+        }
+
+    async def fire_many(self, expired: dict[uuid.UUID, int]) -> list[dict]:
+        """Fire every league in *expired* (league ID -> expired pick number)."""
+        return await asyncio.gather(*(self.fire(lid, pick) for lid, pick in expired.items()))
+
+    async def shutdown(self) -> None:
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+
+clock = DraftClock()
+
+
+def arm(league_id: uuid.UUID, deadline: datetime | None) -> None:
+    """Re-arm the shared clock for a league (disarm when there is no deadline)."""
+    if deadline is None:
+        clock.disarm(league_id)
+    else:
+        clock.arm(league_id, deadline)
+
+
+async def find_expired_drafts(
+    db: AsyncSession, timeout_override: int | None = None
+) -> dict[uuid.UUID, int]:
+    """Leagues whose current pick is past its timer, read from the DB.
+
+    Maps league ID to the expired pick number, so a pick the in-process clock
+    makes in the meantime isn't followed by a second auto-pick. Used by the
+    cron fallback, which may hit a worker whose clock never saw the league's
+    last pick.
+    """
+    result = await db.execute(
+        select(
+            DraftState.league_id,
+            DraftState.current_pick,
+            DraftState.updated_at,
+            League.pick_timeout_seconds,
+        )
+        .join(League, League.id == DraftState.league_id)
+        .where(DraftState.status == "in_progress")
+    )
+    now = datetime.now(timezone.utc)
+    expired = {}
+    for league_id, current_pick, updated_at, timeout in result.all():
+        if updated_at.tzinfo is None:
+            updated_at = updated_at.replace(tzinfo=timezone.utc)
+        seconds = timeout_override if timeout_override is not None else timeout
+        if updated_at + timedelta(seconds=seconds) <= now:
+            expired[league_id] = current_pick
+    return expired
@@ -0,0 +1,247 @@
+"""In-memory draft engine: keeps each active draft's state hot between picks.
+
+Per league we hold the first-round order, the current pick, the set of drafted
+players, per-team rosters and each agent's draft queue, so a pick is validated without touching
+the database and persisted with a single small write transaction. State is
+rebuilt from ``draft_states`` + ``draft_picks`` on startup, and lazily on a
+cache miss. ``draft_states.prefs_version`` tells a worker when queues or
+autodraft flags were changed through another worker.
+"""
+
+import asyncio
+import logging
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.draft import DraftPick, DraftQueue, DraftState
+from app.models.league import League, LeagueMembership
+from app.models.team import Team
+from app.services import draft_order
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class LeagueDraft:
+    league_id: uuid.UUID
+    first_round: list[uuid.UUID]  # agent IDs in round-one pick order
+    current_pick: int
+    total_picks: int
+    status: str
+    draft_type: str = "snake"
+    sport: str = "nba"
+    season: str = "2025-26"
+    scoring_config: dict[str, float] = field(default_factory=dict)
+    pick_timeout_seconds: int = 60
+    pick_deadline: datetime | None = None  # when the current pick gets auto-picked
+    prefs_version: int = 0  # the DraftState.prefs_version queues and autodraft match
+    drafted: set[uuid.UUID] = field(default_factory=set)
+    team_ids: dict[uuid.UUID, uuid.UUID] = field(default_factory=dict)  # agent -> team
+    rosters: dict[uuid.UUID, list[uuid.UUID]] = field(default_factory=dict)  # agent -> players
+    queues: dict[uuid.UUID, list[uuid.UUID]] = field(default_factory=dict)  # agent -> wish list
+    autodraft: set[uuid.UUID] = field(default_factory=set)  # agents picked for instantly
+    missed_picks: dict[uuid.UUID, int] = field(default_factory=dict)  # consecutive auto-picks
+    ranking_heap: list[tuple[int, uuid.UUID]] | None = field(default=None, repr=False)
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False)
+
+    @property
+    def num_teams(self) -> int:
+        return len(self.first_round)
+
+    @property
+    def order(self) -> list[uuid.UUID]:
+        """The agent for every pick, expanded on demand."""
+        return draft_order.expand(self.first_round, self.total_picks, self.draft_type)
+
+    @property
+    def is_active(self) -> bool:
+        return self.status == "in_progress"
+
+    def current_agent(self) -> uuid.UUID | None:
+        if not self.is_active or self.current_pick > self.total_picks:
+            return None
+        return self.agent_for(self.current_pick)
+
+    def agent_for(self, pick_number: int) -> uuid.UUID:
+        return draft_order.agent_for_pick(self.first_round, pick_number, self.draft_type)
+
+    def roster_count(self, agent_id: uuid.UUID) -> int:
+        return len(self.rosters.get(agent_id, ()))
+
+    def next_queued(
+        self, agent_id: uuid.UUID, exclude: set[uuid.UUID] = frozenset()
+    ) -> uuid.UUID | None:
+        """The agent's highest-queued player still available (and not in *exclude*)."""
+        for player_id in self.queues.get(agent_id, ()):
+            if player_id not in self.drafted and player_id not in exclude:
+                return player_id
+        return None
+
+    def round_for(self, pick_number: int) -> int:
+        return draft_order.round_for_pick(pick_number, self.num_teams)
+
+    def start_clock(self, now: datetime | None = None) -> None:
+        """Start the pick clock for the agent now on the clock."""
+        now = now or datetime.now(timezone.utc)
+        self.pick_deadline = now + timedelta(seconds=self.pick_timeout_seconds)
+
+    def record_pick(self, agent_id: uuid.UUID, player_id: uuid.UUID, is_auto: bool = False) -> None:
+        """Apply a committed pick to the in-memory state."""
+        self.drafted.add(player_id)
+        self.rosters.setdefault(agent_id, []).append(player_id)
+        self.missed_picks[agent_id] = self.missed_picks.get(agent_id, 0) + 1 if is_auto else 0
+        self.current_pick += 1
+        if self.current_pick > self.total_picks:
+            self.status = "completed"
+            self.pick_deadline = None
+        else:
+            self.start_clock()
+
+
+_drafts: dict[uuid.UUID, LeagueDraft] = {}
+
+
+async def get_draft(db: AsyncSession, league_id: uuid.UUID) -> LeagueDraft | None:
+    """Return the in-memory draft for a league, loading it on a cache miss."""
+    draft = _drafts.get(league_id)
+    if draft is not None:
+        return draft
+    return await load_draft(db, league_id)
+
+
+def peek(league_id: uuid.UUID) -> LeagueDraft | None:
+    """The in-memory draft for a league, without loading it."""
+    return _drafts.get(league_id)
+
+
+async def load_draft(db: AsyncSession, league_id: uuid.UUID) -> LeagueDraft | None:
+    """(Re)build one league's draft from the database."""
+    result = await db.execute(
+        select(DraftState)
+        .where(DraftState.league_id == league_id)
+        .execution_options(populate_existing=True)  # a resync must not reuse stale rows
+    )
+    state = result.scalar_one_or_none()
+    if not state:
+        return None
+    drafts = await _build(db, [state])
+    return drafts[0]
+
+
+async def rebuild_all(db: AsyncSession) -> int:
+    """Rebuild every in-progress draft from ``draft_picks``. Returns count loaded."""
+    result = await db.execute(
+        select(DraftState).where(DraftState.status == "in_progress")
+    )
+    states = result.scalars().all()
+    if not states:
+        return 0
+    drafts = await _build(db, states)
+    logger.info("Draft engine rebuilt %d in-progress drafts", len(drafts))
+    return len(drafts)
+
+
+def active_drafts() -> list[LeagueDraft]:
+    """Every draft currently held in memory (all in progress)."""
+    return list(_drafts.values())
+
+
+def evict(league_id: uuid.UUID) -> None:
+    """Drop a league's cached draft so the next access reloads it."""
+    _drafts.pop(league_id, None)
+
+
+async def _build(db: AsyncSession, states: list[DraftState]) -> list[LeagueDraft]:
+    league_ids = [s.league_id for s in states]
+
+    leagues_result = await db.execute(
+        select(
+            League.id,
+            League.sport,
+            League.season,
+            League.scoring_config,
+            League.pick_timeout_seconds,
+        ).where(League.id.in_(league_ids))
+    )
+    leagues = {row.id: row for row in leagues_result.all()}
+    picks_result = await db.execute(
+        select(
+            DraftPick.league_id,
+            DraftPick.agent_id,
+            DraftPick.player_id,
+            DraftPick.pick_number,
+            DraftPick.is_auto_pick,
+        )
+        .where(DraftPick.league_id.in_(league_ids))
+        .order_by(DraftPick.pick_number)
+    )
+    teams_result = await db.execute(
+        select(
+            LeagueMembership.league_id,
+            LeagueMembership.agent_id,
+            LeagueMembership.autodraft,
+            LeagueMembership.missed_picks_from,
+            Team.id,
+        )
+        .join(Team, Team.membership_id == LeagueMembership.id)
+        .where(LeagueMembership.league_id.in_(league_ids))
+    )
+    queues_result = await db.execute(
+        select(DraftQueue.league_id, DraftQueue.agent_id, DraftQueue.player_ids)
+        .where(DraftQueue.league_id.in_(league_ids))
+    )
+
+    drafts: dict[uuid.UUID, LeagueDraft] = {}
+    for state in states:
+        league = leagues[state.league_id]
+        drafts[state.league_id] = LeagueDraft(
+            league_id=state.league_id,
+            first_round=draft_order.loads(state.draft_order),
+            current_pick=state.current_pick,
+            total_picks=state.total_picks,
+            status=state.status,
+            draft_type=state.draft_type,
+            sport=league.sport,
+            season=league.season,
+            scoring_config=league.scoring_config or {},
+            pick_timeout_seconds=league.pick_timeout_seconds,
+            prefs_version=state.prefs_version,
+        )
+        # The clock for the current pick started when the last pick advanced the state
+        last_change = state.updated_at or datetime.now(timezone.utc)
+        if last_change.tzinfo is None:
+            last_change = last_change.replace(tzinfo=timezone.utc)
+        if drafts[state.league_id].is_active:
+            drafts[state.league_id].start_clock(last_change)
+
+    missed_from: dict[tuple[uuid.UUID, uuid.UUID], int] = {}
+    for league_id, agent_id, autodraft, missed_picks_from, team_id in teams_result.all():
+        drafts[league_id].team_ids[agent_id] = team_id
+        if autodraft:
+            drafts[league_id].autodraft.add(agent_id)
+        if missed_picks_from is not None:
+            missed_from[league_id, agent_id] = missed_picks_from
+
+    for league_id, agent_id, player_ids in queues_result.all():
+        drafts[league_id].queues[agent_id] = [uuid.UUID(p) for p in player_ids]
+
+    for league_id, agent_id, player_id, pick_number, is_auto in picks_result.all():
+        draft = drafts[league_id]
+        draft.drafted.add(player_id)
+        draft.rosters.setdefault(agent_id, []).append(player_id)
+        # A run of misses ends at a manual pick, or when the agent turned autodraft off
+        missed = is_auto and pick_number >= missed_from.get((league_id, agent_id), 0)
+        draft.missed_picks[agent_id] = draft.missed_picks.get(agent_id, 0) + 1 if missed else 0
+
+    for draft in drafts.values():
+        # Only active drafts are kept hot; finished ones are served from the DB
+        if draft.is_active:
+            _drafts[draft.league_id] = draft
+        else:
+            _drafts.pop(draft.league_id, None)
+
+    return list(drafts.values())
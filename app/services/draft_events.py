@@ -0,0 +1,59 @@
+"""In-process pub/sub hub for live draft events.
+
+Subscribers (one SSE connection each) get a bounded queue per league. The
+draft service publishes ``pick_made``, ``on_the_clock`` and ``draft_completed``
+after each committed pick, so agents hold one long-lived connection instead
+of polling ``GET /draft``. A subscriber that falls behind loses its oldest
+events rather than blocking publishers.
+"""
+
+import asyncio
+import json
+import uuid
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Any
+
+QUEUE_SIZE = 100
+
+
+class DraftEventHub:
+    def __init__(self):
+        self._subscribers: dict[uuid.UUID, set[asyncio.Queue]] = {}
+
+    def publish(self, league_id: uuid.UUID, event: str, data: dict[str, Any]) -> None:
+        for queue in self._subscribers.get(league_id, ()):
+            if queue.full():
+                queue.get_nowait()  # drop the oldest event for slow consumers
+            queue.put_nowait((event, data))
+
+    @asynccontextmanager
+    async def subscribe(self, league_id: uuid.UUID) -> AsyncIterator[asyncio.Queue]:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+        self._subscribers.setdefault(league_id, set()).add(queue)
+        try:
+            yield queue
+        finally:
+            subscribers = self._subscribers.get(league_id)
+            if subscribers is not None:
+                subscribers.discard(queue)
+                if not subscribers:
+                    del self._subscribers[league_id]
+
+    def subscriber_count(self, league_id: uuid.UUID) -> int:
+        return len(self._subscribers.get(league_id, ()))
+
+
+hub = DraftEventHub()
+
+
+def format_sse(event: str, data: dict[str, Any]) -> str:
+    """Serialize one event in text/event-stream format."""
+    return f"event: {event}\ndata: {json.dumps(data, default=_json_default)}\n\n"
+
+
+def _json_default(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
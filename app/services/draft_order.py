@@ -0,0 +1,53 @@
+"""Draft pick order, computed from the first-round order.
+
+Only the round-one order is stored (``draft_states.draft_order``); the agent
+for any pick number follows arithmetically from the draft type, so nothing
+has to hold or parse the full teams x rounds list.
+"""
+
+import json
+import uuid
+
+DRAFT_TYPES = ("snake", "linear", "third_round_reversal")
+
+
+def round_for_pick(pick_number: int, num_teams: int) -> int:
+    return ((pick_number - 1) // num_teams) + 1
+
+
+def is_reversed(round_number: int, draft_type: str = "snake") -> bool:
+    """Whether a round runs last-to-first."""
+    if draft_type == "linear":
+        return False
+    if draft_type == "snake":
+        return round_number % 2 == 0
+    if draft_type == "third_round_reversal":
+        # 1-n, n-1, n-1, then snaking again: 1-n, n-1, ...
+        return round_number == 2 or (round_number >= 3 and round_number % 2 == 1)
+    raise ValueError(f"Unsupported draft type: {draft_type}")
+
+
+def agent_for_pick(
+    first_round: list[uuid.UUID], pick_number: int, draft_type: str = "snake"
+) -> uuid.UUID:
+    num_teams = len(first_round)
+    round_number = round_for_pick(pick_number, num_teams)
+    slot = (pick_number - 1) % num_teams
+    if is_reversed(round_number, draft_type):
+        slot = num_teams - 1 - slot
+    return first_round[slot]
+
+
+def expand(
+    first_round: list[uuid.UUID], total_picks: int, draft_type: str = "snake"
+) -> list[uuid.UUID]:
+    """The agent for every pick, for API responses that list the full order."""
+    return [agent_for_pick(first_round, n, draft_type) for n in range(1, total_picks + 1)]
+
+
+def dumps(first_round: list[uuid.UUID]) -> str:
+    return json.dumps([str(agent_id) for agent_id in first_round])
+
+
+def loads(draft_order: str) -> list[uuid.UUID]:
+    return [uuid.UUID(x) for x in json.loads(draft_order)]
@@ -0,0 +1,159 @@
+"""Season draft rankings: projected fantasy points adjusted for positional scarcity.
+
+A player's draft value is their projected fantasy points minus the
+replacement level at their scarcest eligible position. Replacement level
+for a position is the projection of the N-th best player there, where N is
+how many starter slots league-wide that position can be expected to fill
+(dedicated slots plus its share of G/F/UTIL flex slots).
+"""
+
+import heapq
+import math
+import uuid
+from dataclasses import dataclass, field
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.player import Player
+from app.services.cache import cached
+from app.sports.nba import NBARules
+
+_nba_rules = NBARules()
+
+RANKING_TTL_SECONDS = 6 * 60 * 60  # season stats only change nightly
+
+
+@dataclass
+class DraftRanking:
+    player_ids: list[uuid.UUID]  # best first
+    values: dict[uuid.UUID, float] = field(default_factory=dict)
+    positions: dict[uuid.UUID, str] = field(default_factory=dict)
+
+
+async def get_season_ranking(
+    db: AsyncSession,
+    sport: str,
+    season: str,
+    num_teams: int,
+    scoring_config: dict[str, float] | None = None,
+) -> DraftRanking:
+    """Return the (cached) draft ranking for a season and league size."""
+    scoring = scoring_config or _nba_rules.default_scoring_config()
+
+    async def _fetch() -> DraftRanking:
+        result = await db.execute(
+            select(Player.id, Player.position, Player.season_stats).where(
+                Player.sport == sport
+            )
+        )
+        return rank_players(result.all(), scoring, num_teams)
+
+    key = f"draft:ranking:{sport}:{season}:{num_teams}:{sorted(scoring.items())}"
+    return await cached(key, RANKING_TTL_SECONDS, _fetch)
+
+
+def rank_players(
+    players: list[tuple[uuid.UUID, str, dict]],
+    scoring_config: dict[str, float],
+    num_teams: int,
+) -> DraftRanking:
+    """Rank (id, position, season_stats) rows by value over positional replacement."""
+    starter_slots = _nba_rules.default_roster_config()["starter_slots"]
+    base_positions = _nba_rules.valid_positions()
+
+    projected = {
+        pid: _nba_rules.calculate_fantasy_points(stats or {}, scoring_config)
+        for pid, _, stats in players
+    }
+    positions = {pid: position for pid, position, _ in players}
+
+    # Expected starter demand per base position across the league
+    demand: dict[str, float] = {pos: 0.0 for pos in base_positions}
+    for slot in starter_slots:
+        eligible = [pos for pos in base_positions if _nba_rules.position_eligible(pos, slot)]
+        for pos in eligible:
+            demand[pos] += 1 / len(eligible)
+
+    replacement: dict[str, float] = {}
+    for pos in base_positions:
+        pool = sorted(
+            (projected[pid] for pid in projected
+             if _nba_rules.position_eligible(positions[pid], _base_slot(pos))),
+            reverse=True,
+        )
+        cutoff = math.ceil(demand[pos] * max(num_teams, 1))
+        replacement[pos] = pool[min(cutoff, len(pool)) - 1] if pool else 0.0
+
+    values: dict[uuid.UUID, float] = {}
+    for pid, pts in projected.items():
+        eligible = [
+            replacement[pos] for pos in base_positions
+            if _nba_rules.position_eligible(positions[pid], _base_slot(pos))
+        ]
+        values[pid] = round(pts - (min(eligible) if eligible else 0.0), 2)
+
+    ordered = sorted(values, key=lambda pid: (-values[pid], -projected[pid], str(pid)))
+    return DraftRanking(player_ids=ordered, values=values, positions=positions)
+
+
+def build_heap(ranking: DraftRanking, drafted: set[uuid.UUID]) -> list[tuple[int, uuid.UUID]]:
+    """Heap of (rank, player_id) for undrafted players. A sorted list is a valid heap."""
+    return [(rank, pid) for rank, pid in enumerate(ranking.player_ids) if pid not in drafted]
+
+
+def pop_best_fit(
+    heap: list[tuple[int, uuid.UUID]],
+    ranking: DraftRanking,
+    drafted: set[uuid.UUID],
+    roster: list[uuid.UUID],
+) -> uuid.UUID | None:
+    """Best-ranked undrafted player who fits one of the team's open starter slots.
+
+    Drafted players are dropped from the heap as they surface (lazy deletion).
+    Skipped and chosen entries are pushed back, so a failed pick loses nothing.
+    Falls back to the best available player when nobody fits an open slot.
+    """
+    open_slots = open_starter_slots([ranking.positions.get(pid, "") for pid in roster])
+    popped: list[tuple[int, uuid.UUID]] = []
+    choice = None
+    while heap:
+        entry = heapq.heappop(heap)
+        pid = entry[1]
+        if pid in drafted:
+            continue
+        popped.append(entry)
+        position = ranking.positions.get(pid, "")
+        if not open_slots or any(_nba_rules.position_eligible(position, s) for s in open_slots):
+            choice = pid
+            break
+
+    if choice is None and popped:
+        choice = popped[0][1]
+    for entry in popped:
+        heapq.heappush(heap, entry)
+    return choice
+
+
+def open_starter_slots(roster_positions: list[str]) -> list[str]:
+    """Starter slots left unfilled after greedily seating the given positions."""
+    open_slots = list(_nba_rules.default_roster_config()["starter_slots"])
+    # Seat the least flexible players first, each in the most specific slot
+    by_flexibility = sorted(
+        roster_positions,
+        key=lambda p: sum(_nba_rules.position_eligible(p, s) for s in open_slots),
+    )
+    for position in by_flexibility:
+        fits = [s for s in open_slots if _nba_rules.position_eligible(position, s)]
+        if fits:
+            open_slots.remove(min(fits, key=_slot_breadth))
+    return open_slots
+
+
+def _slot_breadth(slot: str) -> int:
+    return sum(_nba_rules.position_eligible(p, slot) for p in _nba_rules.valid_positions())
+
+
+def _base_slot(position: str) -> str:
+    """The dedicated roster slot for a base position ("nba:PG" -> "PG")."""
+    return position.split(":", 1)[-1]
@@ -0,0 +1,74 @@
+"""In-memory index of which agents are on the clock, for long-polling.
+
+Maintained by the draft service on every draft start and pick, so
+``/agents/me/draft-turns`` can answer (or block until) "is it my turn in any
+league?" without touching the database.
+"""
+
+import asyncio
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class DraftTurn:
+    league_id: uuid.UUID
+    agent_id: uuid.UUID
+    pick_number: int
+    round_number: int
+    deadline: datetime | None
+
+
+class DraftTurnIndex:
+    def __init__(self):
+        self._by_agent: dict[uuid.UUID, dict[uuid.UUID, DraftTurn]] = {}
+        self._by_league: dict[uuid.UUID, DraftTurn] = {}
+        self._waiters: dict[uuid.UUID, set[asyncio.Event]] = {}
+
+    def set_turn(self, turn: DraftTurn) -> None:
+        """Put *turn.agent_id* on the clock in a league, replacing the previous agent."""
+        self.clear_league(turn.league_id)
+        self._by_league[turn.league_id] = turn
+        self._by_agent.setdefault(turn.agent_id, {})[turn.league_id] = turn
+        for event in self._waiters.get(turn.agent_id, ()):
+            event.set()
+
+    def clear_league(self, league_id: uuid.UUID) -> None:
+        previous = self._by_league.pop(league_id, None)
+        if previous is None:
+            return
+        turns = self._by_agent.get(previous.agent_id)
+        if turns is not None:
+            turns.pop(league_id, None)
+            if not turns:
+                del self._by_agent[previous.agent_id]
+
+    def turns_for(self, agent_id: uuid.UUID) -> list[DraftTurn]:
+        return sorted(
+            self._by_agent.get(agent_id, {}).values(),
+            key=lambda t: (t.deadline is None, t.deadline or datetime.max),
+        )
+
+    async def wait_for_turns(self, agent_id: uuid.UUID, timeout: float) -> list[DraftTurn]:
+        """Return the agent's turns, waiting up to *timeout* seconds for one."""
+        turns = self.turns_for(agent_id)
+        if turns or timeout <= 0:
+            return turns
+
+        event = asyncio.Event()
+        self._waiters.setdefault(agent_id, set()).add(event)
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            waiters = self._waiters.get(agent_id)
+            if waiters is not None:
+                waiters.discard(event)
+                if not waiters:
+                    del self._waiters[agent_id]
+        return self.turns_for(agent_id)
+
+
+turns = DraftTurnIndex()
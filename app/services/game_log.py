@@ -0,0 +1,152 @@
+"""League game log: per-team, per-day fantasy points of each team's starters.
+
+Days are windowed (``from``/``to``/``limit_days``), team totals come from one
+``GROUP BY team, game_date`` query, and per-player breakdowns are fetched only
+for the days returned. A finished day never changes for a given set of
+starters, so it is cached per league and day, tagged with a digest of the
+league's current starters. :func:`invalidate` drops a league's days when its
+rosters change; the digest catches lineup changes made by other workers.
+"""
+
+import uuid
+from datetime import date, timedelta
+from typing import Any
+
+from sqlalchemy import and_, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.player import Player, PlayerGameLog
+from app.models.team import TeamPlayer
+from app.services import cache, rosters
+
+FINISHED_DAY_TTL_SECONDS = 30 * 24 * 60 * 60  # effectively permanent
+
+_cached_days: dict[uuid.UUID, set[date]] = {}
+
+
+async def league_game_log(
+    db: AsyncSession,
+    league_id: uuid.UUID,
+    season: str,
+    from_date: date | None = None,
+    to_date: date | None = None,
+    limit_days: int | None = None,
+) -> list[dict[str, Any]]:
+    """Each team's daily scores for the game days in range (the latest
+    *limit_days* of them, if given)."""
+    teams = await rosters.league_rosters(db, league_id)
+    starters = {
+        t["team_id"]: sorted(p["id"] for p in t["roster"] if p["is_starter"])
+        for t in teams if t["team_id"]
+    }
+    version = cache.make_etag(
+        *sorted(f"{team}:{','.join(ids)}" for team, ids in starters.items())
+    )
+
+    in_range = [
+        TeamPlayer.league_id == league_id,
+        TeamPlayer.is_starter.is_(True),
+        PlayerGameLog.season == season,
+    ]
+    if from_date:
+        in_range.append(PlayerGameLog.game_date >= from_date)
+    if to_date:
+        in_range.append(PlayerGameLog.game_date <= to_date)
+    days_query = (
+        select(PlayerGameLog.game_date)
+        .join(TeamPlayer, TeamPlayer.player_id == PlayerGameLog.player_id)
+        .where(and_(*in_range))
+        .group_by(PlayerGameLog.game_date)
+        .order_by(PlayerGameLog.game_date.desc())
+    )
+    if limit_days is not None:
+        days_query = days_query.limit(limit_days)
+    days = list((await db.execute(days_query)).scalars())
+
+    # A day is final once the following day's stats have been ingested
+    finished_before = date.today() - timedelta(days=1)
+    by_day: dict[date, dict[str, dict]] = {}
+    missing = []
+    for day in days:
+        hit = cache.get(_key(league_id, day)) if day < finished_before else None
+        if hit is None or hit[0] != version:
+            missing.append(day)
+        else:
+            by_day[day] = hit[1]
+
+    if missing:
+        fetched = await _load_days(db, league_id, season, missing)
+        for day in missing:
+            by_day[day] = fetched.get(day, {})
+            if day < finished_before:
+                cache.put(_key(league_id, day), (version, by_day[day]), FINISHED_DAY_TTL_SECONDS)
+                _cached_days.setdefault(league_id, set()).add(day)
+
+    return [
+        {
+            "agent_name": t["agent_name"],
+            "agent_id": t["agent_id"],
+            "daily_scores": [
+                {"date": day.isoformat(), **by_day[day][t["team_id"]]}
+                for day in days if t["team_id"] in by_day[day]
+            ],
+        }
+        for t in teams
+    ]
+
+
+def invalidate(league_id: uuid.UUID) -> None:
+    """Drop a league's cached days (its starters changed)."""
+    for day in _cached_days.pop(league_id, ()):
+        cache.invalidate(_key(league_id, day))
+
+
+def _key(league_id: uuid.UUID, day: date) -> str:
+    return f"league:game-log:{league_id}:{day.isoformat()}"
+
+
+async def _load_days(
+    db: AsyncSession, league_id: uuid.UUID, season: str, days: list[date]
+) -> dict[date, dict[str, dict]]:
+    """day -> team_id -> {"points", "players"} for the given days."""
+    where = and_(
+        TeamPlayer.league_id == league_id,
+        TeamPlayer.is_starter.is_(True),
+        PlayerGameLog.season == season,
+        PlayerGameLog.game_date.in_(days),
+    )
+    totals_result = await db.execute(
+        select(
+            TeamPlayer.team_id,
+            PlayerGameLog.game_date,
+            func.coalesce(func.sum(PlayerGameLog.fantasy_points), 0),
+        )
+        .join(TeamPlayer, TeamPlayer.player_id == PlayerGameLog.player_id)
+        .where(where)
+        .group_by(TeamPlayer.team_id, PlayerGameLog.game_date)
+    )
+    by_day: dict[date, dict[str, dict]] = {}
+    for team_id, day, points in totals_result.all():
+        by_day.setdefault(day, {})[str(team_id)] = {
+            "points": round(float(points), 2),
+            "players": [],
+        }
+
+    players_result = await db.execute(
+        select(
+            TeamPlayer.team_id,
+            PlayerGameLog.game_date,
+            Player.full_name,
+            PlayerGameLog.fantasy_points,
+        )
+        .join(TeamPlayer, TeamPlayer.player_id == PlayerGameLog.player_id)
+        .join(Player, Player.id == PlayerGameLog.player_id)
+        .where(where)
+        .order_by(PlayerGameLog.fantasy_points.desc())
+    )
+    for team_id, day, name, points in players_result.all():
+        by_day[day][str(team_id)]["players"].append({
+            "name": name,
+            "points": float(points) if points else 0,
+        })
+    return by_day
@@ -0,0 +1,231 @@
+"""Lineup optimizer: best legal assignment of a roster to the starter slots.
+
+Slots and players form a bipartite graph, with an edge wherever the player
+is eligible for the slot, weighted by the player's projected points. The
+maximum-weight matching is solved as an assignment problem (Hungarian
+algorithm); a team has at most a few dozen players, so this is cheap enough
+to run for every auto-managed team in one nightly pass.
+"""
+
+import logging
+import uuid
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import and_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.league import League, LeagueMembership
+from app.models.player import Player
+from app.models.team import Team, TeamPlayer
+from app.services import rosters
+from app.sports.nba import NBARules
+
+logger = logging.getLogger(__name__)
+
+_nba_rules = NBARules()
+
+BENCH_SLOT = "BN"
+_BLOCKED = 1e9  # cost of seating a player in a slot they aren't eligible for
+_KEEP_BONUS = 1e-6  # prefer the current slot when two lineups score the same
+
+
+@dataclass
+class LineupPlayer:
+    player_id: uuid.UUID
+    position: str
+    projected: float
+    roster_slot: str
+    row_id: uuid.UUID | None = None  # team_players.id
+
+
+def project(season_stats: dict[str, Any] | None, status: str, scoring_config: dict) -> float:
+    """Projected fantasy points per game; players ruled out project to zero."""
+    if status == "out":
+        return 0.0
+    return _nba_rules.calculate_fantasy_points(season_stats or {}, scoring_config)
+
+
+def optimal_lineup(players: list[LineupPlayer], starter_slots: list[str]) -> dict[uuid.UUID, str]:
+    """Map every player to a starter slot or the bench, maximizing projected points.
+
+    A slot is left empty rather than filled by an ineligible player.
+    """
+    num_slots = len(starter_slots)
+    cost = []
+    for slot in starter_slots:
+        row = [
+            -p.projected - (_KEEP_BONUS if p.roster_slot == slot else 0.0)
+            if _nba_rules.position_eligible(p.position, slot) else _BLOCKED
+            for p in players
+        ]
+        cost.append(row + [0.0] * num_slots)  # dummy columns: leave the slot empty
+    assignment = _min_cost_assignment(cost)
+
+    lineup = {p.player_id: BENCH_SLOT for p in players}
+    for slot_index, column in enumerate(assignment):
+        if column < len(players) and cost[slot_index][column] < _BLOCKED:
+            lineup[players[column].player_id] = starter_slots[slot_index]
+    return lineup
+
+
+def _min_cost_assignment(cost: list[list[float]]) -> list[int]:
+    """Hungarian algorithm: the column assigned to each row, for rows <= columns."""
+    n, m = len(cost), len(cost[0])
+    u = [0.0] * (n + 1)
+    v = [0.0] * (m + 1)
+    match = [0] * (m + 1)  # column -> row (1-based; 0 = free)
+    way = [0] * (m + 1)
+    for row in range(1, n + 1):
+        match[0] = row
+        col = 0
+        min_slack = [float("inf")] * (m + 1)
+        used = [False] * (m + 1)
+        while True:
+            used[col] = True
+            current, delta, next_col = match[col], float("inf"), 0
+            for j in range(1, m + 1):
+                if used[j]:
+                    continue
+                slack = cost[current - 1][j - 1] - u[current] - v[j]
+                if slack < min_slack[j]:
+                    min_slack[j], way[j] = slack, col
+                if min_slack[j] < delta:
+                    delta, next_col = min_slack[j], j
+            for j in range(m + 1):
+                if used[j]:
+                    u[match[j]] += delta
+                    v[j] -= delta
+                else:
+                    min_slack[j] -= delta
+            col = next_col
+            if match[col] == 0:
+                break
+        while col:
+            previous = way[col]
+            match[col] = match[previous]
+            col = previous
+
+    assignment = [0] * n
+    for j in range(1, m + 1):
+        if match[j]:
+            assignment[match[j] - 1] = j - 1
+    return assignment
+
+
+@dataclass
+class LineupResult:
+    players: list[LineupPlayer]
+    changed: int
+
+    @property
+    def projected_points(self) -> float:
+        return round(sum(p.projected for p in self.players if p.roster_slot != BENCH_SLOT), 2)
+
+
+async def optimize_lineup(
+    db: AsyncSession, league_id: uuid.UUID, agent_id: uuid.UUID, apply: bool = True
+) -> LineupResult:
+    """Compute (and unless *apply* is false, save) one team's best lineup."""
+    teams = await _load_teams(
+        db,
+        and_(LeagueMembership.league_id == league_id, LeagueMembership.agent_id == agent_id),
+    )
+    if not teams:
+        raise ValueError("No roster in this league")
+    result, changes = _plan(*next(iter(teams.values())))
+    if apply and changes:
+        await db.execute(update(TeamPlayer), changes)
+        await db.commit()
+        rosters.invalidate(league_id)
+    return result
+
+
+async def optimize_auto_lineups(db: AsyncSession) -> dict[str, int]:
+    """Re-optimize every auto-managed team in a league in season, in one pass.
+
+    Rosters are loaded in one query and every changed slot is written in one
+    bulk update.
+    """
+    teams = await _load_teams(
+        db,
+        and_(
+            LeagueMembership.auto_lineup.is_(True),
+            League.status.in_(("active", "playoffs")),
+        ),
+    )
+    changes = []
+    changed_leagues = set()
+    for config, players in teams.values():
+        team_changes = _plan(config, players)[1]
+        if team_changes:
+            changes.extend(team_changes)
+            changed_leagues.add(config["league_id"])
+    if changes:
+        await db.execute(update(TeamPlayer), changes)
+    await db.commit()
+    for league_id in changed_leagues:
+        rosters.invalidate(league_id)
+    return {"teams": len(teams), "changed": len(changes)}
+
+
+async def run_scheduled_lineups() -> None:
+    """Scheduler entry: re-optimize auto-managed lineups in a fresh session."""
+    from app.database import async_session
+
+    async with async_session() as db:
+        totals = await optimize_auto_lineups(db)
+    if totals["changed"]:
+        logger.info("Optimized lineups: %s", totals)
+
+
+async def _load_teams(db: AsyncSession, where) -> dict[uuid.UUID, tuple[dict, list[LineupPlayer]]]:
+    result = await db.execute(
+        select(
+            Team.id,
+            League.id.label("league_id"),
+            League.scoring_config,
+            League.roster_config,
+            TeamPlayer.id.label("row_id"),
+            TeamPlayer.player_id,
+            TeamPlayer.roster_slot,
+            Player.position,
+            Player.status,
+            Player.season_stats,
+        )
+        .join(LeagueMembership, LeagueMembership.id == Team.membership_id)
+        .join(League, League.id == LeagueMembership.league_id)
+        .join(TeamPlayer, TeamPlayer.team_id == Team.id)
+        .join(Player, Player.id == TeamPlayer.player_id)
+        .where(where)
+    )
+    defaults = _nba_rules.default_roster_config()
+    scoring_defaults = _nba_rules.default_scoring_config()
+    teams: dict[uuid.UUID, tuple[dict, list[LineupPlayer]]] = {}
+    for row in result.all():
+        if row.id not in teams:
+            config = {**defaults, **(row.roster_config or {})}
+            config["scoring"] = row.scoring_config or scoring_defaults
+            config["league_id"] = row.league_id
+            teams[row.id] = (config, [])
+        config, players = teams[row.id]
+        players.append(LineupPlayer(
+            player_id=row.player_id,
+            position=row.position,
+            projected=project(row.season_stats, row.status, config["scoring"]),
+            roster_slot=row.roster_slot,
+            row_id=row.row_id,
+        ))
+    return teams
+
+
+def _plan(config: dict, players: list[LineupPlayer]) -> tuple[LineupResult, list[dict]]:
+    """The optimal lineup for one team, and the row updates needed to reach it."""
+    lineup = optimal_lineup(players, config["starter_slots"])
+    changes = []
+    for p in players:
+        slot = lineup[p.player_id]
+        if slot != p.roster_slot:
+            p.roster_slot = slot
+            changes.append({"id": p.row_id, "roster_slot": slot, "is_starter": slot != BENCH_SLOT})
+    return LineupResult(players=players, changed=len(changes)), changes
@@ -0,0 +1,237 @@
+"""Auto-join matchmaking: an in-memory pool of open leagues, fullest first.
+
+Open pre-season leagues are bucketed by their number of open spots, so
+finding the fullest league an owner isn't already in takes a few dict
+lookups rather than a scan of every league. The pool only proposes; a spot
+is claimed by the conditional increment in :func:`reserve_slot`, so workers
+with a stale pool can't overfill a league. A league that refuses a
+reservation (filled, drafting, or an owner clash elsewhere) is dropped from
+the pool, and the pool is reloaded after a short TTL to pick up other
+workers' writes. New leagues are opened under a lock, so a burst of joiners
+finding nothing open fills one new league instead of each opening their own.
+"""
+
+import asyncio
+import time
+import uuid
+from dataclasses import dataclass, field
+
+from sqlalchemy import and_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.agent import Agent
+from app.models.league import League, LeagueMembership
+from app.services import rosters
+from app.services.activity import log_activity
+from app.services.auth import generate_invite_code
+from app.sports.nba import NBARules
+
+_nba_rules = NBARules()
+
+POOL_TTL_SECONDS = 60
+AUTO_LEAGUE_NAME = "Open NBA League"
+AUTO_LEAGUE_SIZE = 6
+
+
+@dataclass
+class OpenLeague:
+    id: uuid.UUID
+    name: str
+    open_spots: int
+    owners: set[uuid.UUID] = field(default_factory=set)
+
+
+@dataclass
+class OpenLeaguePool:
+    leagues: dict[uuid.UUID, OpenLeague] = field(default_factory=dict)
+    by_spots: dict[int, dict[uuid.UUID, None]] = field(default_factory=dict)  # oldest first
+    loaded_at: float | None = None
+
+    def add(self, league: OpenLeague) -> None:
+        self.discard(league.id)
+        if league.open_spots > 0:
+            self.leagues[league.id] = league
+            self.by_spots.setdefault(league.open_spots, {})[league.id] = None
+
+    def discard(self, league_id: uuid.UUID) -> None:
+        league = self.leagues.pop(league_id, None)
+        if league is not None:
+            bucket = self.by_spots[league.open_spots]
+            del bucket[league_id]
+            if not bucket:
+                del self.by_spots[league.open_spots]
+
+    def take(self, owner_id: uuid.UUID) -> OpenLeague | None:
+        """Hold a spot in the fullest league with no agent from *owner_id*."""
+        for spots in sorted(self.by_spots):  # at most max_teams distinct counts
+            for league_id in self.by_spots[spots]:
+                league = self.leagues[league_id]
+                if owner_id not in league.owners:
+                    self._resize(league, -1, owner_id)
+                    return league
+        return None
+
+    def record_join(self, league_id: uuid.UUID, owner_id: uuid.UUID) -> None:
+        """Count a join made without :meth:`take` (e.g. by invite code)."""
+        league = self.leagues.get(league_id)
+        if league is not None:
+            self._resize(league, -1, owner_id)
+
+    def release(self, league: OpenLeague, owner_id: uuid.UUID) -> None:
+        """Give back a spot held by :meth:`take` that couldn't be used."""
+        if league.id in self.leagues or league.open_spots == 0:
+            self._resize(league, 1, owner_id)
+
+    def _resize(self, league: OpenLeague, delta: int, owner_id: uuid.UUID) -> None:
+        self.discard(league.id)
+        league.open_spots += delta
+        if delta < 0:
+            league.owners.add(owner_id)
+        else:
+            league.owners.discard(owner_id)
+        self.add(league)
+
+
+_pool = OpenLeaguePool()
+_pool_lock = asyncio.Lock()
+_open_lock = asyncio.Lock()
+
+
+async def get_pool(db: AsyncSession) -> OpenLeaguePool:
+    """Return the open-league pool, reloading it from the DB when stale."""
+    if _pool.loaded_at is None or time.monotonic() - _pool.loaded_at > POOL_TTL_SECONDS:
+        async with _pool_lock:
+            if _pool.loaded_at is None or time.monotonic() - _pool.loaded_at > POOL_TTL_SECONDS:
+                await _load(db)
+    return _pool
+
+
+def reset() -> None:
+    """Drop the pool; the next auto-join reloads it."""
+    _pool.leagues.clear()
+    _pool.by_spots.clear()
+    _pool.loaded_at = None
+
+
+def track_join(league_id: uuid.UUID, owner_id: uuid.UUID) -> None:
+    """Record a join made outside matchmaking (e.g. by invite code)."""
+    _pool.record_join(league_id, owner_id)
+
+
+def track_league(league: League, owner_id: uuid.UUID) -> None:
+    """Add a newly created league (its commissioner already joined) to the pool."""
+    if _pool.loaded_at is not None:
+        _pool.add(OpenLeague(league.id, league.name, league.max_teams - 1, {owner_id}))
+
+
+async def reserve_slot(
+    db: AsyncSession, league_id: uuid.UUID, owner_id: uuid.UUID | None = None
+) -> bool:
+    """Claim a spot in a pre-season league by bumping its member count.
+
+    The conditional increment is atomic, so concurrent joins can't overfill;
+    with *owner_id*, it also fails if that owner already has an agent there.
+    """
+    conditions = [
+        League.id == league_id,
+        League.status == "pre_season",
+        League.member_count < League.max_teams,
+    ]
+    if owner_id is not None:
+        conditions.append(
+            ~select(LeagueMembership.id)
+            .join(Agent, Agent.id == LeagueMembership.agent_id)
+            .where(and_(LeagueMembership.league_id == League.id, Agent.owner_id == owner_id))
+            .exists()
+        )
+    result = await db.execute(
+        update(League)
+        .where(and_(*conditions))
+        .values(member_count=League.member_count + 1)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount == 1
+
+
+async def auto_join(db: AsyncSession, agent: Agent) -> uuid.UUID:
+    """Join *agent* to the fullest open league it may enter, opening one if none.
+
+    Returns the league id; the membership is committed.
+    """
+    agent_id, owner_id = agent.id, agent.owner_id
+    pool = await get_pool(db)
+    while True:
+        held = pool.take(owner_id)
+        if held is None:
+            async with _open_lock:
+                held = pool.take(owner_id)  # another joiner may have just opened one
+                if held is None:
+                    return await _open_league(db, pool, agent_id, owner_id)
+        try:
+            if await reserve_slot(db, held.id, owner_id):
+                break
+        except Exception:
+            pool.release(held, owner_id)
+            raise
+        pool.discard(held.id)  # filled, drafting or clashing elsewhere
+
+    try:
+        db.add(LeagueMembership(league_id=held.id, agent_id=agent_id))
+        await log_activity(
+            db, agent_id, "join_league", {"league_id": str(held.id), "league_name": held.name}
+        )
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        pool.release(held, owner_id)
+        raise
+    rosters.invalidate(held.id)
+    return held.id
+
+
+async def _open_league(
+    db: AsyncSession, pool: OpenLeaguePool, agent_id: uuid.UUID, owner_id: uuid.UUID
+) -> uuid.UUID:
+    league = League(
+        name=AUTO_LEAGUE_NAME,
+        sport="nba",
+        commissioner_id=agent_id,
+        invite_code=generate_invite_code(),
+        min_teams=2,
+        max_teams=AUTO_LEAGUE_SIZE,
+        member_count=1,
+        scoring_config=_nba_rules.default_scoring_config(),
+        roster_config=_nba_rules.default_roster_config(),
+        pick_timeout_seconds=settings.draft_pick_timeout_seconds,
+    )
+    db.add(league)
+    await db.flush()
+    league_id = league.id
+    db.add(LeagueMembership(league_id=league_id, agent_id=agent_id))
+    await log_activity(
+        db, agent_id, "join_league", {"league_id": str(league_id), "league_name": AUTO_LEAGUE_NAME}
+    )
+    await db.commit()
+    pool.add(OpenLeague(league_id, AUTO_LEAGUE_NAME, AUTO_LEAGUE_SIZE - 1, {owner_id}))
+    return league_id
+
+
+async def _load(db: AsyncSession) -> None:
+    result = await db.execute(
+        select(League.id, League.name, League.max_teams, League.member_count, Agent.owner_id)
+        .outerjoin(LeagueMembership, LeagueMembership.league_id == League.id)
+        .outerjoin(Agent, Agent.id == LeagueMembership.agent_id)
+        .where(and_(League.status == "pre_season", League.member_count < League.max_teams))
+        .order_by(League.created_at)
+    )
+    leagues: dict[uuid.UUID, OpenLeague] = {}
+    for league_id, name, max_teams, member_count, owner_id in result.all():
+        league = leagues.setdefault(league_id, OpenLeague(league_id, name, max_teams - member_count))
+        if owner_id is not None:
+            league.owners.add(owner_id)
+    _pool.leagues.clear()
+    _pool.by_spots.clear()
+    for league in leagues.values():
+        _pool.add(league)
+    _pool.loaded_at = time.monotonic()
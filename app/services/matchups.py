@@ -9,6 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.league import League, LeagueMembership
 from app.models.matchup import Matchup, ScoringPeriod
+from app.services import public_matchups
 from app.sports.nba import NBASchedule
 
 
@@ -84,6 +85,7 @@ async def generate_season(db: AsyncSession, league_id: uuid.UUID) -> dict:
         periods_created += 1
 
     await db.commit()
+    public_matchups.invalidate(reindex=True)
 
     return {
         "league_id": str(league_id),
@@ -0,0 +1,220 @@
+"""Player catalog and per-league ownership bitsets.
+
+Every player gets a stable dense index (append-only across refreshes), so the
+set of players rostered in a league fits in one int bitset. Availability is
+then ``sport & filters & ~owned`` over precomputed position/team masks rather
+than a SQL anti-join. Bitsets are updated in place on draft picks, pickups and
+drops, and reloaded from ``team_players`` on a miss or after a short TTL (to
+pick up writes made by other workers).
+"""
+
+import asyncio
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.player import Player
+from app.models.team import TeamPlayer
+from app.sports.nba import NBARules
+
+_nba_rules = NBARules()
+
+CATALOG_TTL_SECONDS = 600
+OWNERSHIP_TTL_SECONDS = 300
+
+
+@dataclass
+class CatalogPlayer:
+    id: uuid.UUID
+    external_id: str
+    sport: str
+    full_name: str
+    position: str
+    nba_team: str
+    status: str
+    season_stats: dict[str, Any]
+    projected_fantasy_points: float = 0.0
+
+
+@dataclass
+class PlayerCatalog:
+    players: list[CatalogPlayer] = field(default_factory=list)
+    index: dict[uuid.UUID, int] = field(default_factory=dict)
+    by_points: list[int] = field(default_factory=list)  # indices, best projection first
+    sport_masks: dict[str, int] = field(default_factory=dict)
+    slot_masks: dict[str, int] = field(default_factory=dict)
+    team_masks: dict[str, int] = field(default_factory=dict)
+    loaded_at: float | None = None
+
+    def load(self, rows: list[Player]) -> None:
+        """Refresh from Player rows, keeping every known player's index stable."""
+        scoring = _nba_rules.default_scoring_config()
+        live = 0
+        for row in rows:
+            entry = CatalogPlayer(
+                id=row.id,
+                external_id=row.external_id,
+                sport=row.sport,
+                full_name=row.full_name,
+                position=row.position,
+                nba_team=row.nba_team,
+                status=row.status,
+                season_stats=row.season_stats or {},
+                projected_fantasy_points=_nba_rules.calculate_fantasy_points(
+                    row.season_stats or {}, scoring
+                ),
+            )
+            idx = self.index.get(row.id)
+            if idx is None:
+                idx = len(self.players)
+                self.index[row.id] = idx
+                self.players.append(entry)
+            else:
+                self.players[idx] = entry
+            live |= 1 << idx
+
+        self.sport_masks, self.team_masks = {}, {}
+        self.slot_masks = {slot: 0 for slot in _slots()}
+        for idx, p in enumerate(self.players):
+            if not live >> idx & 1:
+                continue  # deleted since an earlier load
+            bit = 1 << idx
+            self.sport_masks[p.sport] = self.sport_masks.get(p.sport, 0) | bit
+            self.team_masks[p.nba_team] = self.team_masks.get(p.nba_team, 0) | bit
+            for slot in self.slot_masks:
+                if _nba_rules.position_eligible(p.position, slot):
+                    self.slot_masks[slot] |= bit
+
+        self.by_points = sorted(
+            (idx for idx in range(len(self.players)) if live >> idx & 1),
+            key=lambda i: (-self.players[i].projected_fantasy_points, self.players[i].full_name),
+        )
+        self.loaded_at = time.monotonic()
+
+
+@dataclass
+class _Ownership:
+    bits: int
+    loaded_at: float
+
+
+_catalog = PlayerCatalog()
+_catalog_lock = asyncio.Lock()
+_owned: dict[uuid.UUID, _Ownership] = {}
+
+
+async def get_catalog(db: AsyncSession) -> PlayerCatalog:
+    """Return the player catalog, reloading it from the DB when stale."""
+    if _catalog.loaded_at is None or time.monotonic() - _catalog.loaded_at > CATALOG_TTL_SECONDS:
+        async with _catalog_lock:
+            if _catalog.loaded_at is None or time.monotonic() - _catalog.loaded_at > CATALOG_TTL_SECONDS:
+                result = await db.execute(select(Player))
+                _catalog.load(result.scalars().all())
+    return _catalog
+
+
+def invalidate_catalog() -> None:
+    """Force the next catalog access to reload (e.g. after a player import)."""
+    _catalog.loaded_at = None
+
+
+def reset() -> None:
+    """Drop the catalog and every ownership bitset."""
+    global _catalog
+    _catalog = PlayerCatalog()
+    _owned.clear()
+
+
+async def owned_mask(db: AsyncSession, league_id: uuid.UUID) -> int:
+    """Bitset of players rostered in a league (drafted or added off waivers)."""
+    catalog = await get_catalog(db)
+    entry = _owned.get(league_id)
+    if entry is not None and time.monotonic() - entry.loaded_at <= OWNERSHIP_TTL_SECONDS:
+        return entry.bits
+
+    result = await db.execute(
+        select(TeamPlayer.player_id).where(TeamPlayer.league_id == league_id)
+    )
+    bits = 0
+    for (player_id,) in result.all():
+        idx = catalog.index.get(player_id)
+        if idx is not None:
+            bits |= 1 << idx
+    _owned[league_id] = _Ownership(bits=bits, loaded_at=time.monotonic())
+    return bits
+
+
+def invalidate_league(league_id: uuid.UUID) -> None:
+    """Reload a league's ownership on next access (another worker changed rosters)."""
+    _owned.pop(league_id, None)
+
+
+def mark_owned(league_id: uuid.UUID, player_id: uuid.UUID) -> None:
+    _set_owned(league_id, player_id, owned=True)
+
+
+def mark_released(league_id: uuid.UUID, player_id: uuid.UUID) -> None:
+    _set_owned(league_id, player_id, owned=False)
+
+
+def _set_owned(league_id: uuid.UUID, player_id: uuid.UUID, owned: bool) -> None:
+    entry = _owned.get(league_id)
+    if entry is None:
+        return  # not loaded; the next read builds it from the DB
+    idx = _catalog.index.get(player_id)
+    if idx is None:
+        _owned.pop(league_id, None)  # player newer than the catalog
+        return
+    if owned:
+        entry.bits |= 1 << idx
+    else:
+        entry.bits &= ~(1 << idx)
+
+
+async def list_available(
+    db: AsyncSession,
+    league_id: uuid.UUID,
+    sport: str = "nba",
+    position: str | None = None,
+    nba_team: str | None = None,
+    name: str | None = None,
+    limit: int = 50,
+    cursor: int = 0,
+) -> tuple[list[CatalogPlayer], int | None]:
+    """Unrostered players, best projection first. Returns (page, next_cursor).
+
+    *position* is a roster slot ("PG", "G", "UTIL", ...); *cursor* is the
+    rank to resume from, as returned by the previous page.
+    """
+    catalog = await get_catalog(db)
+    available = catalog.sport_masks.get(sport, 0) & ~await owned_mask(db, league_id)
+    if position:
+        slot = position.split(":", 1)[-1].upper()
+        if slot not in catalog.slot_masks:
+            raise ValueError(f"Unknown position: {position}")
+        available &= catalog.slot_masks[slot]
+    if nba_team:
+        available &= catalog.team_masks.get(nba_team.upper(), 0)
+    needle = name.lower() if name else None
+
+    page: list[CatalogPlayer] = []
+    for rank in range(cursor, len(catalog.by_points)):
+        idx = catalog.by_points[rank]
+        if not available >> idx & 1:
+            continue
+        player = catalog.players[idx]
+        if needle and needle not in player.full_name.lower():
+            continue
+        if len(page) == limit:
+            return page, rank
+        page.append(player)
+    return page, None
+
+
+def _slots() -> list[str]:
+    config = _nba_rules.default_roster_config()
+    return list(dict.fromkeys(config["starter_slots"]))
@@ -0,0 +1,176 @@
+"""Public matchups feed: the current week's head-to-heads in every league in season.
+
+Which scoring period is "current" for each league only changes with the date,
+so it is indexed once per day: the scheduler rebuilds the index just after
+midnight, and the first request of a new day builds it if the job hasn't run.
+The serialized feed is cached for the day under a version read from the DB
+(periods in season, and how often they've been scored), so it is rebuilt on
+any worker shortly after scores change or a season is generated. The version
+itself is cached for a few seconds, so most requests don't query at all.
+"""
+
+import logging
+import uuid
+from datetime import date
+from typing import Any
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.models.agent import Agent
+from app.models.league import League
+from app.models.matchup import Matchup, ScoringPeriod
+from app.services import cache
+
+logger = logging.getLogger(__name__)
+
+DAY_TTL_SECONDS = 26 * 60 * 60  # a day, plus slack for a late midnight refresh
+VERSION_TTL_SECONDS = 5  # how long other workers' score writes can go unseen
+VERSION_KEY = "public:matchups:version"
+
+
+def _index_key(day: date) -> str:
+    return f"public:matchups:index:{day.isoformat()}"
+
+
+def _feed_key(day: date) -> str:
+    return f"public:matchups:feed:{day.isoformat()}"
+
+
+async def public_feed(db: AsyncSession, limit: int, cursor: int = 0) -> tuple[list[dict], int | None]:
+    """One page of today's feed and the cursor for the next page (None at the end)."""
+    today = date.today()
+    version = await cache.cached(VERSION_KEY, VERSION_TTL_SECONDS, lambda: _scores_version(db))
+    entry = cache.get(_feed_key(today))
+    if entry is not None and entry[0] == version:
+        feed = entry[1]
+    else:
+        if entry is not None and entry[0][0] != version[0]:
+            cache.invalidate(_index_key(today))  # a season was generated elsewhere
+        feed = await _load_feed(db, today)
+        cache.put(_feed_key(today), (version, feed), DAY_TTL_SECONDS)
+    page = feed[cursor:cursor + limit]
+    next_cursor = cursor + limit if cursor + limit < len(feed) else None
+    return page, next_cursor
+
+
+async def current_periods(db: AsyncSession, day: date | None = None) -> dict[uuid.UUID, uuid.UUID]:
+    """league_id -> id of the scoring period shown for that league on *day*."""
+    day = day or date.today()
+    return await cache.cached(_index_key(day), DAY_TTL_SECONDS, lambda: _load_index(db, day))
+
+
+async def refresh_index(db: AsyncSession) -> int:
+    """Rebuild today's period index and drop today's feed. Returns leagues indexed."""
+    today = date.today()
+    index = await _load_index(db, today)
+    cache.put(_index_key(today), index, DAY_TTL_SECONDS)
+    cache.invalidate(_feed_key(today))
+    return len(index)
+
+
+def invalidate(reindex: bool = False) -> None:
+    """Drop today's feed after scores change; *reindex* after periods are created."""
+    today = date.today()
+    cache.invalidate(VERSION_KEY)
+    cache.invalidate(_feed_key(today))
+    if reindex:
+        cache.invalidate(_index_key(today))
+
+
+async def run_scheduled_refresh() -> None:
+    """Scheduler entry: rebuild the period index for the new day in a fresh session."""
+    from app.database import async_session
+
+    async with async_session() as db:
+        count = await refresh_index(db)
+    logger.info("Indexed current scoring periods for %d leagues", count)
+
+
+async def _scores_version(db: AsyncSession) -> tuple[int, int]:
+    """(periods in season, total times scored): changes whenever the feed would."""
+    result = await db.execute(
+        select(
+            func.count(ScoringPeriod.id),
+            func.coalesce(func.sum(ScoringPeriod.scores_version), 0),
+        )
+        .join(League, League.id == ScoringPeriod.league_id)
+        .where(League.status.in_(("active", "playoffs")))
+    )
+    periods, scored = result.one()
+    return int(periods), int(scored)
+
+
+async def _load_index(db: AsyncSession, day: date) -> dict[uuid.UUID, uuid.UUID]:
+    """Per league: the period containing *day*, else the latest finished one,
+    else the first to come."""
+    result = await db.execute(
+        select(
+            ScoringPeriod.id,
+            ScoringPeriod.league_id,
+            ScoringPeriod.start_date,
+            ScoringPeriod.end_date,
+        )
+        .join(League, League.id == ScoringPeriod.league_id)
+        .where(League.status.in_(("active", "playoffs")))
+        .order_by(ScoringPeriod.league_id, ScoringPeriod.start_date)
+    )
+    index: dict[uuid.UUID, uuid.UUID] = {}
+    settled: set[uuid.UUID] = set()
+    for period_id, league_id, start, end in result.all():
+        if league_id in settled:
+            continue
+        if start <= day <= end:
+            index[league_id] = period_id
+            settled.add(league_id)
+        elif end < day:
+            index[league_id] = period_id  # periods come in start order: keeps the latest
+        elif league_id not in index:
+            index[league_id] = period_id
+            settled.add(league_id)
+    return index
+
+
+async def _load_feed(db: AsyncSession, day: date) -> list[dict[str, Any]]:
+    index = await current_periods(db, day)
+    if not index:
+        return []
+
+    home = aliased(Agent)
+    away = aliased(Agent)
+    result = await db.execute(
+        select(
+            League.name.label("league_name"),
+            ScoringPeriod.label,
+            Matchup.home_agent_id,
+            Matchup.away_agent_id,
+            Matchup.home_points,
+            Matchup.away_points,
+            Matchup.winner_agent_id,
+            Matchup.is_tie,
+            home.name.label("home_name"),
+            away.name.label("away_name"),
+        )
+        .join(ScoringPeriod, ScoringPeriod.id == Matchup.scoring_period_id)
+        .join(League, League.id == ScoringPeriod.league_id)
+        .outerjoin(home, home.id == Matchup.home_agent_id)
+        .outerjoin(away, away.id == Matchup.away_agent_id)
+        .where(Matchup.scoring_period_id.in_(list(index.values())))
+        .order_by(League.name, League.id, Matchup.id)
+    )
+
+    output = []
+    for row in result.all():
+        names = {row.home_agent_id: row.home_name, row.away_agent_id: row.away_name}
+        output.append({
+            "league_name": row.league_name or "Unknown",
+            "week_label": row.label,
+            "home_agent_name": row.home_name or "Unknown",
+            "away_agent_name": row.away_name or "Unknown",
+            "home_points": float(row.home_points) if row.home_points is not None else None,
+            "away_points": float(row.away_points) if row.away_points is not None else None,
+            "winner_agent_name": names.get(row.winner_agent_id) if row.winner_agent_id else None,
+            "is_tie": row.is_tie,
+        })
+    return output
@@ -0,0 +1,85 @@
+"""Serialized league rosters, loaded in one query and cached per league.
+
+Backs ``/leagues/{id}/teams`` (public) and ``/leagues/{id}/team``. Every
+code path that changes a roster in a league (draft picks, waivers, pickups,
+transactions, lineup changes) calls :func:`invalidate` after committing;
+the TTL only bounds staleness from writes made by other workers.
+"""
+
+import uuid
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.agent import Agent
+from app.models.league import LeagueMembership
+from app.models.player import Player
+from app.models.team import Team, TeamPlayer
+from app.services import cache
+
+ROSTER_CACHE_TTL_SECONDS = 300
+
+
+def _key(league_id: uuid.UUID) -> str:
+    return f"league:rosters:{league_id}"
+
+
+async def league_rosters(db: AsyncSession, league_id: uuid.UUID) -> list[dict[str, Any]]:
+    """Every team in the league with its roster, in join order."""
+    return await cache.cached(
+        _key(league_id), ROSTER_CACHE_TTL_SECONDS, lambda: _load(db, league_id)
+    )
+
+
+def invalidate(league_id: uuid.UUID) -> None:
+    from app.services import game_log
+
+    cache.invalidate(_key(league_id))
+    game_log.invalidate(league_id)  # its finished days were computed from these starters
+
+
+async def _load(db: AsyncSession, league_id: uuid.UUID) -> list[dict[str, Any]]:
+    result = await db.execute(
+        select(
+            LeagueMembership.agent_id,
+            Agent.name,
+            Team.id.label("team_id"),
+            TeamPlayer.roster_slot,
+            TeamPlayer.is_starter,
+            Player.id.label("player_id"),
+            Player.full_name,
+            Player.position,
+            Player.nba_team,
+        )
+        .select_from(LeagueMembership)
+        .outerjoin(Agent, Agent.id == LeagueMembership.agent_id)
+        .outerjoin(Team, Team.membership_id == LeagueMembership.id)
+        .outerjoin(TeamPlayer, TeamPlayer.team_id == Team.id)
+        .outerjoin(Player, Player.id == TeamPlayer.player_id)
+        .where(LeagueMembership.league_id == league_id)
+        .order_by(LeagueMembership.created_at, TeamPlayer.created_at)
+    )
+
+    teams: dict[uuid.UUID, dict[str, Any]] = {}
+    for row in result.all():
+        team = teams.get(row.agent_id)
+        if team is None:
+            team = teams[row.agent_id] = {
+                "agent_id": str(row.agent_id),
+                "agent_name": row.name or "Unknown",
+                "team_id": str(row.team_id) if row.team_id else None,
+                "roster": [],
+            }
+        if row.player_id is not None:
+            team["roster"].append({
+                "id": str(row.player_id),
+                "full_name": row.full_name,
+                "name": row.full_name,
+                "position": row.position,
+                "nba_team": row.nba_team,
+                "real_team": row.nba_team,
+                "roster_slot": row.roster_slot,
+                "is_starter": row.is_starter,
+            })
+    return list(teams.values())
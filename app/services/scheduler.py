@@ -0,0 +1,70 @@
+"""In-process scheduler for periodic background jobs.
+
+Each registered job runs in its own task, on a fixed interval or daily at a
+set local time, next to the draft clock. The ``/jobs/*`` endpoints remain the external (cron) trigger for
+the same work; jobs must therefore be safe to run twice, or from several
+workers at once.
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ScheduledJob:
+    name: str
+    interval_seconds: float
+    run: Callable[[], Awaitable[object]]
+    daily_at: time | None = None
+
+    def next_delay(self) -> float:
+        """Seconds until the job is next due."""
+        if self.daily_at is None:
+            return self.interval_seconds
+        now = datetime.now()
+        due = datetime.combine(now.date(), self.daily_at)
+        if due <= now:
+            due += timedelta(days=1)
+        return (due - now).total_seconds()
+
+
+class Scheduler:
+    def __init__(self):
+        self.jobs: list[ScheduledJob] = []
+        self._tasks: list[asyncio.Task] = []
+
+    def every(self, seconds: float, name: str, run: Callable[[], Awaitable[object]]) -> None:
+        """Register *run* to be awaited every *seconds* (non-positive disables it)."""
+        if seconds > 0:
+            self.jobs.append(ScheduledJob(name=name, interval_seconds=seconds, run=run))
+
+    def daily(self, at: time | None, name: str, run: Callable[[], Awaitable[object]]) -> None:
+        """Register *run* to be awaited once a day at local time *at* (None disables it)."""
+        if at is not None:
+            self.jobs.append(ScheduledJob(name=name, interval_seconds=0, run=run, daily_at=at))
+
+    def start(self) -> None:
+        for job in self.jobs:
+            self._tasks.append(asyncio.create_task(self._loop(job)))
+
+    async def shutdown(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+    async def _loop(self, job: ScheduledJob) -> None:
+        while True:
+            await asyncio.sleep(job.next_delay())
+            try:
+                await job.run()
+            except Exception:
+                logger.exception("Scheduled job %s failed", job.name)
+
+
+scheduler = Scheduler()
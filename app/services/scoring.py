@@ -9,6 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.matchup import Matchup, ScoringPeriod
 from app.models.player import Player, PlayerGameLog
 from app.models.team import TeamPlayer
+from app.services import public_matchups
 from app.sports.nba import NBAAdapter, NBARules
 
 logger = logging.getLogger(__name__)
@@ -107,7 +108,9 @@ async def score_matchups_for_period(db: AsyncSession, period_id) -> int:
 
         count += 1
 
+    period.scores_version = ScoringPeriod.scores_version + 1
     await db.commit()
+    public_matchups.invalidate()
     return count
 
 
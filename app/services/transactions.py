@@ -0,0 +1,182 @@
+"""Bulk roster transactions: an ordered batch of add, drop and lineup moves.
+
+The batch is replayed against an in-memory copy of the team's roster, so
+every move is validated (ownership, waivers, slot eligibility) and the end
+state is checked against the roster limits before anything is written. The
+whole batch is then applied in one transaction, with its activity log rows
+inserted alongside it.
+"""
+
+import uuid
+from collections import Counter
+from dataclasses import dataclass
+
+from sqlalchemy import and_, delete, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.activity_log import ActivityLog
+from app.models.league import League, LeagueMembership
+from app.models.player import Player
+from app.models.team import Team, TeamPlayer
+from app.models.waiver import WaiverClaim
+from app.services import player_pool, rosters
+from app.services.waivers import ROSTERED_MESSAGE
+from app.sports.nba import NBARules
+
+_nba_rules = NBARules()
+
+BENCH_SLOT = "BN"
+
+
+@dataclass
+class RosterEntry:
+    player_id: uuid.UUID
+    position: str
+    roster_slot: str
+
+    @property
+    def is_starter(self) -> bool:
+        return self.roster_slot != BENCH_SLOT
+
+
+async def apply_transactions(
+    db: AsyncSession,
+    league_id: uuid.UUID,
+    agent_id: uuid.UUID,
+    moves: list,
+) -> list[RosterEntry]:
+    """Validate and apply *moves* (rows with ``type``, ``player_id`` and
+    ``roster_slot``) to the agent's team. Returns the resulting roster.
+
+    Raises ValueError, naming the offending move, if any move is invalid;
+    nothing is written in that case.
+    """
+    team_result = await db.execute(
+        select(Team.id, League.roster_config)
+        .join(LeagueMembership, LeagueMembership.id == Team.membership_id)
+        .join(League, League.id == LeagueMembership.league_id)
+        .where(and_(LeagueMembership.league_id == league_id, LeagueMembership.agent_id == agent_id))
+    )
+    team = team_result.first()
+    if team is None:
+        raise ValueError("No team in this league")
+    config = {**_nba_rules.default_roster_config(), **(team.roster_config or {})}
+
+    roster_result = await db.execute(
+        select(TeamPlayer.player_id, Player.position, TeamPlayer.roster_slot)
+        .join(Player, Player.id == TeamPlayer.player_id)
+        .where(TeamPlayer.team_id == team.id)
+    )
+    before = {row.player_id: RosterEntry(*row) for row in roster_result.all()}
+
+    add_ids = {m.player_id for m in moves if m.type == "add"} - set(before)
+    positions: dict[uuid.UUID, str] = {}
+    unavailable: dict[uuid.UUID, str] = {}
+    if add_ids:
+        players_result = await db.execute(
+            select(Player.id, Player.position).where(Player.id.in_(add_ids))
+        )
+        positions = dict(players_result.all())
+        owned_result = await db.execute(
+            select(TeamPlayer.player_id).where(
+                and_(TeamPlayer.league_id == league_id, TeamPlayer.player_id.in_(add_ids))
+            )
+        )
+        unavailable.update((pid, ROSTERED_MESSAGE) for pid in owned_result.scalars())
+        waivers_result = await db.execute(
+            select(WaiverClaim.player_id).where(
+                and_(
+                    WaiverClaim.league_id == league_id,
+                    WaiverClaim.status == "pending",
+                    WaiverClaim.player_id.in_(add_ids),
+                )
+            )
+        )
+        unavailable.update((pid, "Player is on waivers") for pid in waivers_result.scalars())
+
+    roster = {pid: RosterEntry(e.player_id, e.position, e.roster_slot) for pid, e in before.items()}
+    slots = set(config["starter_slots"]) | {BENCH_SLOT}
+    activity = []
+    for number, move in enumerate(moves, start=1):
+        pid = move.player_id
+        if move.type == "add":
+            if pid in roster:
+                raise ValueError(f"Move {number}: player is already on your roster")
+            if pid not in before:
+                if pid not in positions:
+                    raise ValueError(f"Move {number}: player not found")
+                if pid in unavailable:
+                    raise ValueError(f"Move {number}: {unavailable[pid]}")
+            position = before[pid].position if pid in before else positions[pid]
+            roster[pid] = RosterEntry(pid, position, BENCH_SLOT)
+            activity.append(("free_agent_pickup", pid))
+        elif move.type == "drop":
+            if roster.pop(pid, None) is None:
+                raise ValueError(f"Move {number}: player is not on your roster")
+            activity.append(("drop", pid))
+        else:
+            entry = roster.get(pid)
+            if entry is None:
+                raise ValueError(f"Move {number}: player is not on your roster")
+            slot = move.roster_slot
+            if slot not in slots:
+                raise ValueError(f"Move {number}: unknown roster slot {slot}")
+            if not _nba_rules.position_eligible(entry.position, slot):
+                raise ValueError(f"Move {number}: player is not eligible at {slot}")
+            entry.roster_slot = slot
+            activity.append(("lineup", pid))
+
+    if len(roster) > config["total_roster_size"]:
+        raise ValueError(f"Roster would exceed {config['total_roster_size']} players")
+    used = Counter(e.roster_slot for e in roster.values() if e.is_starter)
+    capacity = Counter(config["starter_slots"])
+    for slot, count in used.items():
+        if count > capacity[slot]:
+            raise ValueError(f"Too many players at {slot} (limit {capacity[slot]})")
+
+    dropped = set(before) - set(roster)
+    added = set(roster) - set(before)
+    if dropped:
+        await db.execute(
+            delete(TeamPlayer).where(
+                and_(TeamPlayer.team_id == team.id, TeamPlayer.player_id.in_(dropped))
+            )
+        )
+    for pid, entry in roster.items():
+        if pid in before and entry.roster_slot != before[pid].roster_slot:
+            await db.execute(
+                update(TeamPlayer)
+                .where(and_(TeamPlayer.team_id == team.id, TeamPlayer.player_id == pid))
+                .values(roster_slot=entry.roster_slot, is_starter=entry.is_starter)
+            )
+    db.add_all(
+        TeamPlayer(
+            team_id=team.id,
+            league_id=league_id,
+            player_id=pid,
+            roster_slot=roster[pid].roster_slot,
+            is_starter=roster[pid].is_starter,
+        )
+        for pid in added
+    )
+    db.add_all(
+        ActivityLog(
+            agent_id=agent_id,
+            action=action,
+            detail={"league_id": str(league_id), "player_id": str(pid)},
+        )
+        for action, pid in activity
+    )
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise ValueError(ROSTERED_MESSAGE)  # another team got there first
+
+    for pid in added:
+        player_pool.mark_owned(league_id, pid)
+    for pid in dropped:
+        player_pool.mark_released(league_id, pid)
+    rosters.invalidate(league_id)
+    return list(roster.values())
@@ -1,15 +1,29 @@
 """Waiver claim and free agent pickup service."""
 
+import heapq
+import logging
 import uuid
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import select, and_, update
+from sqlalchemy import delete, func, select, and_, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.league import LeagueMembership
-from app.models.player import Player
+from app.models.league import League, LeagueMembership
+from app.models.player import Player, PlayerGameLog
 from app.models.team import Team, TeamPlayer
-from app.models.waiver import WaiverClaim
+from app.models.waiver import WaiverClaim, WaiverOrder
+from app.services import player_pool, rosters
+
+logger = logging.getLogger(__name__)
+
+WAIVER_BATCH_LEAGUES = 500  # leagues whose rosters are loaded per query
+ROSTERED_MESSAGE = "Player is already on a roster in this league"
+
+
+class _ClaimsChanged(Exception):
+    """A league's claims were processed elsewhere while this run resolved them."""
 
 
 async def create_waiver_claim(
@@ -18,30 +32,45 @@ async def create_waiver_claim(
     agent_id: uuid.UUID,
     player_id: uuid.UUID,
     drop_player_id: uuid.UUID | None = None,
+    bid_amount: int | None = None,
+    claim_group: str | None = None,
 ) -> WaiverClaim:
-    """Place a waiver claim on a player."""
-    # Check player is on waivers (dropped within last 48 hours)
-    # For simplicity, any unrostered player can be claimed via waivers
+    """Place a waiver claim on a player.
 
-    # Calculate priority (inverse of standings — lower standing = higher priority)
-    # For v1, use creation order as priority proxy
-    existing_claims = await db.execute(
-        select(WaiverClaim).where(
-            and_(
-                WaiverClaim.league_id == league_id,
-                WaiverClaim.player_id == player_id,
-                WaiverClaim.status == "pending",
-            )
-        )
+    In FAAB leagues the claim carries a sealed bid (default 0), which must fit
+    the agent's remaining budget; rolling leagues ignore bids. Of the claims
+    an agent puts in one *claim_group*, at most one is approved.
+    """
+    if await is_rostered(db, league_id, player_id):
+        raise ValueError(ROSTERED_MESSAGE)
+
+    league_result = await db.execute(
+        select(League.waiver_type, League.faab_budget, LeagueMembership.faab_spent)
+        .join(LeagueMembership, LeagueMembership.league_id == League.id)
+        .where(and_(League.id == league_id, LeagueMembership.agent_id == agent_id))
     )
-    priority = len(existing_claims.scalars().all()) + 1
+    league = league_result.first()
+    if league is None:
+        raise ValueError("Not a member of this league")
+    if league.waiver_type == "faab":
+        bid_amount = bid_amount or 0
+        remaining = league.faab_budget - league.faab_spent
+        if bid_amount > remaining:
+            raise ValueError(f"Bid exceeds remaining FAAB budget ({remaining})")
+    else:
+        bid_amount = None
+
+    # Check player is on waivers (dropped within last 48 hours)
+    # For simplicity, any unrostered player can be claimed via waivers
 
+    # Priority comes from the league's waiver order when claims are processed
     claim = WaiverClaim(
         league_id=league_id,
         agent_id=agent_id,
         player_id=player_id,
         drop_player_id=drop_player_id,
-        priority=priority,
+        bid_amount=bid_amount,
+        claim_group=claim_group,
         status="pending",
         waiver_expires_at=datetime.now(timezone.utc) + timedelta(hours=48),
     )
@@ -51,42 +80,354 @@ async def create_waiver_claim(
     return claim
 
 
+@dataclass
+class LeagueRosters:
+    """One league's rosters, as needed to resolve its waiver claims."""
+
+    teams: dict[uuid.UUID, uuid.UUID] = field(default_factory=dict)  # agent -> team
+    rosters: dict[uuid.UUID, set[uuid.UUID]] = field(default_factory=dict)  # agent -> players
+    owned: set[uuid.UUID] = field(default_factory=set)
+    order: dict[uuid.UUID, int] = field(default_factory=dict)  # agent -> waiver position
+    budgets: dict[uuid.UUID, int] | None = None  # agent -> remaining FAAB; None = rolling
+
+
+@dataclass
+class WaiverOutcome:
+    approved: list[uuid.UUID] = field(default_factory=list)  # claim IDs
+    denied: list[uuid.UUID] = field(default_factory=list)
+    adds: dict[tuple[uuid.UUID, uuid.UUID], None] = field(default_factory=dict)  # (team, player)
+    drops: set[tuple[uuid.UUID, uuid.UUID]] = field(default_factory=set)
+    spent: dict[uuid.UUID, int] = field(default_factory=dict)  # agent -> FAAB won with
+    moved: dict[uuid.UUID, int] = field(default_factory=dict)  # agent -> new waiver position
+
+
+def resolve_claims(claims: list, league: LeagueRosters) -> WaiverOutcome:
+    """Resolve a league's claims entirely in memory.
+
+    *claims* are rows with ``id``, ``agent_id``, ``player_id``,
+    ``drop_player_id``, ``claim_group``, ``bid_amount`` and ``created_at``.
+    In a rolling league the agent at the top of the waiver order gets their
+    oldest claim that can still succeed, then moves to the back, and so on.
+    In a FAAB league claims are sorted once by bid (the waiver order breaks
+    ties) and resolved in a single pass. Either way a claim is denied if the
+    player is already rostered (including by an earlier claim in the batch),
+    the agent has no team, already won a claim in the same group, or can no
+    longer afford the bid. *league* is updated as claims are approved.
+    """
+    outcome = WaiverOutcome()
+    won_groups: set[tuple[uuid.UUID, str]] = set()
+    last = max(league.order.values(), default=0)
+    unordered = last + 1  # agents without a waiver position go last
+
+    def settle(claim) -> bool:
+        nonlocal last
+        team_id = league.teams.get(claim.agent_id)
+        group = (claim.agent_id, claim.claim_group) if claim.claim_group else None
+        bid = (claim.bid_amount or 0) if league.budgets is not None else 0
+        if (
+            team_id is None
+            or claim.player_id in league.owned
+            or group in won_groups
+            or (league.budgets is not None and bid > league.budgets.get(claim.agent_id, 0))
+        ):
+            outcome.denied.append(claim.id)
+            return False
+
+        roster = league.rosters.setdefault(claim.agent_id, set())
+        drop = claim.drop_player_id
+        if drop and drop in roster:
+            roster.discard(drop)
+            league.owned.discard(drop)
+            if (team_id, drop) in outcome.adds:
+                del outcome.adds[(team_id, drop)]  # added earlier in this batch
+            else:
+                outcome.drops.add((team_id, drop))
+
+        roster.add(claim.player_id)
+        league.owned.add(claim.player_id)
+        if (team_id, claim.player_id) in outcome.drops:
+            outcome.drops.discard((team_id, claim.player_id))  # keep the existing row
+        else:
+            outcome.adds[(team_id, claim.player_id)] = None
+        outcome.approved.append(claim.id)
+        if group:
+            won_groups.add(group)
+        if bid:
+            league.budgets[claim.agent_id] -= bid
+            outcome.spent[claim.agent_id] = outcome.spent.get(claim.agent_id, 0) + bid
+        last += 1
+        league.order[claim.agent_id] = outcome.moved[claim.agent_id] = last
+        return True
+
+    def position(agent_id: uuid.UUID) -> int:
+        return league.order.get(agent_id, unordered)
+
+    if league.budgets is not None:
+        def bid_order(claim) -> tuple:
+            # The claim ID is the last tie-break, so a batch always replays the same way
+            return (
+                -(claim.bid_amount or 0),
+                position(claim.agent_id),
+                claim.created_at,
+                str(claim.id),
+            )
+
+        for claim in sorted(claims, key=bid_order):
+            settle(claim)
+        return outcome
+
+    pending: dict[uuid.UUID, list] = {}
+    for claim in sorted(claims, key=lambda c: (c.created_at, str(c.id)), reverse=True):
+        pending.setdefault(claim.agent_id, []).append(claim)  # oldest claim last
+    heap = [(position(agent_id), str(agent_id), agent_id) for agent_id in pending]
+    heapq.heapify(heap)
+    while heap:
+        _, key, agent_id = heapq.heappop(heap)
+        queue = pending[agent_id]
+        while queue and not settle(queue.pop()):
+            pass
+        if queue:
+            heapq.heappush(heap, (position(agent_id), key, agent_id))
+    return outcome
+
+
+async def process_waivers(db: AsyncSession, league_id: uuid.UUID | None = None) -> dict[str, int]:
+    """Process every expired pending claim (in one league, or all of them).
+
+    Claims are loaded in one query, and rosters and waiver orders once per
+    batch of leagues (a league without an order gets one seeded from its
+    standings); each league is then resolved in memory and applied in one
+    transaction.
+    A league whose claims or rosters changed underneath the run (e.g. another
+    worker processing it) is rolled back and left for the next run.
+    """
+    now = datetime.now(timezone.utc)
+    query = select(
+        WaiverClaim.id,
+        WaiverClaim.league_id,
+        WaiverClaim.agent_id,
+        WaiverClaim.player_id,
+        WaiverClaim.drop_player_id,
+        WaiverClaim.claim_group,
+        WaiverClaim.bid_amount,
+        WaiverClaim.created_at,
+    ).where(
+        and_(
+            WaiverClaim.status == "pending",
+            WaiverClaim.waiver_expires_at <= now,
+        )
+    )
+    if league_id is not None:
+        query = query.where(WaiverClaim.league_id == league_id)
+    result = await db.execute(
+        query.order_by(WaiverClaim.league_id, WaiverClaim.created_at)
+    )
+    claims_by_league: dict[uuid.UUID, list] = {}
+    for claim in result.all():
+        claims_by_league.setdefault(claim.league_id, []).append(claim)
+
+    totals = {"leagues": 0, "approved": 0, "denied": 0, "skipped": 0}
+    league_ids = list(claims_by_league)
+    for start in range(0, len(league_ids), WAIVER_BATCH_LEAGUES):
+        batch = league_ids[start:start + WAIVER_BATCH_LEAGUES]
+        team_rosters = await _load_rosters(db, batch)
+        await _seed_waiver_orders(db, team_rosters)
+        await db.commit()  # end the read transaction before per-league writes
+        for lid in batch:
+            outcome = resolve_claims(claims_by_league[lid], team_rosters.get(lid, LeagueRosters()))
+            if await _apply_outcome(db, lid, outcome):
+                totals["leagues"] += 1
+                totals["approved"] += len(outcome.approved)
+                totals["denied"] += len(outcome.denied)
+            else:
+                totals["skipped"] += 1
+    return totals
+
+
 async def process_expired_waivers(db: AsyncSession, league_id: uuid.UUID) -> int:
     """Process all expired waiver claims for a league. Returns number processed."""
-    now = datetime.now(timezone.utc)
+    totals = await process_waivers(db, league_id)
+    return totals["approved"] + totals["denied"]
+
+
+async def standings_waiver_orders(
+    db: AsyncSession, league_ids: list[uuid.UUID]
+) -> dict[uuid.UUID, dict[uuid.UUID, int]]:
+    """Waiver orders seeded from each league's standings, worst team first.
+
+    Standings are total starter fantasy points for the league's season, as in
+    :func:`app.services.leaderboard.get_league_standings`, summed for every
+    league in one grouped query.
+    """
     result = await db.execute(
-        select(WaiverClaim)
-        .where(
+        select(
+            LeagueMembership.league_id,
+            LeagueMembership.agent_id,
+            func.coalesce(func.sum(PlayerGameLog.fantasy_points), 0),
+        )
+        .join(League, League.id == LeagueMembership.league_id)
+        .outerjoin(Team, Team.membership_id == LeagueMembership.id)
+        .outerjoin(TeamPlayer, and_(TeamPlayer.team_id == Team.id, TeamPlayer.is_starter))
+        .outerjoin(
+            PlayerGameLog,
             and_(
-                WaiverClaim.league_id == league_id,
-                WaiverClaim.status == "pending",
-                WaiverClaim.waiver_expires_at <= now,
-            )
+                PlayerGameLog.player_id == TeamPlayer.player_id,
+                PlayerGameLog.season == League.season,
+            ),
         )
-        .order_by(WaiverClaim.priority.asc())
+        .where(LeagueMembership.league_id.in_(league_ids))
+        .group_by(LeagueMembership.league_id, LeagueMembership.agent_id)
     )
-    claims = result.scalars().all()
+    points: dict[uuid.UUID, dict[uuid.UUID, float]] = {}
+    for league_id, agent_id, total in result.all():
+        points.setdefault(league_id, {})[agent_id] = float(total)
+    return {
+        league_id: {
+            agent_id: position
+            for position, agent_id in enumerate(sorted(totals, key=totals.get), start=1)
+        }
+        for league_id, totals in points.items()
+    }
+
+
+async def _seed_waiver_orders(db: AsyncSession, leagues: dict[uuid.UUID, LeagueRosters]) -> None:
+    """Give every league in *leagues* without a waiver order one from its standings.
 
-    processed = 0
-    for claim in claims:
-        # Check if player is still available (optimistic locking)
-        player_on_team = await db.execute(
-            select(TeamPlayer).where(TeamPlayer.player_id == claim.player_id)
+    Each league's rows are written under their own savepoint, so a league
+    another worker seeded first only has its stored order re-read.
+    """
+    unseeded = [lid for lid, league in leagues.items() if not league.order]
+    if not unseeded:
+        return
+    orders = await standings_waiver_orders(db, unseeded)
+    raced = []
+    for lid in unseeded:
+        order = orders.get(lid, {})
+        try:
+            async with db.begin_nested():
+                db.add_all(
+                    WaiverOrder(league_id=lid, agent_id=agent_id, position=position)
+                    for agent_id, position in order.items()
+                )
+        except IntegrityError:
+            raced.append(lid)
+        else:
+            leagues[lid].order = order
+    if raced:
+        await _load_orders(db, raced, leagues)
+
+
+async def _load_rosters(
+    db: AsyncSession, league_ids: list[uuid.UUID]
+) -> dict[uuid.UUID, LeagueRosters]:
+    teams_result = await db.execute(
+        select(
+            LeagueMembership.league_id,
+            LeagueMembership.agent_id,
+            Team.id,
+            League.waiver_type,
+            League.faab_budget - LeagueMembership.faab_spent,
         )
-        if player_on_team.scalar_one_or_none():
-            claim.status = "denied"
-            processed += 1
-            continue
-
-        # Add player to agent's team
-        success = await _add_player_to_team(
-            db, claim.league_id, claim.agent_id, claim.player_id, claim.drop_player_id
+        .join(Team, Team.membership_id == LeagueMembership.id)
+        .join(League, League.id == LeagueMembership.league_id)
+        .where(LeagueMembership.league_id.in_(league_ids))
+    )
+    leagues: dict[uuid.UUID, LeagueRosters] = {}
+    agents_by_team: dict[uuid.UUID, uuid.UUID] = {}
+    for league_id, agent_id, team_id, waiver_type, remaining in teams_result.all():
+        league = leagues.setdefault(league_id, LeagueRosters())
+        if waiver_type == "faab":
+            league.budgets = league.budgets or {}
+            league.budgets[agent_id] = remaining
+        league.teams[agent_id] = team_id
+        league.rosters[agent_id] = set()
+        agents_by_team[team_id] = agent_id
+
+    players_result = await db.execute(
+        select(TeamPlayer.league_id, TeamPlayer.team_id, TeamPlayer.player_id)
+        .where(TeamPlayer.league_id.in_(league_ids))
+    )
+    for league_id, team_id, player_id in players_result.all():
+        league = leagues[league_id]
+        league.rosters[agents_by_team[team_id]].add(player_id)
+        league.owned.add(player_id)
+
+    await _load_orders(db, league_ids, leagues)
+    return leagues
+
+
+async def _load_orders(
+    db: AsyncSession, league_ids: list[uuid.UUID], leagues: dict[uuid.UUID, LeagueRosters]
+) -> None:
+    orders_result = await db.execute(
+        select(WaiverOrder.league_id, WaiverOrder.agent_id, WaiverOrder.position)
+        .where(WaiverOrder.league_id.in_(league_ids))
+    )
+    for league_id, agent_id, position in orders_result.all():
+        if league_id in leagues:
+            leagues[league_id].order[agent_id] = position
+
+
+async def _apply_outcome(db: AsyncSession, league_id: uuid.UUID, outcome: WaiverOutcome) -> bool:
+    """Write one league's resolved claims in a single transaction."""
+    try:
+        updated = 0
+        for status, claim_ids in (("approved", outcome.approved), ("denied", outcome.denied)):
+            if claim_ids:
+                result = await db.execute(
+                    update(WaiverClaim)
+                    .where(and_(WaiverClaim.id.in_(claim_ids), WaiverClaim.status == "pending"))
+                    .values(status=status)
+                )
+                updated += result.rowcount
+        if updated != len(outcome.approved) + len(outcome.denied):
+            raise _ClaimsChanged(league_id)
+
+        for agent_id, amount in outcome.spent.items():
+            await db.execute(
+                update(LeagueMembership)
+                .where(and_(
+                    LeagueMembership.league_id == league_id,
+                    LeagueMembership.agent_id == agent_id,
+                ))
+                .values(faab_spent=LeagueMembership.faab_spent + amount)
+            )
+        for agent_id, position in outcome.moved.items():
+            result = await db.execute(
+                update(WaiverOrder)
+                .where(and_(WaiverOrder.league_id == league_id, WaiverOrder.agent_id == agent_id))
+                .values(position=position)
+            )
+            if not result.rowcount:  # joined after the order was seeded
+                db.add(WaiverOrder(league_id=league_id, agent_id=agent_id, position=position))
+        for team_id, player_id in outcome.drops:
+            await db.execute(
+                delete(TeamPlayer).where(
+                    and_(TeamPlayer.team_id == team_id, TeamPlayer.player_id == player_id)
+                )
+            )
+        db.add_all(
+            TeamPlayer(
+                team_id=team_id,
+                league_id=league_id,
+                player_id=player_id,
+                roster_slot="BN",
+                is_starter=False,
+            )
+            for team_id, player_id in outcome.adds
         )
-        claim.status = "approved" if success else "denied"
-        processed += 1
+        await db.commit()
+    except (_ClaimsChanged, IntegrityError):
+        await db.rollback()
+        logger.warning("Waiver claims for league %s changed during processing; skipped", league_id)
+        return False
 
-    await db.commit()
-    return processed
+    for _, player_id in outcome.drops:
+        player_pool.mark_released(league_id, player_id)
+    for _, player_id in outcome.adds:
+        player_pool.mark_owned(league_id, player_id)
+    rosters.invalidate(league_id)
+    return True
 
 
 async def pickup_free_agent(
@@ -109,10 +450,22 @@ async def pickup_free_agent(
     )
     if waiver_result.scalar_one_or_none():
         raise ValueError("Player is on waivers")
+    if await is_rostered(db, league_id, player_id):
+        raise ValueError(ROSTERED_MESSAGE)
 
     return await _add_player_to_team(db, league_id, agent_id, player_id, drop_player_id)
 
 
+async def is_rostered(db: AsyncSession, league_id: uuid.UUID, player_id: uuid.UUID) -> bool:
+    """Whether a player is on any roster in the league (one unique-index probe)."""
+    result = await db.execute(
+        select(TeamPlayer.id).where(
+            and_(TeamPlayer.league_id == league_id, TeamPlayer.player_id == player_id)
+        )
+    )
+    return result.first() is not None
+
+
 async def _add_player_to_team(
     db: AsyncSession,
     league_id: uuid.UUID,
@@ -137,14 +490,6 @@ async def _add_player_to_team(
 
     # Drop player if specified
     if drop_player_id:
-        await db.execute(
-            select(TeamPlayer).where(
-                and_(
-                    TeamPlayer.team_id == team.id,
-                    TeamPlayer.player_id == drop_player_id,
-                )
-            )
-        )
         drop_result = await db.execute(
             select(TeamPlayer).where(
                 and_(
@@ -156,14 +501,35 @@ async def _add_player_to_team(
         drop_tp = drop_result.scalar_one_or_none()
         if drop_tp:
             await db.delete(drop_tp)
+        else:
+            drop_player_id = None
 
     # Add new player to bench
     db.add(TeamPlayer(
         team_id=team.id,
+        league_id=league_id,
         player_id=player_id,
         roster_slot="BN",
         is_starter=False,
     ))
 
-    await db.commit()
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise ValueError(ROSTERED_MESSAGE)  # another team got there first
+    player_pool.mark_owned(league_id, player_id)
+    if drop_player_id:
+        player_pool.mark_released(league_id, drop_player_id)
+    rosters.invalidate(league_id)
     return True
+
+
+async def run_scheduled_waivers() -> None:
+    """Scheduler entry: process expired claims in a fresh session."""
+    from app.database import async_session
+
+    async with async_session() as db:
+        totals = await process_waivers(db)
+    if totals["leagues"] or totals["skipped"]:
+        logger.info("Processed waivers: %s", totals)
@@ -1,6 +1,6 @@
 const API_BASE = import.meta.env.VITE_API_URL || "https://agenticleague.onrender.com";
 
-async function request(path, options = {}) {
+async function send(path, options = {}) {
   const token = localStorage.getItem("token");
   const agentKey = localStorage.getItem("agentKey");
 
@@ -25,9 +25,27 @@ async function request(path, options = {}) {
     throw new Error(err.detail || "Request failed");
   }
 
+  return res;
+}
+
+async function request(path, options = {}) {
+  const res = await send(path, options);
   return res.json();
 }
 
+// Fetch every page of a cursor-paginated list (X-Next-Cursor response header)
+async function requestAll(path, options = {}) {
+  const items = [];
+  let cursor = null;
+  do {
+    const sep = path.includes("?") ? "&" : "?";
+    const res = await send(cursor ? `${path}${sep}cursor=${encodeURIComponent(cursor)}` : path, options);
+    items.push(...(await res.json()));
+    cursor = res.headers.get("X-Next-Cursor");
+  } while (cursor);
+  return items;
+}
+
 export const api = {
   // Auth
   register: (data) => request("/users/register", { method: "POST", body: JSON.stringify(data) }),
@@ -41,7 +59,7 @@ export const api = {
   // Leagues
   createLeague: (data) => request("/leagues", { method: "POST", body: JSON.stringify(data) }),
   getLeagues: () => request("/leagues"),
-  getPublicLeagues: () => request("/leagues/public"),
+  getPublicLeagues: () => requestAll("/leagues/public?limit=200"),
   getLeague: (id) => request(`/leagues/${id}`),
   joinLeague: (id, data) => request(`/leagues/${id}/join`, { method: "POST", body: JSON.stringify(data) }),
   getStandings: (id) => request(`/leagues/${id}/standings`),
@@ -70,7 +88,7 @@ export const api = {
   getUpcomingSchedule: () => request("/nba/schedule/upcoming"),
 
   // Public matchups
-  getPublicMatchups: () => request("/leagues/public/matchups"),
+  getPublicMatchups: () => requestAll("/leagues/public/matchups?limit=500"),
 
   // Activity
   getActivity: () => request("/activity"),
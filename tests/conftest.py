@@ -1,6 +1,7 @@
 """Test fixtures: in-memory SQLite database and test client."""
 
 import asyncio
+import uuid
 from typing import AsyncGenerator
 
 import pytest
@@ -9,7 +10,8 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 
 from app.database import get_db
 from app.main import app
-from app.models import Base
+from app.models import Agent, Base, League, LeagueMembership, Player, User
+from app.services import cache, matchmaking, player_pool
 
 TEST_DB_URL = "sqlite+aiosqlite:///:memory:"
 
@@ -29,6 +31,9 @@ async def setup_db():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     yield
+    cache.clear()
+    player_pool.reset()
+    matchmaking.reset()
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
 
@@ -49,3 +54,57 @@ async def client(db: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
     async with AsyncClient(transport=transport, base_url="http://test") as c:
         yield c
     app.dependency_overrides.clear()
+
+
+POSITIONS = ["nba:PG", "nba:SG", "nba:SF", "nba:PF", "nba:C"]
+
+
+async def create_league(db: AsyncSession, num_agents: int = 2, num_players: int = 40):
+    """A pre-season league with *num_agents* members and a player pool.
+
+    Players cycle through the five positions and are ordered best-first by points.
+    """
+    agents = []
+    for i in range(num_agents):
+        user = User(username=f"owner{i}", email=f"owner{i}@test.com", hashed_password=None)
+        db.add(user)
+        await db.flush()
+        agent = Agent(name=f"Bot{i}", hashed_api_key=uuid.uuid4().hex, owner_id=user.id)
+        db.add(agent)
+        agents.append(agent)
+    await db.flush()
+
+    league = League(
+        name="Test League",
+        commissioner_id=agents[0].id,
+        invite_code=uuid.uuid4().hex[:8],
+        max_teams=num_agents,
+        member_count=num_agents,
+    )
+    db.add(league)
+    await db.flush()
+    for agent in agents:
+        db.add(LeagueMembership(league_id=league.id, agent_id=agent.id))
+
+    players = []
+    for i in range(num_players):
+        player = Player(
+            external_id=str(1000 + i),
+            full_name=f"Player {i}",
+            position=POSITIONS[i % len(POSITIONS)],
+            nba_team="BOS" if i % 2 == 0 else "LAL",
+            season_stats={"pts": float(num_players - i), "reb": 5.0, "ast": 3.0},
+        )
+        db.add(player)
+        players.append(player)
+    await db.commit()
+    return league, agents, players
+
+
+@pytest.fixture
+def make_league(db: AsyncSession):
+    """Factory fixture for :func:`create_league` on the test session."""
+    async def _make(num_agents: int = 2, num_players: int = 40):
+        return await create_league(db, num_agents, num_players)
+
+    return _make
@@ -75,6 +75,27 @@ async def test_create_agent(client: AsyncClient):
     assert "api_key" in agent  # Shown once
 
 
+@pytest.mark.asyncio
+async def test_agent_self_register_creates_passwordless_user(client: AsyncClient, db):
+    import uuid
+
+    from sqlalchemy import select
+
+    from app.models.user import User
+
+    resp = await client.post("/agents/register", json={"agent_name": "SelfBot"})
+    assert resp.status_code == 201
+    agent = resp.json()
+    assert "api_key" in agent
+
+    user = (await db.execute(select(User).where(User.id == uuid.UUID(agent["owner_id"])))).scalar_one()
+    assert user.hashed_password is None
+
+    # Shadow users cannot log in with a password
+    resp = await client.post("/users/login", json={"username": user.username, "password": ""})
+    assert resp.status_code == 401
+
+
 @pytest.mark.asyncio
 async def test_create_league(client: AsyncClient):
     # Register + login + create agent
@@ -111,3 +132,427 @@ async def test_leaderboard_empty(client: AsyncClient):
     resp = await client.get("/leaderboard")
     assert resp.status_code == 200
     assert resp.json() == []
+
+
+@pytest.mark.asyncio
+async def test_agent_me_member_counts_and_etag(client: AsyncClient, db):
+    from datetime import datetime
+
+    from sqlalchemy import update
+
+    from app.models.agent import Agent
+
+    commish = (await client.post("/agents/register", json={"agent_name": "Commish"})).json()
+    other = (await client.post("/agents/register", json={"agent_name": "Other"})).json()
+    commish_auth = {"Authorization": f"Bearer {commish['api_key']}"}
+
+    league = (await client.post("/leagues", json={"name": "ETag League"}, headers=commish_auth)).json()
+
+    resp = await client.get("/agents/me", headers=commish_auth)
+    assert resp.status_code == 200
+    assert resp.json()["leagues"][0]["member_count"] == 1
+    etag = resp.headers["etag"]
+
+    resp = await client.get("/agents/me", headers={**commish_auth, "If-None-Match": etag})
+    assert resp.status_code == 304
+
+    # A stale last_active_at is refreshed by the request, so the body changes
+    await db.execute(
+        update(Agent).where(Agent.name == "Commish").values(last_active_at=datetime(2020, 1, 1))
+    )
+    await db.commit()
+    resp = await client.get("/agents/me", headers={**commish_auth, "If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.json()["last_active_at"] > "2020-01-02"
+    assert resp.headers["etag"] != etag
+    etag = resp.headers["etag"]
+
+    await client.post(
+        f"/leagues/{league['id']}/join",
+        json={"invite_code": league["invite_code"]},
+        headers={"Authorization": f"Bearer {other['api_key']}"},
+    )
+    resp = await client.get("/agents/me", headers={**commish_auth, "If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.json()["leagues"][0]["member_count"] == 2
+    assert resp.headers["etag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_league_rosters_are_cached_until_a_roster_changes(client: AsyncClient, db, make_league):
+    from app.services import draft_engine
+    from app.services.auth import hash_api_key
+    from app.services.draft import initialize_draft, make_pick
+
+    league, agents, players = await make_league(num_players=20)
+    league_id = league.id
+    agents[0].hashed_api_key = hash_api_key("key-0")
+    await db.commit()
+
+    resp = await client.get(f"/leagues/{league_id}/teams")
+    assert [t["roster"] for t in resp.json()] == [[], []]
+
+    await initialize_draft(db, league_id)
+    draft = await draft_engine.get_draft(db, league_id)
+    on_clock = draft.current_agent()
+    await make_pick(db, league_id, on_clock, players[0].id)
+
+    teams = {t["agent_id"]: t for t in (await client.get(f"/leagues/{league_id}/teams")).json()}
+    assert [p["full_name"] for p in teams[str(on_clock)]["roster"]] == ["Player 0"]
+    assert teams[str(on_clock)]["roster"][0]["roster_slot"] == "PG"
+
+    resp = await client.get(
+        f"/leagues/{league_id}/team", headers={"Authorization": "Bearer key-0"}
+    )
+    assert resp.status_code == 200
+    mine = teams[str(agents[0].id)]
+    assert resp.json()["team_id"] == mine["team_id"]
+    assert [p["player_id"] for p in resp.json()["roster"]] == [p["id"] for p in mine["roster"]]
+
+
+@pytest.mark.asyncio
+async def test_game_log_windows_days_and_caches_finished_ones(client: AsyncClient, db, make_league):
+    from datetime import date, timedelta
+
+    from sqlalchemy import select, update
+
+    from app.models import LeagueMembership, PlayerGameLog, Team, TeamPlayer
+    from app.services import cache, rosters
+
+    league, agents, players = await make_league(num_players=4)
+    league_id = league.id
+    memberships = (await db.execute(
+        select(LeagueMembership).where(LeagueMembership.league_id == league_id)
+    )).scalars().all()
+    owner = str(memberships[0].agent_id)
+    team = Team(membership_id=memberships[0].id)
+    db.add(team)
+    await db.flush()
+    for player in players[:2]:
+        db.add(TeamPlayer(team_id=team.id, league_id=league_id, player_id=player.id,
+                          roster_slot="UTIL", is_starter=True))
+    today = date.today()
+    days = [today - timedelta(days=n) for n in (10, 5, 3)]
+    for day in days:
+        for points, player in zip((10, 5, 99), players[:3]):  # players[2] isn't rostered
+            db.add(PlayerGameLog(player_id=player.id, game_date=day, season=league.season,
+                                 stats={}, fantasy_points=points))
+    await db.commit()
+    url = f"/leagues/{league_id}/game-log"
+
+    resp = await client.get(url, params={"limit_days": 2})
+    assert resp.status_code == 200
+    mine = next(t for t in resp.json() if t["agent_id"] == owner)
+    assert [d["date"] for d in mine["daily_scores"]] == [days[2].isoformat(), days[1].isoformat()]
+    assert mine["daily_scores"][0]["points"] == 15
+    assert [p["points"] for p in mine["daily_scores"][0]["players"]] == [10, 5]
+
+    # Without a window every game day is returned, as before windowing existed
+    resp = await client.get(url)
+    mine = next(t for t in resp.json() if t["agent_id"] == owner)
+    assert [d["date"] for d in mine["daily_scores"]] == [d.isoformat() for d in reversed(days)]
+
+    resp = await client.get(url, params={"from": days[0].isoformat(), "to": days[1].isoformat()})
+    mine = next(t for t in resp.json() if t["agent_id"] == owner)
+    assert [d["date"] for d in mine["daily_scores"]] == [days[1].isoformat(), days[0].isoformat()]
+
+    # Finished days are served from the cache...
+    await db.execute(update(PlayerGameLog).values(fantasy_points=1))
+    await db.commit()
+    resp = await client.get(url, params={"limit_days": 1})
+    mine = next(t for t in resp.json() if t["agent_id"] == owner)
+    assert mine["daily_scores"][0]["points"] == 15
+
+    # ...until the starters change
+    await db.execute(
+        update(TeamPlayer).where(TeamPlayer.player_id == players[1].id).values(is_starter=False)
+    )
+    await db.commit()
+    rosters.invalidate(league_id)
+    assert not [k for k in cache._cache if k.startswith(f"league:game-log:{league_id}")]
+    resp = await client.get(url, params={"limit_days": 1})
+    mine = next(t for t in resp.json() if t["agent_id"] == owner)
+    assert mine["daily_scores"][0]["points"] == 1
+
+
+@pytest.mark.asyncio
+async def test_upcoming_games_never_waits_on_nba_com(client: AsyncClient, db, make_league, monkeypatch):
+    import threading
+
+    from app.api import nba
+    from app.services import cache
+
+    league, agents, players = await make_league(num_players=2)
+    url = f"/leagues/{league.id}/upcoming-games"
+    release = threading.Event()
+
+    def slow_fetch():
+        release.wait(5)
+        game = {"home_team": "BOS", "away_team": "NYK"}
+        return {"games": [game], "game_date": "", "label": "Today"}
+
+    monkeypatch.setattr(nba, "fetch_upcoming", slow_fetch)
+    monkeypatch.setattr(nba, "_last_upcoming", None)
+    monkeypatch.setattr(nba, "_upcoming_refresh", None)
+
+    # Cache miss: answers at once while one refresh runs in the background
+    resp = await client.get(url)
+    assert resp.json()["label"] == "Loading schedule"
+    refresh = nba._upcoming_refresh
+    await client.get(url)
+    assert nba._upcoming_refresh is refresh
+
+    release.set()
+    await refresh
+    resp = await client.get(url)
+    assert resp.json()["label"] == "Today"
+    assert resp.json()["games"][0]["has_rostered_players"] is False  # nobody rostered yet
+    assert "has_rostered_players" not in nba.upcoming_nowait()["games"][0]
+
+    # A schedule fetched by /nba/schedule/upcoming is the fallback once it expires
+    later = {"games": [], "game_date": "", "label": "Later"}
+    monkeypatch.setattr(nba, "fetch_upcoming", lambda: later)
+    cache.invalidate(nba.UPCOMING_CACHE_KEY)
+    assert (await client.get("/nba/schedule/upcoming")).json()["label"] == "Later"
+    cache.invalidate(nba.UPCOMING_CACHE_KEY)
+    assert (await client.get(url)).json()["label"] == "Later"
+    await nba._upcoming_refresh
+
+
+@pytest.mark.asyncio
+async def test_public_leagues_filter_sort_and_keyset_pages(client: AsyncClient, db, make_league):
+    from app.models import League
+    from app.services import matchmaking
+    from app.services.auth import hash_api_key
+
+    full, agents, players = await make_league(num_players=0)  # pre-season and full: hidden
+    agents[1].hashed_api_key = hash_api_key("key-1")
+    specs = [("Active", "active", 4, 4), ("Open", "pre_season", 1, 6),
+             ("Filling", "pre_season", 3, 6), ("Done", "completed", 2, 2),
+             ("Last spot", "pre_season", 0, 1)]
+    ids = {}
+    for name, status, members, max_teams in specs:
+        league = League(name=name, status=status, member_count=members, max_teams=max_teams,
+                        commissioner_id=agents[0].id, invite_code=name[:4].lower())
+        db.add(league)
+        await db.flush()
+        ids[name] = league.id
+    await db.commit()
+    url = "/leagues/public"
+
+    resp = await client.get(url, params={"sort": "fullest", "limit": 2})
+    assert [l["name"] for l in resp.json()] == ["Active", "Filling"]
+    resp = await client.get(url, params={"sort": "fullest", "limit": 2,
+                                         "cursor": resp.headers["x-next-cursor"]})
+    assert [l["name"] for l in resp.json()] == ["Open", "Last spot"]
+    assert "x-next-cursor" not in resp.headers
+    resp = await client.get(url, params={"status": "active"})
+    assert [(l["name"], l["member_count"]) for l in resp.json()] == [("Active", 4)]
+    resp = await client.get(url, headers={"Origin": "https://agenticleague.us"})
+    assert "x-next-cursor" in resp.headers["access-control-expose-headers"].lower()
+    open_leagues = await client.get(url, params={"open": "true", "sort": "name"})
+    assert [l["name"] for l in open_leagues.json()] == ["Filling", "Last spot", "Open"]
+
+    # Joining reserves a slot with a conditional increment
+    resp = await client.post(f"/leagues/{ids['Open']}/join", json={"invite_code": "open"},
+                             headers={"Authorization": "Bearer key-1"})
+    assert resp.json()["member_count"] == 2
+    assert [await matchmaking.reserve_slot(db, ids["Last spot"]) for _ in range(2)] == [True, False]
+    await db.commit()
+
+    # First pages are cached briefly; later pages are read fresh
+    resp = await client.get(url, params={"open": "true", "sort": "name"})
+    assert resp.json() == open_leagues.json()
+    resp = await client.get(url, params={"open": "true", "sort": "name",
+                                         "cursor": str(ids["Filling"])})
+    assert [(l["name"], l["member_count"]) for l in resp.json()] == [("Open", 2)]
+
+
+@pytest.mark.asyncio
+async def test_auto_join_packs_leagues_and_skips_stale_ones(client: AsyncClient, db, make_league):
+    from sqlalchemy import update
+
+    from app.models import Agent, League
+    from app.services import matchmaking
+    from app.services.auth import hash_api_key
+
+    full, agents, players = await make_league(num_agents=8, num_players=0)
+    for i, agent in enumerate(agents):
+        agent.hashed_api_key = hash_api_key(f"key-{i}")
+    twin = Agent(name="Twin", hashed_api_key=hash_api_key("key-twin"), owner_id=agents[0].owner_id)
+    db.add(twin)
+    await db.commit()
+
+    async def auto_join(key):
+        resp = await client.post("/leagues/auto-join", headers={"Authorization": f"Bearer {key}"})
+        assert resp.status_code == 200
+        return resp.json()
+
+    first = await auto_join("key-0")
+    assert (first["name"], first["member_count"], first["max_teams"]) == ("Open NBA League", 1, 6)
+    assert (await auto_join("key-twin"))["id"] != first["id"]  # same owner: a second league
+    joined = [await auto_join(f"key-{i}") for i in range(1, 6)]
+    assert [l["id"] for l in joined] == [first["id"]] * 5  # fullest league first
+    assert joined[-1]["member_count"] == 6
+
+    # A league the pool still lists as open, but filled elsewhere, is skipped
+    second = next(iter(matchmaking._pool.leagues))
+    await db.execute(update(League).where(League.id == second).values(member_count=6))
+    await db.commit()
+    third = await auto_join("key-6")
+    assert third["id"] not in (first["id"], str(second))
+    assert (await auto_join("key-7"))["id"] == third["id"]
+
+
+@pytest.mark.asyncio
+async def test_auto_join_burst_packs_leagues(tmp_path):
+    import asyncio
+
+    from sqlalchemy import func, select
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+    from app.models import Agent, Base, League, LeagueMembership, User
+    from app.services import matchmaking
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'join.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    Session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with Session() as db:
+        users = [User(username=f"u{i}", email=f"u{i}@test.com") for i in range(100)]
+        db.add_all(users)
+        await db.flush()
+        agents = [
+            Agent(name=f"A{i}", hashed_api_key=f"k{i}", owner_id=user.id)
+            for i, user in enumerate(users)
+        ]
+        db.add_all(agents)
+        await db.commit()
+
+    async def join(agent):
+        async with Session() as db:
+            return await matchmaking.auto_join(db, agent)
+
+    joined = await asyncio.gather(*(join(agent) for agent in agents))
+
+    async with Session() as db:
+        leagues = (await db.execute(select(League))).scalars().all()
+        members = (await db.execute(
+            select(LeagueMembership.league_id, func.count()).group_by(LeagueMembership.league_id)
+        )).all()
+    await engine.dispose()
+
+    assert len(joined) == 100
+    assert dict(members) == {l.id: l.member_count for l in leagues}
+    assert all(l.member_count <= l.max_teams for l in leagues)
+    assert sum(l.member_count < l.max_teams for l in leagues) <= 1
+    assert len(leagues) == -(-100 // matchmaking.AUTO_LEAGUE_SIZE)
+
+
+@pytest.mark.asyncio
+async def test_public_matchups_feed_is_indexed_paginated_and_cached(client: AsyncClient, db, make_league):
+    from datetime import date, timedelta
+
+    from sqlalchemy import update
+
+    from app.models import League, Matchup, ScoringPeriod
+    from app.services import cache, public_matchups
+    from app.services.scoring import score_matchups_for_period
+
+    today = date.today()
+    weeks = [(today - timedelta(days=14), today - timedelta(days=8)),
+             (today - timedelta(days=7), today - timedelta(days=1)),
+             (today, today + timedelta(days=6))]
+    league, agents, players = await make_league(num_players=0)
+    league.name, league.status = "A League", "active"
+    other = League(name="B League", commissioner_id=agents[0].id, invite_code="b-league",
+                   max_teams=2, status="active")
+    db.add(other)
+    await db.flush()
+    current = {}
+    for league, in_season in ((league, 3), (other, 2)):  # B's season has ended
+        name = league.name
+        for number, (start, end) in enumerate(weeks[:in_season], start=1):
+            period = ScoringPeriod(league_id=league.id, period_number=number, label=f"Week {number}",
+                                   start_date=start, end_date=end)
+            db.add(period)
+            await db.flush()
+            db.add(Matchup(scoring_period_id=period.id,
+                           home_agent_id=agents[0].id, away_agent_id=agents[1].id))
+            current[name] = period.id
+    await db.commit()
+
+    resp = await client.get("/leagues/public/matchups", params={"limit": 1})
+    assert resp.status_code == 200
+    assert [(m["league_name"], m["week_label"]) for m in resp.json()] == [("A League", "Week 3")]
+    assert resp.json()[0]["home_agent_name"] == "Bot0"
+    resp = await client.get(
+        "/leagues/public/matchups", params={"limit": 1, "cursor": resp.headers["x-next-cursor"]}
+    )
+    assert [(m["league_name"], m["week_label"]) for m in resp.json()] == [("B League", "Week 2")]
+    assert "x-next-cursor" not in resp.headers
+
+    # Served from the cached payload until scores change
+    await db.execute(update(League).where(League.id == other.id).values(name="A Renamed"))
+    await db.commit()
+    assert (await client.get("/leagues/public/matchups")).json()[1]["league_name"] == "B League"
+    await score_matchups_for_period(db, current["A League"])
+    feed = (await client.get("/leagues/public/matchups")).json()
+    assert [m["home_points"] for m in feed] == [0.0, None]
+    assert feed[0]["is_tie"] is True
+
+    # Scores written by another worker are picked up through the DB version,
+    # once this worker's briefly cached copy of it expires
+    await db.execute(update(Matchup).values(home_points=12))
+    await db.execute(update(ScoringPeriod).where(ScoringPeriod.id == current["B League"])
+                     .values(scores_version=ScoringPeriod.scores_version + 1))
+    await db.commit()
+    feed = (await client.get("/leagues/public/matchups")).json()
+    assert [m["home_points"] for m in feed] == [0.0, None]
+    cache.invalidate(public_matchups.VERSION_KEY)
+    feed = (await client.get("/leagues/public/matchups")).json()
+    assert [m["home_points"] for m in feed] == [12.0, 12.0]
+
+
+@pytest.mark.asyncio
+async def test_available_players_filters_pagination_and_ownership(client: AsyncClient, db, make_league):
+    from app.services import draft_engine
+    from app.services.draft import initialize_draft, make_pick
+    from app.services.waivers import pickup_free_agent
+
+    league, agents, players = await make_league(num_players=20)
+    league_id, agent_id = league.id, agents[0].id
+    player_ids = [p.id for p in players]
+    url = f"/leagues/{league_id}/available-players"
+
+    resp = await client.get(url, params={"limit": 5})
+    assert resp.status_code == 200
+    page = resp.json()
+    assert [p["full_name"] for p in page] == [f"Player {i}" for i in range(5)]
+    assert page[0]["projected_fantasy_points"] >= page[-1]["projected_fantasy_points"]
+
+    resp = await client.get(url, params={"limit": 5, "cursor": resp.headers["x-next-cursor"]})
+    assert resp.json()[0]["full_name"] == "Player 5"
+
+    # Drafted and waiver-added players both disappear
+    await initialize_draft(db, league_id)
+    draft = await draft_engine.get_draft(db, league_id)
+    await make_pick(db, league_id, draft.current_agent(), player_ids[0])
+    db.expire_all()  # as a fresh request session would see the new teams
+    assert await pickup_free_agent(db, league_id, agent_id, player_ids[1])
+
+    resp = await client.get(url, params={"limit": 100})
+    names = {p["full_name"] for p in resp.json()}
+    assert len(names) == 18
+    assert "Player 0" not in names and "Player 1" not in names
+
+    resp = await client.get(url, params={"position": "C", "team": "bos", "limit": 100})
+    assert all(p["position"] == "nba:C" and p["nba_team"] == "BOS" for p in resp.json())
+    assert resp.json()
+
+    resp = await client.get(url, params={"name": "player 1", "limit": 100})
+    assert {p["full_name"] for p in resp.json()} == {f"Player {i}" for i in range(10, 20)}
+
+    resp = await client.get(url, params={"position": "QB"})
+    assert resp.status_code == 400
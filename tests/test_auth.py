@@ -7,7 +7,9 @@ from app.services.auth import (
     generate_invite_code,
     hash_api_key,
     hash_password,
+    hash_password_async,
     verify_password,
+    verify_password_async,
 )
 
 
@@ -17,6 +19,17 @@ def test_password_hash_and_verify():
     assert verify_password("wrongpassword", hashed) is False
 
 
+async def test_password_hash_async_roundtrip():
+    hashed = await hash_password_async("mypassword")
+    assert await verify_password_async("mypassword", hashed) is True
+    assert await verify_password_async("wrongpassword", hashed) is False
+
+
+def test_passwordless_user_never_verifies():
+    assert verify_password("", None) is False
+    assert verify_password("anything", "") is False
+
+
 def test_jwt_token_roundtrip():
     token = create_access_token({"sub": "user-123"})
     payload = decode_access_token(token)
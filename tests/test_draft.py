@@ -0,0 +1,761 @@
+"""Tests for the draft service and in-memory draft engine."""
+
+import asyncio
+import uuid
+
+import pytest
+from sqlalchemy import select
+
+from app.models.draft import DraftPick, DraftState
+from app.models.player import Player
+from app.models.team import TeamPlayer
+from app.services import draft_engine
+from app.services.draft import auto_pick_for_current, initialize_draft, make_pick
+from app.services.draft_ranking import build_heap, open_starter_slots, pop_best_fit, rank_players
+
+@pytest.mark.asyncio
+async def test_make_pick_advances_draft(db, make_league):
+    league, agents, players = await make_league()
+    await initialize_draft(db, league.id)
+
+    draft = await draft_engine.get_draft(db, league.id)
+    first = draft.current_agent()
+    pick = await make_pick(db, league.id, first, players[0].id)
+
+    assert pick.pick_number == 1
+    assert pick.round_number == 1
+    assert draft.current_pick == 2
+    assert players[0].id in draft.drafted
+
+    state = (await db.execute(
+        select(DraftState).where(DraftState.league_id == league.id)
+    )).scalar_one()
+    assert state.current_pick == 2
+
+    roster = (await db.execute(select(TeamPlayer))).scalars().all()
+    assert [(tp.player_id, tp.roster_slot) for tp in roster] == [(players[0].id, "PG")]
+
+
+@pytest.mark.asyncio
+async def test_make_pick_rejects_wrong_turn_and_duplicates(db, make_league):
+    league, agents, players = await make_league()
+    await initialize_draft(db, league.id)
+    draft = await draft_engine.get_draft(db, league.id)
+
+    first = draft.current_agent()
+    second = next(a.id for a in agents if a.id != first)
+
+    with pytest.raises(ValueError, match="not your turn"):
+        await make_pick(db, league.id, second, players[0].id)
+
+    await make_pick(db, league.id, first, players[0].id)
+    with pytest.raises(ValueError, match="already drafted"):
+        await make_pick(db, league.id, second, players[0].id)
+
+
+@pytest.mark.asyncio
+async def test_engine_rebuilds_from_draft_picks(db, make_league):
+    league, agents, players = await make_league()
+    await initialize_draft(db, league.id)
+    for _ in range(3):
+        await auto_pick_for_current(db, league.id)
+
+    before = await draft_engine.get_draft(db, league.id)
+    draft_engine.evict(league.id)
+    assert await draft_engine.rebuild_all(db) == 1
+    after = await draft_engine.get_draft(db, league.id)
+
+    assert after is not before
+    assert after.current_pick == before.current_pick == 4
+    assert after.drafted == before.drafted
+    assert after.rosters == before.rosters
+
+
+@pytest.mark.asyncio
+async def test_full_draft_completes_league(db, make_league):
+    league, agents, players = await make_league(num_agents=2, num_players=30)
+    await initialize_draft(db, league.id)
+    draft = await draft_engine.get_draft(db, league.id)
+
+    calls = 0
+    while draft.is_active:
+        await auto_pick_for_current(db, league.id)
+        calls += 1
+
+    # Both agents go on autodraft after two missed picks; the rest chains
+    assert calls < draft.total_picks
+    await db.refresh(league)
+    assert league.status == "active"
+    picks = (await db.execute(select(DraftPick))).scalars().all()
+    assert len(picks) == draft.total_picks
+    assert len({p.player_id for p in picks}) == len(picks)
+
+
+def _ids(n):
+    return [uuid.uuid4() for _ in range(n)]
+
+
+def test_rank_players_rewards_scarce_positions():
+    guards = _ids(6)
+    centers = _ids(2)
+    rows = [(pid, "nba:PG", {"pts": 20.0}) for pid in guards]
+    rows += [(centers[0], "nba:C", {"pts": 15.0}), (centers[1], "nba:C", {"pts": 5.0})]
+    ranking = rank_players(rows, {"pts": 1.0}, num_teams=2)
+
+    # Plenty of 20-point guards, so the 15-point center is worth more over replacement
+    assert ranking.player_ids[0] == centers[0]
+    assert ranking.values[centers[0]] > ranking.values[guards[0]]
+
+
+def test_open_starter_slots_seats_specific_positions_first():
+    open_slots = open_starter_slots(["nba:PG", "nba:PG-nba:SG", "nba:C"])
+    assert "PG" not in open_slots
+    assert "SG" not in open_slots
+    assert "C" not in open_slots
+    assert open_slots.count("UTIL") == 3
+
+
+def test_pop_best_fit_skips_drafted_and_ill_fitting_players():
+    ids = _ids(3)
+    rows = [(ids[0], "nba:PG", {"pts": 30.0}), (ids[1], "nba:PG", {"pts": 20.0}),
+            (ids[2], "nba:C", {"pts": 10.0})]
+    ranking = rank_players(rows, {"pts": 1.0}, num_teams=1)
+    heap = build_heap(ranking, drafted=set())
+
+    # Roster with every starter slot filled except C
+    roster_ids = _ids(9)
+    ranking.positions.update(zip(roster_ids, [
+        "nba:PG", "nba:SG", "nba:SF", "nba:PF", "nba:SG", "nba:SF", "nba:PG", "nba:SG", "nba:SF",
+    ]))
+    assert open_starter_slots([ranking.positions[p] for p in roster_ids]) == ["C"]
+
+    assert pop_best_fit(heap, ranking, {ids[0]}, roster_ids) == ids[2]
+    # The skipped guard stays available; the drafted one is gone for good
+    assert sorted(pid for _, pid in heap) == sorted([ids[1], ids[2]])
+
+
+@pytest.mark.asyncio
+async def test_auto_pick_takes_best_value_not_db_order(db, make_league):
+    league, agents, players = await make_league(num_players=10)
+    star = Player(
+        external_id="9999", full_name="Star", position="nba:C", nba_team="LAL",
+        season_stats={"pts": 40.0, "reb": 12.0, "ast": 8.0},
+    )
+    db.add(star)
+    await db.commit()
+    await initialize_draft(db, league.id)
+
+    pick = await auto_pick_for_current(db, league.id)
+    assert pick.player_id == star.id
+    assert pick.is_auto_pick
+
+
+def test_clock_orders_deadlines_and_skips_superseded_entries():
+    from datetime import datetime, timedelta, timezone
+
+    from app.services.draft_clock import DraftClock
+
+    clock = DraftClock()
+    now = datetime.now(timezone.utc)
+    a, b, c = _ids(3)
+    clock.arm(a, now + timedelta(seconds=30))
+    clock.arm(b, now + timedelta(seconds=10))
+    clock.arm(c, now + timedelta(seconds=20))
+    clock.arm(b, now + timedelta(seconds=40))  # b picked; re-armed for the next agent
+    clock.disarm(c)  # c's draft completed
+
+    assert clock.next_deadline() == (now + timedelta(seconds=30)).timestamp()
+    assert clock.pop_expired((now + timedelta(seconds=35)).timestamp()) == [a]
+    assert clock.pop_expired((now + timedelta(seconds=60)).timestamp()) == [b]
+    assert clock.next_deadline() is None
+
+
+@pytest.mark.asyncio
+async def test_clock_fire_auto_picks_only_after_deadline(db, make_league):
+    from app.services.draft_clock import DraftClock
+    from tests.conftest import TestSession
+
+    league, agents, players = await make_league()
+    league.pick_timeout_seconds = 120
+    await db.commit()
+    await initialize_draft(db, league.id)
+    draft = await draft_engine.get_draft(db, league.id)
+    assert draft.pick_timeout_seconds == 120
+
+    clock = DraftClock(session_factory=TestSession, concurrency=2)
+    result = await clock.fire(league.id)
+    assert result["skipped"]  # timer still running
+    assert draft.current_pick == 1
+
+    result = await clock.fire(league.id, pick_number=2)
+    assert result["skipped"]  # not the pick on the clock
+
+    result = await clock.fire(league.id, pick_number=1)
+    assert result["pick_number"] == 1
+    assert draft.current_pick == 2
+
+
+@pytest.mark.asyncio
+async def test_picks_publish_draft_events(db, make_league):
+    from app.services.draft_events import hub
+
+    league, agents, players = await make_league(num_agents=2, num_players=30)
+    async with hub.subscribe(league.id) as queue:
+        await initialize_draft(db, league.id)
+        draft = await draft_engine.get_draft(db, league.id)
+        event, data = queue.get_nowait()
+        assert event == "on_the_clock"
+        assert data["agent_id"] == draft.current_agent()
+        assert data["deadline"] == draft.pick_deadline
+
+        first = draft.current_agent()
+        await make_pick(db, league.id, first, players[0].id)
+        event, data = queue.get_nowait()
+        assert (event, data["pick_number"], data["agent_id"]) == ("pick_made", 1, first)
+        event, data = queue.get_nowait()
+        assert (event, data["pick_number"]) == ("on_the_clock", 2)
+
+        while draft.is_active:
+            await auto_pick_for_current(db, league.id)
+        events = [queue.get_nowait()[0] for _ in range(queue.qsize())]
+        assert events[-2:] == ["pick_made", "draft_completed"]
+    assert hub.subscriber_count(league.id) == 0
+
+
+@pytest.mark.asyncio
+async def test_event_stream_for_completed_draft(client, db, make_league):
+    league, agents, players = await make_league(num_agents=2, num_players=30)
+    league_id = league.id
+    await initialize_draft(db, league_id)
+    while (draft := await draft_engine.get_draft(db, league_id)).is_active:
+        await auto_pick_for_current(db, league_id)
+
+    resp = await client.get(f"/leagues/{league_id}/draft/events")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/event-stream")
+    assert resp.text.startswith("event: draft_completed\n")
+
+
+@pytest.mark.asyncio
+async def test_wait_for_turns_wakes_when_agent_goes_on_the_clock(db, make_league):
+    from app.services.draft_turns import turns
+
+    league, agents, players = await make_league()
+    await initialize_draft(db, league.id)
+    draft = await draft_engine.get_draft(db, league.id)
+    first = draft.current_agent()
+    second = next(a.id for a in agents if a.id != first)
+
+    [turn] = await turns.wait_for_turns(first, timeout=0)
+    assert (turn.league_id, turn.pick_number) == (league.id, 1)
+    assert await turns.wait_for_turns(second, timeout=0.01) == []
+
+    waiter = asyncio.create_task(turns.wait_for_turns(second, timeout=5))
+    await asyncio.sleep(0)
+    await make_pick(db, league.id, first, players[0].id)
+    [turn] = await asyncio.wait_for(waiter, 1)
+    assert (turn.agent_id, turn.pick_number) == (second, 2)
+    assert turns.turns_for(first) == []
+
+
+@pytest.mark.asyncio
+async def test_draft_turns_endpoint(client, db, make_league):
+    from app.services.auth import hash_api_key
+
+    league, agents, players = await make_league()
+    for i, agent in enumerate(agents):
+        agent.hashed_api_key = hash_api_key(f"key-{i}")
+    await db.commit()
+    league_id = league.id
+    await initialize_draft(db, league_id)
+    draft = await draft_engine.get_draft(db, league_id)
+    on_clock = next(i for i, a in enumerate(agents) if a.id == draft.current_agent())
+
+    resp = await client.get(
+        "/agents/me/draft-turns", headers={"Authorization": f"Bearer key-{on_clock}"}
+    )
+    assert resp.status_code == 200
+    assert resp.json()[0]["league_id"] == str(league_id)
+    assert resp.json()[0]["pick_number"] == 1
+
+    resp = await client.get(
+        "/agents/me/draft-turns",
+        params={"wait": 0.05},
+        headers={"Authorization": f"Bearer key-{1 - on_clock}"},
+    )
+    assert resp.json() == []
+
+
+@pytest.mark.asyncio
+async def test_queued_agents_draft_instantly(db, make_league):
+    from app.services.draft import set_queue
+
+    league, agents, players = await make_league(num_agents=2, num_players=30)
+    league_id = league.id
+    await set_queue(db, league_id, agents[0].id, [p.id for p in players[0::2]])
+    await set_queue(db, league_id, agents[1].id, [p.id for p in players[1::2]])
+
+    state = await initialize_draft(db, league_id)
+
+    assert state.status == "completed"
+    assert draft_engine.peek(league_id) is None
+    picks = (await db.execute(
+        select(DraftPick).where(DraftPick.league_id == league_id).order_by(DraftPick.pick_number)
+    )).scalars().all()
+    assert len(picks) == state.total_picks
+    assert not any(p.is_auto_pick for p in picks)
+    mine = [p.player_id for p in picks if p.agent_id == agents[0].id]
+    assert mine == [p.id for p in players[0::2]][:len(mine)]
+
+
+@pytest.mark.asyncio
+async def test_pick_chains_into_next_agents_queue(db, make_league):
+    from app.services.draft import get_queue, set_queue
+
+    league, agents, players = await make_league(num_agents=2, num_players=30)
+    await initialize_draft(db, league.id)
+    draft = await draft_engine.get_draft(db, league.id)
+    first = draft.current_agent()
+    second = next(a.id for a in agents if a.id != first)
+
+    # players[0] is queued first but gets taken; the queue falls through to players[1]
+    await set_queue(db, league.id, second, [players[0].id, players[1].id])
+    assert draft.current_pick == 1
+
+    pick = await make_pick(db, league.id, first, players[0].id)
+
+    assert pick.pick_number == 1
+    assert draft.current_pick == 3
+    assert draft.rosters[second] == [players[1].id]
+    assert await get_queue(db, league.id, second) == []
+
+    # Uploading a queue while on the clock picks right away
+    on_clock = draft.current_agent()
+    assert await set_queue(db, league.id, on_clock, [players[5].id]) == []
+    assert draft.rosters[on_clock][-1] == players[5].id
+
+
+@pytest.mark.asyncio
+async def test_missed_picks_switch_agent_to_autodraft(db, make_league, monkeypatch):
+    from app.config import settings
+    from app.models.league import LeagueMembership
+
+    monkeypatch.setattr(settings, "draft_autodraft_after_missed_picks", 2)
+    league, agents, players = await make_league(num_agents=3, num_players=60)
+    league_id = league.id
+    await initialize_draft(db, league_id)
+    draft = await draft_engine.get_draft(db, league_id)
+    absent, second, third = draft.order[:3]
+
+    await auto_pick_for_current(db, league_id)  # absent misses pick 1
+    await make_pick(db, league_id, second, players[1].id)
+    await make_pick(db, league_id, third, players[2].id)
+    # Snake turn: pick 4 is third's, then second, then absent misses again at 6
+    await make_pick(db, league_id, third, players[3].id)
+    await make_pick(db, league_id, second, players[4].id)
+    assert absent not in draft.autodraft
+
+    await auto_pick_for_current(db, league_id)
+    assert absent in draft.autodraft
+    # Pick 7 is absent's again (round 3 starts) and was made in the same transaction
+    assert draft.current_pick == 8
+    assert draft.current_agent() == second
+    assert len(draft.rosters[absent]) == 3
+
+    membership = (await db.execute(
+        select(LeagueMembership).where(
+            LeagueMembership.league_id == league_id, LeagueMembership.agent_id == absent
+        )
+    )).scalar_one()
+    assert membership.autodraft
+
+    rebuilt = await draft_engine.load_draft(db, league_id)
+    assert rebuilt.autodraft == {absent}
+
+
+@pytest.mark.asyncio
+async def test_turning_autodraft_off_restarts_missed_picks_after_a_rebuild(
+    db, make_league, monkeypatch
+):
+    from app.config import settings
+    from app.services.draft import set_autodraft
+
+    monkeypatch.setattr(settings, "draft_autodraft_after_missed_picks", 2)
+    league, agents, players = await make_league(num_agents=3, num_players=60)
+    league_id = league.id
+    await initialize_draft(db, league_id)
+    draft = await draft_engine.get_draft(db, league_id)
+    absent, second, third = draft.order[:3]
+
+    # absent misses picks 1 and 6, is switched to autodraft, and 7 chains
+    await auto_pick_for_current(db, league_id)
+    for agent_id, i in ((second, 1), (third, 2), (third, 3), (second, 4)):
+        await make_pick(db, league_id, agent_id, players[i].id)
+    await auto_pick_for_current(db, league_id)
+    assert draft.current_pick == 8
+    await set_autodraft(db, league_id, absent, False)
+
+    # After a restart, one more miss is the first of a new run
+    draft_engine.evict(league_id)
+    draft = await draft_engine.get_draft(db, league_id)
+    assert draft.missed_picks[absent] == 0
+    for agent_id, i in ((second, 10), (third, 11), (third, 12), (second, 13)):
+        await make_pick(db, league_id, agent_id, players[i].id)
+    assert draft.current_agent() == absent
+    await auto_pick_for_current(db, league_id)
+    assert absent not in draft.autodraft
+    assert draft.missed_picks[absent] == 1
+
+
+@pytest.mark.asyncio
+async def test_autodraft_agents_chain_after_a_pick(db, make_league):
+    from app.services.draft import set_autodraft
+
+    league, agents, players = await make_league(num_agents=3, num_players=60)
+    league_id = league.id
+    await initialize_draft(db, league_id)
+    draft = await draft_engine.get_draft(db, league_id)
+    first, second, third = draft.order[:3]
+
+    await set_autodraft(db, league_id, second, True)
+    await set_autodraft(db, league_id, third, True)
+    assert draft.current_pick == 1
+
+    # first's pick chains through picks 2-5 (second, third, third, second)
+    await make_pick(db, league_id, first, players[0].id)
+    assert draft.current_pick == 6
+    assert draft.current_agent() == first
+    picks = (await db.execute(
+        select(DraftPick).where(DraftPick.league_id == league_id).order_by(DraftPick.pick_number)
+    )).scalars().all()
+    assert [p.is_auto_pick for p in picks] == [False, True, True, True, True]
+    assert len({p.player_id for p in picks}) == 5
+
+    await set_autodraft(db, league_id, second, False)
+    await make_pick(db, league_id, first, players[30].id)
+    await make_pick(db, league_id, first, players[31].id)
+    assert draft.current_agent() == second
+
+
+@pytest.mark.asyncio
+async def test_autodraft_endpoint_picks_when_on_the_clock(client, db, make_league):
+    from app.services.auth import hash_api_key
+
+    league, agents, players = await make_league()
+    for i, agent in enumerate(agents):
+        agent.hashed_api_key = hash_api_key(f"key-{i}")
+    await db.commit()
+    league_id = league.id
+    await initialize_draft(db, league_id)
+    draft = await draft_engine.get_draft(db, league_id)
+    on_clock = next(i for i, a in enumerate(agents) if a.id == draft.current_agent())
+
+    resp = await client.put(
+        f"/leagues/{league_id}/draft/autodraft",
+        json={"enabled": True},
+        headers={"Authorization": f"Bearer key-{on_clock}"},
+    )
+    assert resp.status_code == 200
+    assert resp.json()["enabled"] is True
+    assert draft.current_pick == 2
+
+
+@pytest.mark.asyncio
+async def test_stale_worker_resyncs_instead_of_double_picking(db, make_league):
+    import dataclasses
+
+    league, agents, players = await make_league(num_agents=3)
+    league_id = league.id
+    p0, p1 = players[0].id, players[1].id  # failed picks roll back and expire the ORM rows
+    await initialize_draft(db, league_id)
+    draft = await draft_engine.get_draft(db, league_id)
+    first, second = draft.order[:2]
+
+    # A second worker's engine, frozen before the first pick
+    stale = dataclasses.replace(
+        draft,
+        drafted=set(draft.drafted),
+        rosters={a: list(r) for a, r in draft.rosters.items()},
+        missed_picks=dict(draft.missed_picks),
+    )
+    await make_pick(db, league_id, first, p0)
+
+    draft_engine._drafts[league_id] = stale
+    with pytest.raises(ValueError, match="not your turn"):
+        await make_pick(db, league_id, first, p1)
+    assert draft_engine.peek(league_id).current_pick == 2
+
+    draft_engine._drafts[league_id] = stale
+    stale.current_pick, stale.drafted = 2, set()  # right turn, but blind to pick 1
+    with pytest.raises(ValueError, match="already drafted"):
+        await make_pick(db, league_id, second, p0)
+
+    pick = await make_pick(db, league_id, second, p1)
+    assert pick.pick_number == 2
+
+
+@pytest.mark.asyncio
+async def test_stale_worker_accepts_the_rightful_next_pick(db, make_league):
+    import dataclasses
+
+    league, agents, players = await make_league(num_agents=3)
+    league_id = league.id
+    p0, p1 = players[0].id, players[1].id
+    await initialize_draft(db, league_id)
+    draft = await draft_engine.get_draft(db, league_id)
+    first, second = draft.order[:2]
+
+    # Worker A's engine, frozen before pick 1, which worker B then makes
+    stale = dataclasses.replace(
+        draft,
+        drafted=set(draft.drafted),
+        rosters={a: list(r) for a, r in draft.rosters.items()},
+        missed_picks=dict(draft.missed_picks),
+    )
+    await make_pick(db, league_id, first, p0)
+
+    # The agent who owns pick 2 picks through A, which still thinks it's pick 1
+    draft_engine._drafts[league_id] = stale
+    pick = await make_pick(db, league_id, second, p1)
+    assert pick.pick_number == 2
+    assert pick.agent_id == second
+    assert draft_engine.peek(league_id).current_pick == 3
+
+
+@pytest.mark.asyncio
+async def test_stale_worker_picks_up_queue_and_autodraft_changes(client, db, make_league):
+    import dataclasses
+
+    from app.services.draft import set_autodraft, set_queue
+
+    league, agents, players = await make_league(num_agents=3, num_players=60)
+    league_id = league.id
+    p0, p1 = players[0].id, players[1].id
+    await initialize_draft(db, league_id)
+    draft = await draft_engine.get_draft(db, league_id)
+    first, second, third = draft.order[:3]
+
+    # Worker A's engine, frozen before second queues p1 and third turns on autodraft
+    stale = dataclasses.replace(
+        draft,
+        drafted=set(draft.drafted),
+        rosters={a: list(r) for a, r in draft.rosters.items()},
+        queues=dict(draft.queues),
+        autodraft=set(draft.autodraft),
+        missed_picks=dict(draft.missed_picks),
+    )
+    await set_queue(db, league_id, second, [p1])
+    await set_autodraft(db, league_id, third, True)
+    assert draft.prefs_version == stale.prefs_version + 2
+
+    # first's pick through A chains second's queued pick and third's two auto-picks
+    draft_engine._drafts[league_id] = stale
+    pick = await make_pick(db, league_id, first, p0)
+    assert pick.pick_number == 1
+    live = draft_engine.peek(league_id)
+    assert live.current_pick == 5
+    assert live.rosters[second] == [p1]
+    assert len(live.rosters[third]) == 2
+
+    # GET /draft on a worker that missed those picks reports the stored state
+    draft_engine._drafts[league_id] = stale
+    resp = await client.get(f"/leagues/{league_id}/draft")
+    assert resp.status_code == 200
+    assert resp.json()["current_pick"] == 5
+    assert resp.json()["current_agent_id"] == str(second)
+
+
+@pytest.mark.asyncio
+async def test_stale_expired_auto_pick_does_not_take_the_next_pick(db, make_league):
+    import dataclasses
+
+    from app.services.draft import auto_pick_if_expired
+
+    league, agents, players = await make_league(num_agents=2)
+    league_id = league.id
+    p0, p_late = players[0].id, players[-1].id
+    await initialize_draft(db, league_id)
+    draft = await draft_engine.get_draft(db, league_id)
+    first, second = draft.order[:2]
+    assert draft.agent_for(3) == second  # snake: the second agent holds picks 2 and 3
+    await make_pick(db, league_id, first, p0)
+
+    # Another worker's engine, frozen on pick 2, sees that pick expire...
+    stale = dataclasses.replace(
+        draft,
+        drafted=set(draft.drafted),
+        rosters={a: list(r) for a, r in draft.rosters.items()},
+        missed_picks=dict(draft.missed_picks),
+    )
+    # ...after the agent made pick 2 themselves, leaving the best players on the board
+    await make_pick(db, league_id, second, p_late)
+
+    draft_engine._drafts[league_id] = stale
+    assert await auto_pick_if_expired(db, league_id, pick_number=2) is None
+    live = await draft_engine.get_draft(db, league_id)
+    assert live.current_pick == 3
+    assert live.current_agent() == second
+
+
+@pytest.mark.asyncio
+async def test_concurrent_workers_never_double_pick(tmp_path, monkeypatch):
+    import contextvars
+    import random
+
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+    from app.models import Base
+    from tests.conftest import create_league
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'draft.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    Session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    # Each simulated worker gets its own engines, so they go stale as the others pick
+    worker = contextvars.ContextVar("worker", default=None)
+
+    class WorkerEngines(dict):
+        def _own(self) -> dict:
+            return self.setdefault(worker.get(), {})
+
+        def get(self, key, default=None):
+            return self._own().get(key, default)
+
+        def pop(self, key, default=None):
+            return self._own().pop(key, default)
+
+        def __setitem__(self, key, value):
+            self._own()[key] = value
+
+        def values(self):
+            return self._own().values()
+
+    monkeypatch.setattr(draft_engine, "_drafts", WorkerEngines())
+
+    async with Session() as db:
+        league, agents, players = await create_league(db, num_agents=4, num_players=80)
+        league_id = league.id
+        player_ids = [p.id for p in players]
+        await initialize_draft(db, league_id)
+
+    accepted = []
+
+    async def run_worker(seed):
+        worker.set(seed)
+        rng = random.Random(seed)
+        async with Session() as db:
+            for _ in range(1000):  # bounded, so a regression fails instead of hanging
+                draft = await draft_engine.get_draft(db, league_id)  # possibly stale
+                current_pick, draft_status = (await db.execute(
+                    select(DraftState.current_pick, DraftState.status)
+                    .where(DraftState.league_id == league_id)
+                )).one()
+                if draft_status != "in_progress":
+                    return
+                # Whoever is on the clock in the DB picks through this worker
+                available = [p for p in player_ids if p not in draft.drafted]
+                was_stale = draft.current_pick != current_pick
+                try:
+                    pick = await make_pick(
+                        db, league_id, draft.agent_for(current_pick), rng.choice(available)
+                    )
+                except ValueError:
+                    continue
+                finally:
+                    await asyncio.sleep(rng.random() / 20)  # let the other workers in
+                accepted.append((pick.pick_number, was_stale))
+            raise AssertionError("draft did not complete")
+
+    await asyncio.gather(*(run_worker(seed) for seed in range(8)))
+
+    async with Session() as db:
+        state = (await db.execute(
+            select(DraftState).where(DraftState.league_id == league_id)
+        )).scalar_one()
+        picks = (await db.execute(
+            select(DraftPick).order_by(DraftPick.pick_number)
+        )).scalars().all()
+        roster = (await db.execute(select(TeamPlayer))).scalars().all()
+    await engine.dispose()
+
+    assert state.status == "completed"
+    assert state.current_pick == state.total_picks + 1
+    assert [p.pick_number for p in picks] == list(range(1, state.total_picks + 1))
+    assert len({p.player_id for p in picks}) == len(picks)
+    assert len(roster) == len(picks)
+    assert len({number for number, _ in accepted}) == len(accepted)
+    assert any(was_stale for _, was_stale in accepted)  # picks went through stale engines
+
+
+@pytest.mark.asyncio
+async def test_draft_board_grid_and_etag(client, db, make_league):
+    from app.services import cache
+
+    league, agents, players = await make_league(num_agents=2, num_players=30)
+    league_id = league.id
+    names = {a.id: a.name for a in agents}
+    p0, p1, p2 = (players[i].id for i in range(3))
+    await initialize_draft(db, league_id)
+    draft = await draft_engine.get_draft(db, league_id)
+    first, second = draft.order[:2]
+    await make_pick(db, league_id, first, p0)
+    await make_pick(db, league_id, second, p1)
+    await make_pick(db, league_id, second, p2)
+
+    resp = await client.get(f"/leagues/{league_id}/draft/board")
+    assert resp.status_code == 200
+    board = resp.json()
+    assert board["current_pick"] == 4
+    assert [t["agent_id"] for t in board["teams"]] == [str(first), str(second)]
+    assert board["teams"][0]["agent_name"] == names[first]
+    assert len(board["rounds"]) == draft.total_picks // 2
+    assert [c and c["player_id"] for c in board["rounds"][0]] == [str(p0), str(p1)]
+    assert [c and c["player_id"] for c in board["rounds"][1]] == [None, str(p2)]
+    assert board["rounds"][0][0]["player_name"] == "Player 0"
+
+    etag = resp.headers["etag"]
+    resp = await client.get(
+        f"/leagues/{league_id}/draft/board", headers={"If-None-Match": etag}
+    )
+    assert resp.status_code == 304
+
+    await make_pick(db, league_id, first, players[3].id)
+    resp = await client.get(
+        f"/leagues/{league_id}/draft/board", headers={"If-None-Match": etag}
+    )
+    assert resp.status_code == 200
+    assert resp.json()["rounds"][1][0]["pick_number"] == 4
+    assert [k for k in cache._cache if k.startswith("draft:board:")] == [
+        f"draft:board:{league_id}"
+    ]
+
+
+def test_draft_order_formulas_match_expanded_orders():
+    from app.services import draft_order
+
+    a, b, c = _ids(3)
+    assert draft_order.expand([a, b, c], 9, "snake") == [a, b, c, c, b, a, a, b, c]
+    assert draft_order.expand([a, b, c], 6, "linear") == [a, b, c, a, b, c]
+    assert draft_order.expand([a, b, c], 12, "third_round_reversal") == [
+        a, b, c, c, b, a, c, b, a, a, b, c,
+    ]
+    assert draft_order.agent_for_pick([a, b, c], 8, "snake") == b
+    with pytest.raises(ValueError):
+        draft_order.agent_for_pick([a, b, c], 1, "auction")
+
+
+@pytest.mark.asyncio
+async def test_draft_state_stores_only_the_first_round(client, db, make_league):
+    league, agents, players = await make_league(num_agents=3)
+    league_id = league.id
+    state = await initialize_draft(db, league_id)
+    draft = await draft_engine.get_draft(db, league_id)
+
+    assert len(draft.first_round) == 3
+    assert state.draft_order.count(",") == 2
+
+    resp = await client.get(f"/leagues/{league_id}/draft")
+    order = resp.json()["draft_order"]
+    assert len(order) == state.total_picks
+    assert order[:6] == [str(x) for x in draft.first_round + draft.first_round[::-1]]
@@ -53,3 +53,18 @@ def test_default_roster_config():
     assert config["total_roster_size"] == 13
     assert config["bench_slots"] == 3
     assert len(config["starter_slots"]) == 10
+
+
+def test_optimal_lineup_beats_greedy_slotting():
+    import uuid
+
+    from app.services.lineup import LineupPlayer, optimal_lineup
+
+    sg, pg, c = (
+        LineupPlayer(uuid.uuid4(), "nba:SG", 30.0, "BN"),
+        LineupPlayer(uuid.uuid4(), "nba:PG", 25.0, "BN"),
+        LineupPlayer(uuid.uuid4(), "nba:C", 40.0, "BN"),
+    )
+    # Seating the best guard in the first slot that fits (G) would strand the PG
+    lineup = optimal_lineup([sg, pg, c], ["G", "SG", "F"])
+    assert lineup == {sg.player_id: "SG", pg.player_id: "G", c.player_id: "BN"}
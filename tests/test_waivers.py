@@ -0,0 +1,370 @@
+"""Tests for waiver processing."""
+
+import random
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import select, update
+
+from app.models.league import League, LeagueMembership
+from app.models.team import Team, TeamPlayer
+from app.models.waiver import WaiverClaim, WaiverOrder
+from app.services.waivers import LeagueRosters, process_waivers, resolve_claims
+
+
+def _claim(agent_id, player_id, drop_player_id=None, bid=None, group=None):
+    return SimpleNamespace(
+        id=uuid.uuid4(), agent_id=agent_id, player_id=player_id, drop_player_id=drop_player_id,
+        bid_amount=bid, claim_group=group, created_at=datetime.now(timezone.utc),
+    )
+
+
+def test_resolve_claims_moves_each_winner_to_the_back():
+    a, b, stranger = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    team_a, team_b = uuid.uuid4(), uuid.uuid4()
+    x, y, z, kept = uuid.uuid4(), uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    league = LeagueRosters(
+        teams={a: team_a, b: team_b},
+        rosters={a: {kept}, b: set()},
+        owned={kept},
+        order={a: 1, b: 2},
+    )
+    claims = [
+        _claim(a, x),
+        _claim(a, y, drop_player_id=kept),
+        _claim(b, z),  # b's turn comes before a's second claim
+        _claim(b, kept),  # freed by a's drop earlier in the batch
+        _claim(stranger, uuid.uuid4()),  # no team in this league
+    ]
+
+    outcome = resolve_claims(claims, league)
+
+    assert outcome.approved == [claims[0].id, claims[2].id, claims[1].id, claims[3].id]
+    assert outcome.denied == [claims[4].id]
+    assert list(outcome.adds) == [(team_a, x), (team_b, z), (team_a, y), (team_b, kept)]
+    assert outcome.drops == {(team_a, kept)}
+    assert league.rosters == {a: {x, y}, b: {z, kept}}
+    assert outcome.moved == {a: 5, b: 6}
+
+
+def test_resolve_faab_claims_by_bid_with_budgets_and_groups():
+    a, b = uuid.uuid4(), uuid.uuid4()
+    v, w, x, y, z = (uuid.uuid4() for _ in range(5))
+    claims = [
+        _claim(a, x, bid=40),  # ties b's bid, loses on waiver order
+        _claim(b, x, bid=40),
+        _claim(a, y, bid=30, group="wing"),
+        _claim(a, z, bid=20, group="wing"),  # a already won y from this group
+        _claim(b, w, bid=15),  # b has only 10 left
+        _claim(b, v, bid=10),
+    ]
+
+    def fresh():
+        return LeagueRosters(
+            teams={a: uuid.uuid4(), b: uuid.uuid4()},
+            order={a: 2, b: 1},
+            budgets={a: 50, b: 50},
+        )
+
+    league = fresh()
+    outcome = resolve_claims(claims, league)
+
+    assert outcome.approved == [claims[1].id, claims[2].id, claims[5].id]
+    assert set(outcome.denied) == {claims[0].id, claims[3].id, claims[4].id}
+    assert outcome.spent == {b: 50, a: 30}
+    assert league.budgets == {a: 20, b: 0}
+
+    # Deterministic: any input order replays to the same result
+    for _ in range(5):
+        replay = resolve_claims(random.sample(claims, len(claims)), fresh())
+        assert replay.approved == outcome.approved
+        assert replay.spent == outcome.spent
+
+
+async def _league_with_teams(db, make_league):
+    league, agents, players = await make_league(num_players=10)
+    memberships = (await db.execute(
+        select(LeagueMembership).where(LeagueMembership.league_id == league.id)
+    )).scalars().all()
+    teams = {}
+    for m in memberships:
+        team = Team(membership_id=m.id)
+        db.add(team)
+        teams[m.agent_id] = team
+    await db.commit()
+    return league, agents, players, teams
+
+
+@pytest.mark.asyncio
+async def test_process_waivers_applies_a_league_in_one_pass(db, make_league):
+    league, agents, players, teams = await _league_with_teams(db, make_league)
+    a, b = agents[0].id, agents[1].id
+    p = [pl.id for pl in players]
+    db.add(TeamPlayer(
+        team_id=teams[a].id, league_id=league.id, player_id=p[0],
+        roster_slot="BN", is_starter=False,
+    ))
+    db.add_all([
+        WaiverOrder(league_id=league.id, agent_id=b, position=1),
+        WaiverOrder(league_id=league.id, agent_id=a, position=2),
+    ])
+    expired = datetime.now(timezone.utc) - timedelta(minutes=1)
+    for agent_id, player_id, drop in [(b, p[1], None), (a, p[1], p[0]), (a, p[2], p[0])]:
+        db.add(WaiverClaim(
+            league_id=league.id, agent_id=agent_id, player_id=player_id,
+            drop_player_id=drop, waiver_expires_at=expired,
+        ))
+    # Not expired yet: left alone
+    db.add(WaiverClaim(
+        league_id=league.id, agent_id=b, player_id=p[3],
+        waiver_expires_at=datetime.now(timezone.utc) + timedelta(hours=1),
+    ))
+    await db.commit()
+
+    totals = await process_waivers(db)
+
+    assert totals == {"leagues": 1, "approved": 2, "denied": 1, "skipped": 0}
+    statuses = dict((await db.execute(
+        select(WaiverClaim.player_id, WaiverClaim.status)
+        .where(WaiverClaim.agent_id == a)
+    )).all())
+    assert statuses == {p[1]: "denied", p[2]: "approved"}
+    rosters = (await db.execute(select(TeamPlayer.team_id, TeamPlayer.player_id))).all()
+    assert set(rosters) == {(teams[a].id, p[2]), (teams[b].id, p[1])}
+
+    order = dict((await db.execute(select(WaiverOrder.agent_id, WaiverOrder.position))).all())
+    assert order == {b: 3, a: 4}
+
+    # A second run finds nothing left to do
+    assert (await process_waivers(db))["leagues"] == 0
+
+
+@pytest.mark.asyncio
+async def test_faab_claims_charge_the_winning_bid(db, make_league):
+    from app.services.waivers import create_waiver_claim
+
+    league, agents, players, teams = await _league_with_teams(db, make_league)
+    league_id, a, b = league.id, agents[0].id, agents[1].id
+    p = [pl.id for pl in players]
+    league.waiver_type = "faab"
+    league.faab_budget = 50
+    await db.commit()
+
+    with pytest.raises(ValueError, match="remaining FAAB budget"):
+        await create_waiver_claim(db, league_id, a, p[0], bid_amount=51)
+    await create_waiver_claim(db, league_id, a, p[0], bid_amount=20)
+    await create_waiver_claim(db, league_id, b, p[0], bid_amount=35)
+    await create_waiver_claim(db, league_id, a, p[1], bid_amount=25)
+    await db.execute(update(WaiverClaim).values(
+        waiver_expires_at=datetime.now(timezone.utc) - timedelta(minutes=1)
+    ))
+    await db.commit()
+
+    totals = await process_waivers(db)
+
+    assert totals == {"leagues": 1, "approved": 2, "denied": 1, "skipped": 0}
+    spent = dict((await db.execute(
+        select(LeagueMembership.agent_id, LeagueMembership.faab_spent)
+        .where(LeagueMembership.league_id == league_id)
+    )).all())
+    assert spent == {a: 25, b: 35}
+
+
+@pytest.mark.asyncio
+async def test_process_waivers_job(client, db, make_league):
+    league, agents, players, teams = await _league_with_teams(db, make_league)
+    league_id, a = league.id, agents[0].id
+    db.add(WaiverClaim(
+        league_id=league_id, agent_id=a, player_id=players[0].id,
+        waiver_expires_at=datetime.now(timezone.utc) - timedelta(minutes=1),
+    ))
+    await db.commit()
+
+    resp = await client.post("/jobs/process-waivers")
+    assert resp.status_code == 200
+    assert resp.json()["status"] == "completed"
+    assert resp.json()["approved"] == 1
+
+    # The order was seeded from the standings, and the winner went to the back
+    order = (await db.execute(
+        select(WaiverOrder.agent_id, WaiverOrder.position)
+        .where(WaiverOrder.league_id == league_id)
+        .order_by(WaiverOrder.position)
+    )).all()
+    assert len(order) == 2
+    assert order[-1] == (a, 3)
+
+
+@pytest.mark.asyncio
+async def test_a_raced_waiver_order_seed_only_affects_its_league(db, make_league, monkeypatch):
+    from app.models.player import PlayerGameLog
+    from app.services import waivers
+
+    league, agents, players, teams = await _league_with_teams(db, make_league)
+    a, b = agents[0].id, agents[1].id
+    # b's starter has scored, so a is worse and is seeded first in line
+    db.add(TeamPlayer(
+        team_id=teams[b].id, league_id=league.id, player_id=players[0].id,
+        roster_slot="PG", is_starter=True,
+    ))
+    db.add(PlayerGameLog(
+        player_id=players[0].id, game_date=datetime(2025, 11, 1).date(),
+        season=league.season, stats={}, fantasy_points=30.0,
+    ))
+    other = League(name="Other", commissioner_id=a, invite_code=uuid.uuid4().hex[:8])
+    db.add(other)
+    await db.flush()
+    for agent_id in (a, b):
+        membership = LeagueMembership(league_id=other.id, agent_id=agent_id)
+        db.add(membership)
+        await db.flush()
+        db.add(Team(membership_id=membership.id))
+    expired = datetime.now(timezone.utc) - timedelta(minutes=1)
+    for league_id, player in ((league.id, players[1]), (other.id, players[2])):
+        db.add(WaiverClaim(
+            league_id=league_id, agent_id=b, player_id=player.id, waiver_expires_at=expired,
+        ))
+    await db.commit()
+    league_id, other_id = league.id, other.id
+
+    seed = waivers.standings_waiver_orders
+
+    async def seed_while_another_worker_seeds_other(db, league_ids):
+        orders = await seed(db, league_ids)
+        db.add(WaiverOrder(league_id=other_id, agent_id=b, position=1))
+        await db.flush()
+        return orders
+
+    monkeypatch.setattr(waivers, "standings_waiver_orders", seed_while_another_worker_seeds_other)
+    totals = await process_waivers(db)
+
+    assert totals == {"leagues": 2, "approved": 2, "denied": 0, "skipped": 0}
+    orders = (await db.execute(
+        select(WaiverOrder.league_id, WaiverOrder.agent_id, WaiverOrder.position)
+    )).all()
+    # The seeded league kept its order; the raced one used the other worker's
+    assert set(orders) == {(league_id, a, 1), (league_id, b, 3), (other_id, b, 2)}
+
+
+@pytest.mark.asyncio
+async def test_ownership_is_checked_per_league(db, make_league):
+    from app.services.waivers import create_waiver_claim, is_rostered, pickup_free_agent
+
+    league, agents, players, teams = await _league_with_teams(db, make_league)
+    league_id, a, b = league.id, agents[0].id, agents[1].id
+    player_id = players[0].id
+    assert await pickup_free_agent(db, league_id, a, player_id)
+    assert await is_rostered(db, league_id, player_id)
+
+    db.expire_all()
+    with pytest.raises(ValueError, match="already on a roster"):
+        await pickup_free_agent(db, league_id, b, player_id)
+    with pytest.raises(ValueError, match="already on a roster"):
+        await create_waiver_claim(db, league_id, b, player_id)
+
+    # The same player is still free in another league
+    other = League(name="Other", commissioner_id=b, invite_code=uuid.uuid4().hex[:8])
+    db.add(other)
+    await db.flush()
+    membership = LeagueMembership(league_id=other.id, agent_id=b)
+    db.add(membership)
+    await db.flush()
+    db.add(Team(membership_id=membership.id))
+    await db.commit()
+    other_id = other.id
+    db.expire_all()
+    assert not await is_rostered(db, other_id, player_id)
+    assert await pickup_free_agent(db, other_id, b, player_id)
+
+
+@pytest.mark.asyncio
+async def test_roster_transactions_apply_atomically(client, db, make_league):
+    from app.models.activity_log import ActivityLog
+    from app.services.auth import hash_api_key
+
+    league, agents, players, teams = await _league_with_teams(db, make_league)
+    league_id, a, b = league.id, agents[0].id, agents[1].id
+    p = [pl.id for pl in players]  # positions cycle PG, SG, SF, PF, C
+    db.add_all([
+        TeamPlayer(team_id=teams[a].id, league_id=league_id, player_id=p[0],
+                   roster_slot="PG", is_starter=True),
+        TeamPlayer(team_id=teams[a].id, league_id=league_id, player_id=p[1],
+                   roster_slot="BN", is_starter=False),
+        TeamPlayer(team_id=teams[b].id, league_id=league_id, player_id=p[2],
+                   roster_slot="BN", is_starter=False),
+    ])
+    agents[0].hashed_api_key = hash_api_key("key-a")
+    await db.commit()
+    team_a = teams[a].id
+    headers = {"Authorization": "Bearer key-a"}
+    url = f"/leagues/{league_id}/transactions"
+
+    # Any invalid move rejects the whole batch
+    for moves, error in [
+        ([{"type": "drop", "player_id": str(p[0])},
+          {"type": "add", "player_id": str(p[2])}], "Move 2: Player is already on a roster"),
+        ([{"type": "lineup", "player_id": str(p[1]), "roster_slot": "C"}], "not eligible at C"),
+        ([{"type": "add", "player_id": str(p[5])},
+          {"type": "lineup", "player_id": str(p[5]), "roster_slot": "PG"}], "Too many players at PG"),
+    ]:
+        resp = await client.post(url, json={"moves": moves}, headers=headers)
+        assert resp.status_code == 409
+        assert error in resp.json()["error"]
+
+    resp = await client.post(url, json={"moves": [
+        {"type": "drop", "player_id": str(p[0])},
+        {"type": "add", "player_id": str(p[5])},
+        {"type": "lineup", "player_id": str(p[5]), "roster_slot": "PG"},
+        {"type": "lineup", "player_id": str(p[1]), "roster_slot": "G"},
+    ]}, headers=headers)
+    assert resp.status_code == 200
+    assert resp.json()["applied"] == 4
+
+    db.expire_all()
+    rows = (await db.execute(
+        select(TeamPlayer.player_id, TeamPlayer.roster_slot, TeamPlayer.is_starter)
+        .where(TeamPlayer.team_id == team_a)
+    )).all()
+    assert set(rows) == {(p[5], "PG", True), (p[1], "G", True)}
+    actions = (await db.execute(
+        select(ActivityLog.action).where(ActivityLog.agent_id == a)
+    )).scalars().all()
+    assert sorted(actions) == ["drop", "free_agent_pickup", "lineup", "lineup"]
+
+
+@pytest.mark.asyncio
+async def test_nightly_lineups_only_touch_auto_managed_teams(db, make_league):
+    from app.services.lineup import optimize_auto_lineups
+
+    league, agents, players, teams = await _league_with_teams(db, make_league)
+    league_id, a, b = league.id, agents[0].id, agents[1].id
+    p = [pl.id for pl in players]  # positions cycle PG, SG, SF, PF, C
+    for i in range(5):
+        players[i].season_stats = {"pts": 10 + i}
+    for agent_id in (a, b):
+        db.add_all(
+            TeamPlayer(team_id=teams[agent_id].id, league_id=league_id, player_id=pid,
+                       roster_slot="BN", is_starter=False)
+            for pid in (p[:5] if agent_id == a else p[5:10])
+        )
+    league.status = "active"
+    await db.execute(
+        update(LeagueMembership).where(LeagueMembership.agent_id == a).values(auto_lineup=True)
+    )
+    await db.commit()
+    team_a, team_b = teams[a].id, teams[b].id
+
+    assert await optimize_auto_lineups(db) == {"teams": 1, "changed": 5}
+
+    slots = dict((await db.execute(
+        select(TeamPlayer.player_id, TeamPlayer.roster_slot).where(TeamPlayer.team_id == team_a)
+    )).all())
+    assert slots == {p[0]: "PG", p[1]: "SG", p[2]: "SF", p[3]: "PF", p[4]: "C"}
+    benched = (await db.execute(
+        select(TeamPlayer.roster_slot).where(TeamPlayer.team_id == team_b)
+    )).scalars().all()
+    assert set(benched) == {"BN"}
+    # Already optimal: nothing left to change
+    assert (await optimize_auto_lineups(db))["changed"] == 0